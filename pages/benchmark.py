@@ -0,0 +1,215 @@
+import streamlit as st
+import pandas as pd
+from utils.sidebar.navigation import navigate
+from utils.sidebar.helper import update_side_bar_labels
+from utils.collections.data import list_all_collections, get_tenant_names
+from utils.cluster.collection import fetch_collection_config
+from utils.cluster.memory import get_vector_dimensions, sample_vector_dimensions
+from utils.benchmark.recall import tune_ef
+from utils.benchmark.ingest import BATCH_MODES, run_ingest_benchmark
+from utils.benchmark.query import WORKLOADS, get_benchmark_collection, run_benchmark, save_benchmark_results, load_benchmark_results
+
+def select_collection_and_tenant(key_prefix):
+	client = st.session_state.client
+	if "collections_list" not in st.session_state:
+		collections = list_all_collections(client)
+		if not isinstance(collections, list):
+			collections = list(collections.keys())
+		collections.sort()
+		st.session_state.collections_list = collections
+
+	selected_collection = st.selectbox("Select a Collection", st.session_state.collections_list, key=f"{key_prefix}_collection")
+	tenant_names = get_tenant_names(client, selected_collection, st.session_state.cluster_endpoint, st.session_state.cluster_api_key)
+	selected_tenant = None
+	if tenant_names:
+		selected_tenant = st.selectbox("Select a Tenant", sorted(tenant_names), key=f"{key_prefix}_tenant")
+	return selected_collection, selected_tenant
+
+def query_benchmark():
+	st.markdown("#### Query Latency Benchmark")
+	selected_collection, selected_tenant = select_collection_and_tenant("query_benchmark")
+
+	col1, col2 = st.columns(2)
+	with col1:
+		workloads = st.multiselect("Workloads", WORKLOADS, default=["fetch_objects", "near_vector", "bm25"], key="benchmark_workloads")
+		concurrency_levels = st.multiselect("Concurrency levels", [1, 2, 4, 8, 16, 32, 64], default=[1, 4, 16], key="benchmark_concurrency")
+		requests_count = st.number_input("Requests per workload and level", min_value=10, max_value=100000, value=200, key="benchmark_requests")
+	with col2:
+		limit = st.number_input("Query limit", min_value=1, max_value=10000, value=10, key="benchmark_limit")
+		sample_size = st.number_input("Objects sampled for query inputs", min_value=1, max_value=10000, value=100, key="benchmark_sample_size")
+		filter_property = st.text_input("Filter property (filtered workload)", key="benchmark_filter_property").strip() or None
+		vector_name = st.text_input("Named vector (optional)", key="benchmark_vector_name").strip() or None
+	label = st.text_input("Run label (saved with the results)", key="benchmark_label")
+
+	st.warning("Benchmarks put real load on the cluster. Avoid running them against production during peak hours.")
+	if st.button("Run Benchmark", type="primary", use_container_width=True):
+		if not workloads or not concurrency_levels:
+			st.error("Please select at least one workload and one concurrency level")
+			return
+		collection = get_benchmark_collection(st.session_state.client, selected_collection, selected_tenant)
+		progress_bar = st.progress(0.0)
+		try:
+			results = run_benchmark(
+				collection,
+				workloads,
+				sorted(concurrency_levels),
+				requests_count=int(requests_count),
+				limit=int(limit),
+				sample_size=int(sample_size),
+				filter_property=filter_property,
+				vector_name=vector_name,
+				progress_callback=lambda done, total: progress_bar.progress(done / total)
+			)
+		except Exception as e:
+			st.error(f"Benchmark failed: {e}")
+			return
+		run_id = save_benchmark_results(results, selected_collection, selected_tenant, st.session_state.get("server_version"), label)
+		st.success(f"Benchmark run `{run_id}` saved.")
+		st.dataframe(pd.DataFrame(results).astype(str), use_container_width=True)
+
+def ingest_benchmark():
+	st.markdown("#### Ingest Throughput Benchmark")
+	st.markdown("###### Creates a scratch collection matching the selected collection's config, imports synthetic vectors and properties, measures throughput and the resulting vector queue backlog, then deletes it.")
+	selected_collection, selected_tenant = select_collection_and_tenant("ingest_benchmark")
+
+	col1, col2 = st.columns(2)
+	with col1:
+		modes = st.multiselect("Batching modes", BATCH_MODES, default=["fixed", "dynamic"], key="ingest_modes")
+		batch_sizes = st.multiselect("Fixed batch sizes", [50, 100, 200, 500, 1000, 2000], default=[100, 500], key="ingest_batch_sizes")
+	with col2:
+		object_count = st.number_input("Objects per run", min_value=100, max_value=1_000_000, value=10000, key="ingest_object_count")
+		requests_per_minute = st.number_input("Rate limit (requests per minute)", min_value=1, value=600, key="ingest_rpm")
+		dimensions_override = st.number_input("Vector dimensions (0 = detect)", min_value=0, max_value=65536, value=0, key="ingest_dimensions")
+
+	st.warning("⬇️ This operation creates and deletes a collection and requires administrator privileges.")
+	if st.button("Run Ingest Benchmark", type="primary", use_container_width=True):
+		config = fetch_collection_config(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, selected_collection)
+		if "error" in config:
+			st.error(config["error"])
+			return
+		if dimensions_override:
+			dimensions = {name: int(dimensions_override) for name in (config.get("vectorConfig") or {"default": None})}
+		else:
+			dimensions = sample_vector_dimensions(st.session_state.client, selected_collection, selected_tenant) or get_vector_dimensions(config)
+		if not any(dimensions.values()):
+			st.error("Could not detect the vector dimensions. Please set them explicitly.")
+			return
+
+		runs = [("fixed", size) for size in sorted(batch_sizes) if "fixed" in modes]
+		runs += [(mode, None) for mode in modes if mode != "fixed"]
+		if not runs:
+			st.error("Please select at least one batching mode (and a batch size for fixed batching)")
+			return
+		progress_bar = st.progress(0.0)
+		with st.spinner("Running ingest benchmark..."):
+			results = run_ingest_benchmark(
+				st.session_state.client,
+				st.session_state.cluster_endpoint,
+				st.session_state.cluster_api_key,
+				config,
+				dimensions,
+				runs,
+				object_count=int(object_count),
+				requests_per_minute=int(requests_per_minute),
+				progress_callback=lambda done, total: progress_bar.progress(done / total)
+			)
+		failed_runs = [result for result in results if result.get("error")]
+		if failed_runs:
+			st.error(f"{len(failed_runs)} of {len(runs)} run(s) failed, see the error column.")
+		st.markdown(f"###### Vector dimensions: **{dimensions}**")
+		results_df = pd.DataFrame(results)
+		# The client batchers send in the background, their batch latency cannot be measured
+		background = (results_df["mode"] != "fixed") & (results_df["error"] == "")
+		for column in ["batch_p50_ms", "batch_p95_ms"]:
+			if column in results_df:
+				results_df[column] = results_df[column].astype(object)
+				results_df.loc[background, column] = "n/a (background batching)"
+		st.dataframe(results_df.astype(str), use_container_width=True)
+
+def ef_tuning():
+	st.markdown("#### HNSW ef Tuning (Recall vs Latency)")
+	st.markdown("###### Samples vectors with the cursor API, computes the exact top-k locally (excluding each query's own object) and runs near_vector queries at each ef value. On a sampled corpus, recall is measured among the results that fall inside the sample. Only the collection's ef is changed, for the duration of the run and restored afterwards.")
+	selected_collection, selected_tenant = select_collection_and_tenant("ef_tuning")
+
+	col1, col2 = st.columns(2)
+	with col1:
+		ef_values = st.multiselect("ef values", [16, 32, 64, 128, 256, 512, 1024], default=[32, 64, 128, 256], key="ef_tuning_values")
+		k = st.number_input("k (recall@k)", min_value=1, max_value=1000, value=10, key="ef_tuning_k")
+		query_count = st.number_input("Query vectors", min_value=1, max_value=10000, value=100, key="ef_tuning_queries")
+	with col2:
+		corpus_size = st.number_input("Corpus sample size", min_value=100, max_value=1_000_000, value=50000, key="ef_tuning_corpus")
+		vector_name = st.text_input("Named vector (optional)", key="ef_tuning_vector_name").strip() or None
+
+	st.warning("⬇️ This operation updates the collection's vector index config (ef) while it runs and requires administrator privileges.")
+	if st.button("Run ef Tuning", type="primary", use_container_width=True):
+		if not ef_values:
+			st.error("Please select at least one ef value")
+			return
+		config = fetch_collection_config(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, selected_collection)
+		if "error" in config:
+			st.error(config["error"])
+			return
+		progress_bar = st.progress(0.0)
+		try:
+			with st.spinner("Sampling vectors and running queries..."):
+				tuning = tune_ef(
+					st.session_state.client,
+					st.session_state.cluster_endpoint,
+					st.session_state.cluster_api_key,
+					config,
+					selected_collection,
+					sorted(ef_values),
+					k=int(k),
+					query_count=int(query_count),
+					corpus_size=int(corpus_size),
+					tenant_name=selected_tenant,
+					vector_name=vector_name,
+					progress_callback=lambda done, total: progress_bar.progress(done / total)
+				)
+		except Exception as e:
+			st.error(f"ef tuning failed: {e}")
+			return
+		st.session_state["ef_tuning_result"] = tuning
+
+	tuning = st.session_state.get("ef_tuning_result")
+	if tuning:
+		scope = "exact (corpus covers the collection)" if tuning["exact"] else "estimated on a sample"
+		st.markdown(f"###### Distance: **{tuning['distance']}** | Corpus: **{tuning['corpus_size']} of {tuning['total_count']}** objects | Recall: **{scope}** | Original ef restored: **{tuning['original_ef']}**")
+		results = tuning["results"]
+		st.scatter_chart(results, x="p95_ms", y="recall", use_container_width=True)
+		st.line_chart(results.set_index("ef")[["recall"]], use_container_width=True)
+		st.dataframe(results, use_container_width=True)
+
+def compare_runs():
+	st.markdown("#### Compare Runs")
+	history = load_benchmark_results()
+	if history.empty:
+		st.info("No saved benchmark runs yet.")
+		return
+	runs = history.drop_duplicates("run_id")[["run_id", "timestamp", "label", "server_version", "collection", "tenant"]]
+	run_labels = {row.run_id: f"{row.timestamp} | {row.run_id} | {row.collection} | v{row.server_version} {row.label or ''}" for row in runs.itertuples()}
+	selected_runs = st.multiselect("Runs", list(run_labels.keys())[::-1], format_func=run_labels.get, key="benchmark_compare_runs")
+	metric = st.selectbox("Metric", ["p50_ms", "p95_ms", "p99_ms", "qps", "error_rate"], index=1, key="benchmark_compare_metric")
+	if selected_runs:
+		selected = history[history["run_id"].isin(selected_runs)]
+		comparison = selected.pivot_table(index=["workload", "concurrency"], columns="run_id", values=metric, aggfunc="first")
+		st.dataframe(comparison, use_container_width=True)
+
+def main():
+	st.title("Benchmark ⏱️")
+	navigate()
+
+	if st.session_state.get("client_ready"):
+		update_side_bar_labels()
+		query_benchmark()
+		st.markdown("---")
+		ingest_benchmark()
+		st.markdown("---")
+		ef_tuning()
+		st.markdown("---")
+		compare_runs()
+	else:
+		st.warning("Please Establish a connection to Weaviate in Cluster page!")
+
+if __name__ == "__main__":
+	main()
@@ -1,7 +1,10 @@
 import streamlit as st
+import pandas as pd
 from utils.sidebar.navigation import navigate
 from utils.sidebar.helper import update_side_bar_labels
 from utils.collections.data import list_all_collections, get_tenant_names, fetch_collection_data
+from utils.collections.profile import run_sampling_profile
+from utils.collections.vectors import stream_vector_batches, analyze_vectors, norm_histogram
 
 def get_all_objects_of_collections_and_tenants():
 	client = st.session_state.client
@@ -33,7 +36,7 @@ def get_all_objects_of_collections_and_tenants():
 	)
 
 	# Get and sort tenant names
-	tenant_names = get_tenant_names(client, selected_collection)
+	tenant_names = get_tenant_names(client, selected_collection, st.session_state.cluster_endpoint, st.session_state.cluster_api_key)
 	if tenant_names:
 		tenant_names = sorted(tenant_names)
 
@@ -153,13 +156,100 @@ def get_all_objects_of_collections_and_tenants():
 			else:
 				st.warning("No data found")
 
+	return selected_collection, selected_tenant
+
+def sampling_profile(selected_collection, selected_tenant):
+	st.markdown("#### Sampling Profile")
+	st.markdown("###### Profiles a random sample instead of reading every object: each walk starts the cursor after a random UUID and reads a few objects. Rates come with 95% confidence bounds (Wilson for fill/empty rates, normal approximation for sizes).")
+	col1, col2 = st.columns(2)
+	with col1:
+		walks = st.number_input("Random walks", min_value=1, max_value=10000, value=50, key="profile_walks")
+	with col2:
+		walk_length = st.number_input("Objects per walk", min_value=1, max_value=1000, value=20, key="profile_walk_length")
+
+	if st.button("Profile Sample", use_container_width=True):
+		with st.spinner("Sampling objects..."):
+			try:
+				st.session_state.sampling_profile = {
+					"collection": selected_collection,
+					"tenant": selected_tenant,
+					**run_sampling_profile(st.session_state.client, selected_collection, selected_tenant, walks=int(walks), walk_length=int(walk_length))
+				}
+			except Exception as e:
+				st.error(f"Sampling failed: {e}")
+				return
+
+	result = st.session_state.get("sampling_profile")
+	if not result or result["collection"] != selected_collection or result["tenant"] != selected_tenant:
+		return
+	st.info(f"Sampled {result['sampled']:,} of {result['total_count']:,} objects ({result['sample_fraction']:.4%}). Failed walks: {result['failed_walks']}")
+	if result["profile"].empty:
+		st.warning("No objects sampled")
+		return
+	st.dataframe(result["profile"], use_container_width=True)
+
+def vector_health(selected_collection, selected_tenant):
+	st.markdown("#### Vector Health")
+	st.markdown("###### Streams vectors in batches and checks the norm distribution, zero and NaN vectors, wrong dimensionality and near-duplicate clusters (LSH buckets, then cosine similarity on normalized vectors). Counts cover every vector read; norm percentiles and the near-duplicate search use a random sample of up to 100k vectors to bound memory. Duplicate and zero vectors bloat the HNSW graph and degrade recall.")
+	col1, col2, col3 = st.columns(3)
+	with col1:
+		max_objects = st.number_input("Max objects to read", min_value=100, max_value=10_000_000, value=100000, step=10000, key="vector_health_max_objects")
+		vector_name = st.text_input("Named vector (optional)", key="vector_health_vector_name").strip() or None
+	with col2:
+		threshold = st.number_input("Duplicate cosine similarity", min_value=0.5, max_value=1.0, value=0.99, step=0.005, format="%.3f", key="vector_health_threshold")
+		expected_dimensions = st.number_input("Expected dimensions (0 = most common)", min_value=0, max_value=65536, value=0, key="vector_health_dimensions")
+	with col3:
+		lsh_bits = st.number_input("LSH bits per table", min_value=4, max_value=32, value=16, key="vector_health_bits")
+		lsh_tables = st.number_input("LSH tables", min_value=1, max_value=32, value=4, key="vector_health_tables")
+
+	if st.button("Analyze Vectors", use_container_width=True):
+		collection = st.session_state.client.collections.get(selected_collection)
+		if selected_tenant:
+			collection = collection.with_tenant(selected_tenant)
+		with st.spinner("Streaming vectors..."):
+			try:
+				result = analyze_vectors(
+					stream_vector_batches(collection, vector_name=vector_name, max_objects=int(max_objects)),
+					expected_dimensions=int(expected_dimensions) or None,
+					duplicate_threshold=threshold,
+					lsh_bits=int(lsh_bits),
+					lsh_tables=int(lsh_tables)
+				)
+			except Exception as e:
+				st.error(f"Vector analysis failed: {e}")
+				return
+		st.session_state.vector_health = {"collection": selected_collection, "tenant": selected_tenant, **result}
+
+	result = st.session_state.get("vector_health")
+	if not result or result["collection"] != selected_collection or result["tenant"] != selected_tenant:
+		return
+	summary = result["summary"]
+	st.dataframe(pd.DataFrame([summary]).astype(str), use_container_width=True)
+	if summary["Wrong Dimensionality"] or summary["NaN/Inf Vectors"] or summary["Zero Vectors"]:
+		st.warning("Invalid vectors found")
+	st.markdown("##### Norm Distribution")
+	st.bar_chart(norm_histogram(result["norms"]), use_container_width=True)
+	if not result["issues"].empty:
+		st.markdown(f"##### Invalid Vectors ({len(result['issues'])})")
+		st.dataframe(result["issues"], use_container_width=True)
+	if not result["duplicates"].empty:
+		st.markdown(f"##### Near-Duplicate Clusters ({len(result['duplicates'])})")
+		st.dataframe(result["duplicates"], use_container_width=True)
+	else:
+		st.success("No near-duplicate vectors found.")
+
 def main():
 	st.title("Data 📁")
 	navigate()
 
 	if st.session_state.get("client_ready"):
 		update_side_bar_labels()
-		get_all_objects_of_collections_and_tenants()
+		selected_collection, selected_tenant = get_all_objects_of_collections_and_tenants()
+		st.markdown("---")
+		if selected_collection:
+			sampling_profile(selected_collection, selected_tenant)
+			st.markdown("---")
+			vector_health(selected_collection, selected_tenant)
 	else:
 		st.warning("Please Establish a connection to Weaviate in Cluster page!")
 
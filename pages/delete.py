@@ -2,7 +2,8 @@ import streamlit as st
 from utils.sidebar.navigation import navigate
 from utils.sidebar.helper import update_side_bar_labels
 from utils.collections.data import list_all_collections, get_tenant_names
-from utils.collections.delete import delete_collections, delete_tenants_from_collection
+from utils.collections.delete import delete_collections, delete_tenants_from_collection, delete_objects_by_ids
+from utils.collections.duplicates import scan_duplicates
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -129,7 +130,7 @@ def get_all_collections_and_tenants():
     # Update MT collections and their tenants
     st.session_state.mt_collections = {}
     for collection in collections:
-        tenants = get_tenant_names(client, collection)
+        tenants = get_tenant_names(client, collection, st.session_state.cluster_endpoint, st.session_state.cluster_api_key)
         if tenants:
             st.session_state.mt_collections[collection] = sorted(tenants)
     
@@ -137,6 +138,74 @@ def get_all_collections_and_tenants():
     handle_collection_selection()
     st.markdown("---")
     handle_mt_collection_selection()
+    st.markdown("---")
+    handle_duplicate_objects()
+
+def handle_duplicate_objects():
+    """Find objects with identical content under different UUIDs and delete the extra copies"""
+    st.subheader("Duplicate Objects")
+    st.markdown("###### Streams the collection with the cursor API and hashes the selected properties. The first object of each group (in UUID order) is kept, the others are extras.")
+    client = st.session_state.client
+    if not st.session_state.collections_list:
+        st.info("No collections found")
+        return
+
+    selected_collection = st.selectbox("Collection", st.session_state.collections_list, key="duplicates_collection")
+    selected_tenant = None
+    if selected_collection in st.session_state.mt_collections:
+        selected_tenant = st.selectbox("Tenant", st.session_state.mt_collections[selected_collection], key="duplicates_tenant")
+
+    property_names = [prop.name for prop in client.collections.get(selected_collection).config.get().properties]
+    selected_properties = st.multiselect("Properties that define a duplicate", property_names, default=property_names, key="duplicates_properties")
+
+    if st.button("Scan for Duplicates", use_container_width=True):
+        if not selected_properties:
+            st.error("Please select at least one property")
+            return
+        collection = client.collections.get(selected_collection)
+        if selected_tenant:
+            collection = collection.with_tenant(selected_tenant)
+        status = st.empty()
+        with st.spinner("Scanning objects..."):
+            scan = scan_duplicates(
+                collection,
+                selected_properties,
+                progress_callback=lambda scanned, unique, extras: status.info(f"Scanned {scanned:,} objects, {unique:,} unique, {extras:,} extras")
+            )
+        st.session_state.duplicate_scan = {"collection": selected_collection, "tenant": selected_tenant, **scan}
+
+    scan = st.session_state.get("duplicate_scan")
+    if not scan or scan["collection"] != selected_collection or scan["tenant"] != selected_tenant:
+        return
+    st.info(f"Scanned {scan['scanned']:,} objects: {scan['unique']:,} unique, {len(scan['groups']):,} duplicate group(s), {len(scan['extras']):,} extra object(s), {scan['skipped']:,} skipped with none of the properties set")
+    if not scan["extras"]:
+        st.success("No duplicates found")
+        return
+    st.dataframe(scan["groups"], use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        batch_size = st.number_input("UUIDs per delete request", min_value=1, max_value=10000, value=100, key="duplicates_batch_size")
+    with col2:
+        pause_seconds = st.number_input("Pause between batches (seconds)", min_value=0.0, max_value=60.0, value=0.5, step=0.5, key="duplicates_pause")
+
+    st.warning("WARNING: This is a DELETE operation to the database and cannot be undone. Please ensure you are connected with admin privileges.", icon="⚠️")
+    if st.button(f"🗑️ Delete {len(scan['extras']):,} Extra Objects", type="primary", use_container_width=True):
+        progress_bar = st.progress(0.0)
+        result = delete_objects_by_ids(
+            client,
+            selected_collection,
+            scan["extras"],
+            tenant_name=selected_tenant,
+            batch_size=int(batch_size),
+            pause_seconds=pause_seconds,
+            progress_callback=lambda done, total, deleted: progress_bar.progress(done / total)
+        )
+        if result["failed"]:
+            st.error(f"Deleted {result['deleted']:,} objects, {result['failed']:,} failed: {'; '.join(result['errors'][:3])}")
+        else:
+            st.success(f"Deleted {result['deleted']:,} objects in {result['seconds']}s ({result['objects_per_second']} objects/s)")
+        del st.session_state.duplicate_scan
 
 def main():
     st.title("Delete Collections & Tenants 🗑️")
@@ -0,0 +1,133 @@
+import streamlit as st
+import pandas as pd
+from utils.sidebar.navigation import navigate
+from utils.sidebar.helper import update_side_bar_labels
+from utils.collections.data import list_all_collections, get_tenant_names
+from utils.collections.delete import CREATION_TIME, UPDATE_TIME, FILTER_OPERATORS, build_delete_filter, count_matching_objects, delete_objects_by_filter
+
+def select_collection_and_tenants():
+	client = st.session_state.client
+	if "collections_list" not in st.session_state:
+		collections = list_all_collections(client)
+		if not isinstance(collections, list):
+			collections = list(collections.keys())
+		collections.sort()
+		st.session_state.collections_list = collections
+
+	selected_collection = st.selectbox("Select a Collection", st.session_state.collections_list, key="filter_delete_collection")
+	tenant_names = get_tenant_names(client, selected_collection, st.session_state.cluster_endpoint, st.session_state.cluster_api_key)
+	selected_tenants = []
+	if tenant_names:
+		tenant_names = sorted(tenant_names)
+		if st.checkbox(f"All {len(tenant_names)} tenants", key="filter_delete_all_tenants"):
+			selected_tenants = tenant_names
+		else:
+			selected_tenants = st.multiselect("Tenants", tenant_names, key="filter_delete_tenants")
+	return selected_collection, tenant_names, selected_tenants
+
+def build_conditions(selected_collection):
+	properties = {prop.name: prop.data_type.value for prop in st.session_state.client.collections.get(selected_collection).config.get().properties}
+	property_options = [CREATION_TIME, UPDATE_TIME] + sorted(properties)
+
+	col1, col2 = st.columns(2)
+	with col1:
+		condition_count = st.number_input("Conditions", min_value=1, max_value=10, value=1, key="filter_delete_condition_count")
+	with col2:
+		combine = st.selectbox("Combine conditions with", ["all", "any"], format_func=lambda value: "AND (all)" if value == "all" else "OR (any)", key="filter_delete_combine")
+
+	conditions = []
+	for index in range(int(condition_count)):
+		col1, col2, col3 = st.columns(3)
+		with col1:
+			property_name = st.selectbox("Property", property_options, key=f"filter_delete_property_{index}")
+		with col2:
+			operator = st.selectbox("Operator", FILTER_OPERATORS, index=FILTER_OPERATORS.index("less_than"), key=f"filter_delete_operator_{index}")
+		with col3:
+			value = st.text_input("Value", key=f"filter_delete_value_{index}", help="Dates: ISO format or <N>d for N days ago (e.g. 90d). contains_any: comma separated. is_none: true/false.")
+		conditions.append({"property": property_name, "data_type": properties.get(property_name, "date"), "operator": operator, "value": value})
+	return conditions, combine
+
+def delete_by_filter():
+	selected_collection, tenant_names, selected_tenants = select_collection_and_tenants()
+	if not selected_collection:
+		return
+	st.markdown("#### Filter")
+	conditions, combine = build_conditions(selected_collection)
+
+	col1, col2 = st.columns(2)
+	with col1:
+		chunk_size = st.number_input("Objects per delete request", min_value=1, max_value=10000, value=1000, key="filter_delete_chunk_size")
+	with col2:
+		pause_seconds = st.number_input("Pause between chunks (seconds)", min_value=0.0, max_value=60.0, value=1.0, step=0.5, key="filter_delete_pause")
+
+	if tenant_names and not selected_tenants:
+		st.info("Select at least one tenant")
+		return
+	if any(not condition["value"].strip() for condition in conditions):
+		st.info("Enter a value for every condition")
+		return
+	try:
+		filters = build_delete_filter(conditions, combine)
+	except ValueError as e:
+		st.error(f"Invalid filter value: {e}")
+		return
+
+	st.warning("WARNING: This is a DELETE operation to the database and cannot be undone. Please ensure you are connected with admin privileges.", icon="⚠️")
+	col3, col4 = st.columns(2)
+	with col3:
+		dry_run_clicked = st.button("Dry Run (Count)", use_container_width=True)
+	with col4:
+		delete_clicked = st.button("🗑️ Delete Matching Objects", type="primary", use_container_width=True)
+
+	if dry_run_clicked:
+		with st.spinner("Counting matching objects..."):
+			counts = pd.DataFrame(count_matching_objects(st.session_state.client, selected_collection, filters, selected_tenants or None))
+		total = pd.to_numeric(counts["Matching"], errors="coerce").fillna(0).sum()
+		st.info(f"Dry run: **{int(total):,}** object(s) match the filter.")
+		st.dataframe(counts.astype(str), use_container_width=True)
+
+	if delete_clicked:
+		status = st.empty()
+		progress_bar = st.progress(0.0)
+		tenants = selected_tenants or [None]
+		finished_tenants = set()
+
+		def progress(tenant_name, deleted, objects_per_second, finished):
+			# The bar advances per finished tenant, the status line follows the chunks
+			if finished:
+				finished_tenants.add(tenant_name)
+				progress_bar.progress(min(len(finished_tenants) / len(tenants), 1.0))
+			status.info(f"{tenant_name or selected_collection}: deleted {deleted:,} object(s) at {objects_per_second} objects/s")
+
+		results = pd.DataFrame(delete_objects_by_filter(
+			st.session_state.client,
+			selected_collection,
+			filters,
+			tenant_names=selected_tenants or None,
+			chunk_size=int(chunk_size),
+			pause_seconds=pause_seconds,
+			progress_callback=progress
+		))
+		progress_bar.progress(1.0)
+		seconds = results["Seconds"].sum()
+		deleted = results["Deleted"].sum()
+		message = f"Deleted {deleted:,} object(s) in {seconds:.1f}s ({deleted / seconds if seconds else 0:.1f} objects/s)"
+		if (results["Error"] != "").any():
+			st.error(f"{message}. Some tenants stopped with errors, see below.")
+		else:
+			st.success(message)
+		st.dataframe(results.astype(str), use_container_width=True)
+
+def main():
+	st.title("Delete by Filter 🧹")
+	navigate()
+
+	if st.session_state.get("client_ready"):
+		update_side_bar_labels()
+		st.markdown("###### Deletes the objects matching a filter in throttled chunks, tenant by tenant. Run the dry run first to check how many objects match.")
+		delete_by_filter()
+	else:
+		st.warning("Please Establish a connection to Weaviate in Cluster page!")
+
+if __name__ == "__main__":
+	main()
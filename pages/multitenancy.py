@@ -1,9 +1,14 @@
 import streamlit as st
 import pandas as pd
+from itertools import chain
 from utils.sidebar.navigation import navigate
 from utils.sidebar.helper import update_side_bar_labels
-from utils.multitenancy.tenantdetails import get_tenant_details, get_multitenancy_collections, aggregate_tenant_states
-from utils.cluster.cluster_operations import get_schema
+from utils.multitenancy.tenantdetails import iter_tenants, get_multitenancy_collections, aggregate_tenant_states, select_tenant_names_by_state, update_tenants_activity_status, TENANT_STATES
+from utils.multitenancy.placement import build_tenant_placement
+from utils.multitenancy.offload import get_tenants_last_update, plan_tenant_offload
+from utils.cluster.memory import get_vector_dimensions, sample_vector_dimensions, estimate_memory
+from utils.cluster.cluster_operations import get_schema, get_shards_info, process_shards_data
+from utils.cluster.collection import fetch_collection_config
     
 def display_multitenancy(cluster_url, api_key):
 
@@ -49,22 +54,217 @@ def display_multitenancy(cluster_url, api_key):
         else:
             st.error("Failed to find the selected collection in the available collections.")
 
+# Tenants listed in the table, the state counts always cover every tenant
+MAX_TENANT_ROWS = 10000
+
+# Stream (name, activity status) tuples of every tenant of a collection
+def stream_tenants(collection_name):
+    return chain.from_iterable(iter_tenants(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, collection_name))
+
 def tenant_details():
+    selected_collection_name = st.session_state.get("selected_collection_name")
     if st.button("Get Tenant Details"):
-        selected_collection_name = st.session_state.get("selected_collection_name")
-        tenants = get_tenant_details(st.session_state.client, selected_collection_name)
-        aggregated_states = aggregate_tenant_states(tenants)
+        aggregated_states = {}
         tenant_data = []
-        for tenant_id, tenant in tenants.items():
-            tenant_data.append({
-                'Tenant ID': tenant_id,
-                'Name': tenant.name,
-                'Activity Status Internal': tenant.activityStatusInternal.name,
-                'Activity Status': tenant.activityStatus.name
-            })
-        st.dataframe(pd.DataFrame(aggregated_states.items(), columns=['Activity Status', 'Count']), use_container_width=True)
-        df = pd.DataFrame(tenant_data)
-        st.dataframe(df.astype(str), use_container_width=True)
+        progress_text = st.empty()
+        try:
+            for page in iter_tenants(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, selected_collection_name):
+                aggregate_tenant_states(page, aggregated_states)
+                for tenant_name, state in page[:MAX_TENANT_ROWS - len(tenant_data)]:
+                    tenant_data.append({
+                        'Name': tenant_name,
+                        'Activity Status': state
+                    })
+                progress_text.text(f"Loaded {sum(aggregated_states.values()):,} tenants...")
+        except Exception as e:
+            st.error(f"Failed to fetch tenants: {e}")
+            return
+        progress_text.empty()
+        st.session_state["tenant_summary"] = {
+            "collection": selected_collection_name,
+            "states": aggregated_states,
+            "rows": tenant_data
+        }
+
+    # Keep the loaded summary across reruns as long as the same collection is selected
+    tenant_summary = st.session_state.get("tenant_summary")
+    if not tenant_summary or tenant_summary["collection"] != selected_collection_name:
+        return
+
+    aggregated_states = tenant_summary["states"]
+    total_tenants = sum(aggregated_states.values())
+    st.dataframe(pd.DataFrame(aggregated_states.items(), columns=['Activity Status', 'Count']), use_container_width=True)
+    if total_tenants > len(tenant_summary["rows"]):
+        st.info(f"Showing the first {len(tenant_summary['rows']):,} of {total_tenants:,} tenants.")
+    df = pd.DataFrame(tenant_summary["rows"])
+    st.dataframe(df.astype(str), use_container_width=True)
+
+    tenant_placement(selected_collection_name)
+    bulk_tenant_state_management(selected_collection_name, aggregated_states)
+    offload_planner(selected_collection_name)
+
+def tenant_placement(collection_name):
+    st.markdown("#### Tenant Placement")
+    if st.button("Get Tenant Placement per Node", use_container_width=True):
+        with st.spinner("Joining node shards with the tenant list..."):
+            node_info = get_shards_info(st.session_state.client)
+            shard_df = process_shards_data(node_info)["shard_data"]
+            if not shard_df.empty:
+                shard_df = shard_df[shard_df["Class"] == collection_name]
+            tenant_states = dict(stream_tenants(collection_name))
+            # Nodes without tenants of the collection count in the skew too
+            placement = build_tenant_placement(shard_df, tenant_states, node_names=[node.name for node in node_info])
+
+        if placement["node_df"].empty:
+            st.warning("No shards found for this collection on the nodes.")
+            return
+        skew = placement["skew"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Tenant Skew (max/mean)", skew["Tenants"])
+        col2.metric("HOT Tenant Skew (max/mean)", skew["HOT Tenants"])
+        col3.metric("Object Skew (max/mean)", skew["Objects"])
+        st.markdown("##### Per Node")
+        st.dataframe(placement["node_df"], use_container_width=True)
+        st.markdown("##### Tenants by Size")
+        st.dataframe(placement["tenant_df"].head(MAX_TENANT_ROWS).astype(str), use_container_width=True)
+
+def bulk_tenant_state_management(collection_name, aggregated_states):
+    st.markdown("#### Bulk Tenant Activity State")
+    st.markdown("###### HOT = ACTIVE, COLD = INACTIVE, FROZEN = OFFLOADED (requires an offload module). Deactivating idle tenants frees memory on the nodes.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        source_states = st.multiselect(
+            "Tenants currently in state",
+            sorted(aggregated_states.keys()),
+            format_func=lambda state: f"{state} ({aggregated_states[state]})",
+            key="bulk_source_states"
+        )
+    with col2:
+        target_state = st.selectbox("Move them to", list(TENANT_STATES.keys()), index=1, key="bulk_target_state")
+    with col3:
+        max_tenants = st.number_input("Max tenants (0 = all)", min_value=0, value=0, key="bulk_max_tenants")
+
+    col4, col5, col6 = st.columns(3)
+    with col4:
+        chunk_size = st.number_input("Tenants per request", min_value=1, max_value=1000, value=100, key="bulk_chunk_size")
+    with col5:
+        max_workers = st.number_input("Concurrent requests", min_value=1, max_value=16, value=2, key="bulk_max_workers")
+    with col6:
+        pause_seconds = st.number_input("Pause after each request (seconds)", min_value=0.0, max_value=60.0, value=0.5, step=0.5, key="bulk_pause")
+
+    selected_count = sum(aggregated_states[state] for state in source_states)
+    if max_tenants:
+        selected_count = min(selected_count, int(max_tenants))
+    st.markdown(f"###### Tenants selected: **{selected_count}**")
+
+    st.warning("⬇️ This operation requires administrator privileges. Please ensure you are connected with an admin API key.")
+    if st.button(f"Move Selected Tenants to {target_state}", type="primary", use_container_width=True):
+        # Select from a fresh stream, the states may have changed since the counts were loaded
+        selected_names = select_tenant_names_by_state(stream_tenants(collection_name), source_states, limit=int(max_tenants) or None)
+        if not selected_names:
+            st.error("Please select at least one source state with tenants in it")
+        else:
+            progress_bar = st.progress(0.0)
+            status_text = st.empty()
+
+            def on_progress(done, total):
+                progress_bar.progress(done / total)
+                status_text.text(f"{done}/{total} tenant(s) processed")
+
+            history = update_tenants_activity_status(
+                st.session_state.client,
+                collection_name,
+                selected_names,
+                target_state,
+                chunk_size=int(chunk_size),
+                max_workers=int(max_workers),
+                pause_seconds=pause_seconds,
+                progress_callback=on_progress
+            )
+            st.session_state.setdefault("tenant_state_history", []).extend(history)
+            failed = [row for row in history if not row["Success"]]
+            if failed:
+                st.error(f"{len(failed)} of {len(history)} request(s) failed. Check the history below.")
+            else:
+                st.success(f"Moved {len(selected_names)} tenant(s) to {target_state}. Click 'Get Tenant Details' to refresh the states.")
+
+    if st.session_state.get("tenant_state_history"):
+        st.markdown("##### State Transition History")
+        st.dataframe(pd.DataFrame(st.session_state["tenant_state_history"][::-1]).astype(str), use_container_width=True)
+
+def offload_planner(collection_name):
+    st.markdown("#### Cold-Tenant Offload Planner")
+    st.markdown("###### Ranks HOT tenants by estimated memory (object count from nodes verbose × vector and graph size from the collection's index and compression config) and inactivity, then proposes the fewest deactivations that free the target memory on each node.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        target_mb = st.number_input("Memory to free per node (MB)", min_value=1, value=1024, key="offload_target_mb")
+    with col2:
+        min_idle_hours = st.number_input("Minimum idle time (hours)", min_value=0, value=24, key="offload_min_idle")
+    with col3:
+        sample_size = st.number_input("Objects sampled per tenant (fallback)", min_value=1, max_value=10000, value=100, key="offload_sample_size")
+
+    if st.button("Plan Offload", use_container_width=True):
+        with st.spinner("Collecting shard sizes, vector dimensions and last update times..."):
+            config = fetch_collection_config(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, collection_name)
+            if "error" in config:
+                st.error(config["error"])
+                return
+            shard_df = process_shards_data(get_shards_info(st.session_state.client))["shard_data"]
+            if not shard_df.empty:
+                shard_df = shard_df[shard_df["Class"] == collection_name]
+
+            hot_tenants = select_tenant_names_by_state(stream_tenants(collection_name), ["ACTIVE"])
+            tenant_states = dict.fromkeys(hot_tenants, "ACTIVE")
+
+            dimensions = get_vector_dimensions(config)
+            if hot_tenants and not all(dimensions.values()):
+                dimensions.update(sample_vector_dimensions(st.session_state.client, collection_name, hot_tenants[0]))
+            memory_df = estimate_memory(shard_df, {collection_name: config}, {collection_name: dimensions})
+            tenant_bytes = memory_df.groupby(["Node Name", "Shard"])["Total Bytes"].sum().groupby("Shard").max().to_dict() if not memory_df.empty else {}
+            total_mb = round(memory_df["Total Bytes"].sum() / 1024**2, 1) if not memory_df.empty else 0.0
+            last_updates, update_errors = get_tenants_last_update(st.session_state.client, collection_name, hot_tenants, sample_size=int(sample_size))
+
+            plan_df, node_summary_df = plan_tenant_offload(
+                shard_df,
+                tenant_states,
+                last_updates,
+                tenant_bytes,
+                target_mb * 1024**2,
+                min_idle_hours=min_idle_hours
+            )
+            st.session_state["offload_plan"] = {"collection": collection_name, "plan": plan_df, "summary": node_summary_df, "total_mb": total_mb, "update_errors": update_errors}
+
+    offload_plan = st.session_state.get("offload_plan")
+    if not offload_plan or offload_plan["collection"] != collection_name:
+        return
+
+    st.markdown(f"###### Estimated vector index memory of the collection (all replicas): **{offload_plan['total_mb']:,} MB**")
+    if offload_plan["update_errors"]:
+        st.warning(f"The last update time of {len(offload_plan['update_errors'])} tenant(s) could not be read, they are left out of the plan.")
+        st.dataframe(pd.DataFrame(list(offload_plan["update_errors"].items()), columns=["Tenant", "Error"]), use_container_width=True)
+    st.markdown("##### Per Node")
+    st.dataframe(offload_plan["summary"].astype(str), use_container_width=True)
+    plan_df = offload_plan["plan"]
+    if plan_df.empty:
+        st.info("No idle HOT tenants to deactivate.")
+        return
+    st.markdown(f"##### Proposed Deactivations ({len(plan_df)})")
+    st.dataframe(plan_df.astype(str), use_container_width=True)
+
+    if st.button("Deactivate Planned Tenants (COLD)", type="primary", use_container_width=True):
+        progress_bar = st.progress(0.0)
+        history = update_tenants_activity_status(
+            st.session_state.client,
+            collection_name,
+            plan_df["Tenant"].tolist(),
+            "COLD",
+            progress_callback=lambda done, total: progress_bar.progress(done / total)
+        )
+        st.session_state.setdefault("tenant_state_history", []).extend(history)
+        del st.session_state["offload_plan"]
+        st.success("Planned tenants processed. Check the State Transition History above.")
 
 def main():
 
@@ -1,41 +1,40 @@
 import streamlit as st
-from utils.objects.object import get_object_in_collection, display_object_as_table, find_object_in_collection_on_nodes, get_object_in_tenant, find_object_in_tenant_on_nodes
+from utils.objects.object import get_objects_by_ids, parse_uuid_list, check_objects_on_nodes, find_object_in_collection_on_nodes, find_object_in_tenant_on_nodes, get_node_names, locate_object, MAX_NODE_CHECK_UUIDS
 from utils.sidebar.navigation import navigate
 from utils.sidebar.helper import update_side_bar_labels
 
 def get_object_details():
     collection_name = st.text_input("Collection Name")
-    object_uuid = st.text_input("Object UUID")
+    object_uuids = st.text_area("Object UUID(s)", height=100, help="One or more UUIDs separated by commas or new lines. They are fetched in a single query.")
     with_tenant = st.checkbox("Tenant", value=False)
 
     tenant_name = None
     if with_tenant:
         tenant_name = st.text_input("Tenant Name")
+    include_vector = st.checkbox("Include Vectors", value=False)
 
     col1, col2 = st.columns(2)
     with col1:
-        fetch_object_clicked = st.button("Fetch The Object", use_container_width=True)
+        fetch_object_clicked = st.button("Fetch The Object(s)", use_container_width=True)
     with col2:
-        check_node_clicked = st.button("Check the Object on the Nodes (APIs)", use_container_width=True)
+        check_node_clicked = st.button("Check the Object(s) on the Nodes (APIs)", use_container_width=True)
 
-    # "Fetch Object"
+    # "Fetch Objects"
     if fetch_object_clicked:
-        if not collection_name.strip() or not object_uuid.strip():
+        if not collection_name.strip() or not object_uuids.strip():
             st.error("Please insert both Collection Name and UUID.")
             return
 
         try:
-            # Fetch and display object
-            if with_tenant and tenant_name:
-                data_object = get_object_in_tenant(st.session_state.client, collection_name, object_uuid, tenant_name)
-            else:
-                data_object = get_object_in_collection(st.session_state.client, collection_name, object_uuid)
-            
-            if data_object:
-                display = display_object_as_table(data_object)
+            # Fetch all objects in one filtered query and display them in one table
+            uuids = parse_uuid_list(object_uuids)
+            display, missing = get_objects_by_ids(st.session_state.client, collection_name, uuids, tenant_name if with_tenant else None, include_vector)
+
+            if not display.empty:
+                st.info(f"Found {len(display):,} of {len(uuids):,} object(s).")
                 st.session_state.button_result = st.dataframe(display)
-            else:
-                st.session_state.button_result = st.error(f"Object with UUID '{object_uuid}' not found.")
+            if missing:
+                st.session_state.button_result = st.error(f"{len(missing):,} object(s) not found: {', '.join(missing[:20])}" + (" ..." if len(missing) > 20 else ""))
         except ValueError:
             st.session_state.button_result = st.error("Invalid UUID: Not a valid UUID or unable to extract it.")
         except Exception as e:
@@ -43,24 +42,64 @@ def get_object_details():
 
     # "Check Object on a Node"
     if check_node_clicked:
-        if not collection_name.strip() or not object_uuid.strip():
+        if not collection_name.strip() or not object_uuids.strip():
             st.error("Please insert both Collection Name and UUID.")
             return
 
         try:
-            # Fetch node data and display table
+            # Fetch node data and display table, one row per UUID
             api_key = st.session_state.cluster_api_key
             cluster_endpoint = st.session_state.cluster_endpoint
-            if with_tenant and tenant_name:
-                data_object = find_object_in_tenant_on_nodes(cluster_endpoint, api_key, collection_name, object_uuid, tenant_name)
-            else:
-                data_object = find_object_in_collection_on_nodes(cluster_endpoint, api_key, collection_name, object_uuid)
-            node_df = data_object
+            node_names = get_node_names(st.session_state.client)
+            uuids = parse_uuid_list(object_uuids)
+            if len(uuids) > MAX_NODE_CHECK_UUIDS:
+                st.info(f"Checking the first {MAX_NODE_CHECK_UUIDS} of {len(uuids):,} UUIDs on the nodes.")
+                uuids = uuids[:MAX_NODE_CHECK_UUIDS]
+            node_df = check_objects_on_nodes(cluster_endpoint, api_key, collection_name, uuids, node_names, tenant_name if with_tenant else None)
             st.session_state.button_result = st.dataframe(node_df, use_container_width=True)
-            st.text("✔ Found | ✖ Not Found | N/A The node does not exist (Hardcoded 11 nodes as maximum for now)")
+            st.text("✔ Found | ✖ Not Found | Error <status> The node could not be checked")
         except Exception as e:
             st.session_state.button_result = st.error(f"An error occurred while checking the object on nodes: {e}")
 
+def locate_object_by_uuid():
+    st.markdown("#### Locate an Object by UUID")
+    st.markdown("###### Searches every collection, and every active tenant of multi-tenant collections, for a UUID and shows the nodes holding it.")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        object_uuid = st.text_input("Object UUID", key="locate_uuid")
+    with col2:
+        max_workers = st.number_input("Concurrent checks", min_value=1, max_value=64, value=16, key="locate_workers")
+
+    if st.button("Locate The Object", use_container_width=True):
+        if not object_uuid.strip():
+            st.error("Please insert a UUID.")
+            return
+        try:
+            api_key = st.session_state.cluster_api_key
+            cluster_endpoint = st.session_state.cluster_endpoint
+            with st.spinner("Searching collections and tenants..."):
+                result = locate_object(st.session_state.client, cluster_endpoint, api_key, object_uuid, max_workers=int(max_workers))
+            if "error" in result:
+                st.error(result["error"])
+                return
+
+            summary = f"{result['Checked']:,} check(s) in {result['Seconds']}s, {result['Skipped']:,} inactive tenant(s) skipped, {result['Errors']:,} error(s)"
+            if result["Collection"] is None:
+                st.warning(f"Object with UUID '{object_uuid}' not found ({summary}).")
+                return
+            location = result["Collection"] + (f" / tenant {result['Tenant']}" if result["Tenant"] else "")
+            st.success(f"Found in {location} ({summary}).")
+            node_names = get_node_names(st.session_state.client)
+            if result["Tenant"]:
+                node_df = find_object_in_tenant_on_nodes(cluster_endpoint, api_key, result["Collection"], object_uuid.strip(), result["Tenant"], node_names)
+            else:
+                node_df = find_object_in_collection_on_nodes(cluster_endpoint, api_key, result["Collection"], object_uuid.strip(), node_names)
+            st.dataframe(node_df, use_container_width=True)
+        except ValueError:
+            st.error("Invalid UUID: Not a valid UUID or unable to extract it.")
+        except Exception as e:
+            st.error(f"An error occurred while locating the object: {e}")
+
 def main():
     st.title("Object 📦")
 
@@ -69,6 +108,8 @@ def main():
     if st.session_state.get("client_ready"):
         update_side_bar_labels()
         get_object_details()
+        st.markdown("---")
+        locate_object_by_uuid()
     else:
         st.warning("Please Establish a connection to Weaviate in Cluster page!")
     
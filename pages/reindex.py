@@ -0,0 +1,169 @@
+import json
+import streamlit as st
+import pandas as pd
+from utils.sidebar.navigation import navigate
+from utils.sidebar.helper import update_side_bar_labels
+from utils.collections.data import list_all_collections, get_tenant_names
+from utils.collections.reindex import reindex_collection
+from utils.cluster.collection import fetch_collection_config, copy_collection_config, create_collection_from_config
+from utils.connection.weaviate_connection import connect_weaviate_client
+
+def select_source():
+	client = st.session_state.client
+	if "collections_list" not in st.session_state:
+		collections = list_all_collections(client)
+		if not isinstance(collections, list):
+			collections = list(collections.keys())
+		collections.sort()
+		st.session_state.collections_list = collections
+
+	selected_collection = st.selectbox("Source Collection", st.session_state.collections_list, key="reindex_source")
+	tenant_names = get_tenant_names(client, selected_collection, st.session_state.cluster_endpoint, st.session_state.cluster_api_key)
+	selected_tenants = []
+	if tenant_names:
+		tenant_names = sorted(tenant_names)
+		if st.checkbox(f"All {len(tenant_names)} tenants", key="reindex_all_tenants"):
+			selected_tenants = tenant_names
+		else:
+			selected_tenants = st.multiselect("Tenants", tenant_names, key="reindex_tenants")
+	return selected_collection, tenant_names, selected_tenants
+
+def select_target(selected_collection):
+	target_cluster = st.radio("Target Cluster", ["This cluster", "Another cluster"], horizontal=True, key="reindex_target_cluster")
+	endpoint, api_key, use_local = st.session_state.cluster_endpoint, st.session_state.cluster_api_key, False
+	if target_cluster == "Another cluster":
+		col1, col2, col3 = st.columns([3, 3, 1])
+		with col1:
+			endpoint = st.text_input("Target Endpoint", key="reindex_target_endpoint")
+		with col2:
+			api_key = st.text_input("Target API Key", type="password", key="reindex_target_api_key")
+		with col3:
+			use_local = st.checkbox("Local", key="reindex_target_local")
+	target_name = st.text_input("Target Collection", value=f"{selected_collection}_reindexed", key="reindex_target_name")
+	return endpoint.rstrip("/"), api_key, use_local, target_cluster == "This cluster", target_name
+
+def target_config_editor(source_config, target_name):
+	# The copied config can be edited before creating, e.g. to change the vectorizer, index type or sharding
+	create_target = st.checkbox("Create the target collection from the source config", value=True, key="reindex_create_target")
+	if not create_target:
+		return None
+	config_text = st.text_area(
+		"Target Config (JSON)",
+		value=json.dumps(copy_collection_config(source_config, target_name), indent=2),
+		height=300,
+		key=f"reindex_config_{source_config.get('class')}_{target_name}"
+	)
+	try:
+		return json.loads(config_text)
+	except json.JSONDecodeError as e:
+		st.error(f"Invalid JSON: {e}")
+		return {}
+
+def reindex():
+	selected_collection, tenant_names, selected_tenants = select_source()
+	if not selected_collection:
+		return
+	source_config = fetch_collection_config(st.session_state.cluster_endpoint, st.session_state.cluster_api_key, selected_collection)
+	if "error" in source_config:
+		st.error(source_config["error"])
+		return
+
+	st.markdown("#### Target")
+	endpoint, api_key, use_local, same_cluster, target_name = select_target(selected_collection)
+	target_config = target_config_editor(source_config, target_name)
+	# Reference data types are collection names, which start with a capital letter
+	reference_properties = [prop["name"] for prop in source_config.get("properties", []) if prop.get("dataType") and prop["dataType"][0][:1].isupper()]
+	if reference_properties:
+		st.info(f"Reference properties ({', '.join(reference_properties)}) are copied as the UUIDs they point to. The referenced objects must exist on the target cluster.")
+
+	st.markdown("#### Throughput")
+	col1, col2, col3, col4 = st.columns(4)
+	with col1:
+		batch_size = st.number_input("Objects per batch", min_value=1, max_value=5000, value=200, key="reindex_batch_size")
+	with col2:
+		writers = st.number_input("Parallel writers", min_value=1, max_value=32, value=4, key="reindex_writers")
+	with col3:
+		queue_size = st.number_input("Queued batches", min_value=1, max_value=100, value=8, key="reindex_queue_size", help="Bounds the memory used by batches read but not yet written")
+	with col4:
+		max_rate = st.number_input("Max objects/s (0 = unlimited)", min_value=0, value=0, step=100, key="reindex_max_rate")
+	col1, col2 = st.columns(2)
+	with col1:
+		copy_vectors = st.checkbox("Copy vectors", value=True, key="reindex_copy_vectors", help="Uncheck to let the target vectorizer create new vectors")
+	with col2:
+		resume = st.checkbox("Resume from checkpoint", value=True, key="reindex_resume")
+
+	if tenant_names and not selected_tenants:
+		st.info("Select at least one tenant")
+		return
+	if not endpoint or not target_name or target_config == {}:
+		return
+	if same_cluster and target_name == selected_collection:
+		st.error("The target collection must differ from the source collection")
+		return
+
+	if st.button("🔁 Start Reindex", type="primary", use_container_width=True):
+		target_client = st.session_state.client
+		try:
+			if not same_cluster:
+				target_client = connect_weaviate_client(endpoint, api_key, use_local)
+			if target_config and not target_client.collections.exists(target_name):
+				created = create_collection_from_config(endpoint, api_key, target_config)
+				if "error" in created:
+					st.error(created["error"])
+					return
+				st.success(f"Created collection {target_name}")
+
+			status = st.empty()
+			progress_bar = st.progress(0.0)
+			tenants = selected_tenants or [None]
+			seen = []
+
+			def progress(tenant_name, state):
+				if tenant_name not in seen:
+					seen.append(tenant_name)
+				progress_bar.progress(min((len(seen) - 1) / len(tenants), 1.0))
+				status.info(f"{tenant_name or selected_collection}: copied {state['copied']:,} object(s) at {state['objects_per_second']} objects/s, {state['queued_batches']} batch(es) queued, checkpoint {state['last_uuid'] or '-'}")
+
+			results = pd.DataFrame(reindex_collection(
+				st.session_state.client,
+				target_client,
+				selected_collection,
+				target_name,
+				tenant_names=selected_tenants or None,
+				resume=resume,
+				batch_size=int(batch_size),
+				writers=int(writers),
+				queue_size=int(queue_size),
+				max_objects_per_second=int(max_rate),
+				copy_vectors=copy_vectors,
+				named_vectors="vectorConfig" in source_config,
+				progress_callback=progress
+			))
+			progress_bar.progress(1.0)
+			status.empty()
+			if (results["Error"] != "").any():
+				st.error("Some copies stopped with errors. Start again with resume to continue from the checkpoint.")
+			elif not results["Counts Match"].all():
+				st.warning("Copy finished but the counts differ, see below (the target may have held objects before).")
+			else:
+				st.success(f"Copied {results['Copied'].sum():,} object(s), source and target counts match.")
+			st.dataframe(results.astype(str), use_container_width=True)
+		except Exception as e:
+			st.error(f"Reindex failed: {e}")
+		finally:
+			if not same_cluster and target_client is not st.session_state.client:
+				target_client.close()
+
+def main():
+	st.title("Reindex 🔁")
+	navigate()
+
+	if st.session_state.get("client_ready"):
+		update_side_bar_labels()
+		st.markdown("###### Copies a collection into a new collection on this or another cluster, e.g. to change its vectorizer, index or sharding. Progress is checkpointed so an interrupted copy can resume.")
+		reindex()
+	else:
+		st.warning("Please Establish a connection to Weaviate in Cluster page!")
+
+if __name__ == "__main__":
+	main()
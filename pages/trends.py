@@ -0,0 +1,146 @@
+import time
+import pandas as pd
+import streamlit as st
+from utils.sidebar.navigation import navigate
+from utils.sidebar.helper import update_side_bar_labels
+from utils.cluster.cluster_operations import get_shards_info
+from utils.cluster.raft import compute_raft_lag
+from utils.cluster.backlog import shard_samples_from_nodes, compute_queue_drain, compute_node_queue_drain
+from utils.cluster.metrics_store import start_poller, stop_poller, poller_status, metrics_path, read_samples, shard_status_changes
+
+def poller_controls():
+	st.markdown("#### Background Poller")
+	st.markdown("###### Samples nodes verbose and /v1/cluster/statistics at a fixed interval into a local SQLite file, so the trends below do not query the cluster.")
+	status = poller_status()
+
+	col1, col2 = st.columns(2)
+	with col1:
+		interval = st.number_input("Sampling interval (seconds)", min_value=5, max_value=3600, value=30, key="poller_interval")
+	with col2:
+		retention_hours = st.number_input("Retention (hours)", min_value=1, max_value=24 * 30, value=24, key="poller_retention")
+
+	col3, col4 = st.columns(2)
+	with col3:
+		if st.button("Start Poller", use_container_width=True, disabled=status is not None):
+			start_poller(st.session_state.client, st.session_state.cluster_endpoint, st.session_state.cluster_api_key, interval=interval, retention_hours=retention_hours)
+			st.rerun()
+	with col4:
+		if st.button("Stop Poller", use_container_width=True, disabled=status is None):
+			stop_poller()
+			st.rerun()
+
+	if status:
+		st.success(f"Poller running every {status['interval']}s, {status['samples']} sample(s) taken, stored in `{status['path']}`.")
+		if status["last_error"]:
+			st.error(f"Last sample failed: {status['last_error']}")
+	else:
+		st.info("Poller is not running. Trends show previously stored samples, if any.")
+
+def display_trends():
+	path = metrics_path(st.session_state.cluster_endpoint)
+	window_hours = st.selectbox("Time window (hours)", [1, 6, 24, 24 * 7], index=1, key="trends_window")
+	if st.button("Refresh Trends", use_container_width=True):
+		st.rerun()
+
+	node_samples = read_samples(path, "node_samples", window_hours)
+	shard_samples = read_samples(path, "shard_samples", window_hours)
+	raft_samples = read_samples(path, "raft_samples", window_hours)
+	if node_samples.empty:
+		st.warning("No samples stored for this cluster yet.")
+		display_indexing_backlog(shard_samples)
+		return
+
+	st.markdown("#### Objects per Node")
+	st.line_chart(node_samples.pivot_table(index="time", columns="node", values="objects", aggfunc="sum"))
+
+	# Node samples can exist without shard samples (e.g. a cluster without collections), the empty frame has no columns
+	if shard_samples.empty:
+		st.info("No shard samples stored in this window.")
+		display_indexing_backlog(shard_samples)
+	else:
+		st.markdown("#### Objects per Shard")
+		collections = sorted(shard_samples["collection"].unique())
+		selected_collection = st.selectbox("Collection", collections, key="trends_collection")
+		collection_samples = shard_samples[shard_samples["collection"] == selected_collection]
+		collection_samples = collection_samples.assign(replica=collection_samples["shard"] + " @ " + collection_samples["node"])
+		st.line_chart(collection_samples.pivot_table(index="time", columns="replica", values="objects", aggfunc="sum"))
+
+		st.markdown("#### Vector Queue Length per Node")
+		st.line_chart(shard_samples.pivot_table(index="time", columns="node", values="queue_length", aggfunc="sum"))
+
+		display_indexing_backlog(shard_samples)
+
+		st.markdown("#### Shard Status Changes")
+		changes = shard_status_changes(shard_samples)
+		if changes.empty:
+			st.info("No shard status changes in this window.")
+		else:
+			st.dataframe(changes.astype(str), use_container_width=True)
+
+	if not raft_samples.empty:
+		st.markdown("#### Raft Commit Index")
+		st.line_chart(raft_samples.pivot_table(index="time", columns="node", values="commit_index", aggfunc="max"))
+		st.markdown("#### Raft Applied Index")
+		st.line_chart(raft_samples.pivot_table(index="time", columns="node", values="applied_index", aggfunc="max"))
+
+		st.markdown("#### Raft Apply Lag")
+		lag = compute_raft_lag(raft_samples)
+		st.line_chart(lag["lag"])
+		st.dataframe(lag["nodes"].astype(str), use_container_width=True)
+		if not lag["leader_changes"].empty:
+			st.warning(f"{len(lag['leader_changes'])} leader change(s) in this window")
+			st.dataframe(lag["leader_changes"].astype(str), use_container_width=True)
+
+# Highlight shards stuck in INDEXING and queues that grow or stall
+def highlight_backlog(row):
+	if row.get("Alert"):
+		return ["background-color: #f8d7da"] * len(row)
+	if row.get("Index Status") == "INDEXING":
+		return ["background-color: #fff3cd"] * len(row)
+	return [""] * len(row)
+
+def display_indexing_backlog(shard_samples):
+	st.markdown("#### Vector Indexing Backlog")
+	st.markdown("###### Drain rate of the async vector index queue between successive samples, with the ETA to empty. Growing or stalled queues are red, shards in INDEXING are yellow.")
+	stall_seconds = st.number_input("Stalled after (seconds without progress)", min_value=30, max_value=24 * 3600, value=300, key="backlog_stall_seconds")
+
+	if st.button("Measure Now (two snapshots)", use_container_width=True):
+		snapshot_interval = st.session_state.get("backlog_snapshot_interval", 10)
+		with st.spinner(f"Taking two snapshots {snapshot_interval}s apart..."):
+			first = shard_samples_from_nodes(get_shards_info(st.session_state.client))
+			time.sleep(snapshot_interval)
+			second = shard_samples_from_nodes(get_shards_info(st.session_state.client))
+		shard_samples = pd.concat([first, second], ignore_index=True)
+		stall_seconds = snapshot_interval
+	st.number_input("Snapshot interval (seconds)", min_value=1, max_value=300, value=10, key="backlog_snapshot_interval")
+
+	if shard_samples.empty:
+		st.info("No samples available. Start the poller or measure now.")
+		return
+
+	node_backlog = compute_node_queue_drain(shard_samples, stall_seconds=stall_seconds)
+	shard_backlog = compute_queue_drain(shard_samples, stall_seconds=stall_seconds)
+	shard_backlog = shard_backlog[(shard_backlog["Vector Queue Length"] > 0) | (shard_backlog["Index Status"] == "INDEXING") | (shard_backlog["Alert"] != "")]
+
+	st.markdown("##### Per Node")
+	st.dataframe(node_backlog.style.apply(highlight_backlog, axis=1), use_container_width=True)
+	st.markdown("##### Per Shard (non-empty queues and INDEXING shards)")
+	if shard_backlog.empty:
+		st.success("All vector index queues are empty.")
+	else:
+		st.dataframe(shard_backlog.style.apply(highlight_backlog, axis=1), use_container_width=True)
+
+def main():
+	st.title("Trends 📈")
+	navigate()
+
+	if st.session_state.get("client_ready"):
+		update_side_bar_labels()
+		poller_controls()
+		st.markdown("---")
+		display_trends()
+	else:
+		st.warning("Please Establish a connection to Weaviate in Cluster page!")
+
+if __name__ == "__main__":
+	main()
@@ -1,8 +1,9 @@
 import streamlit as st
 from utils.connection.weaviate_client import initialize_client
-from utils.cluster.cluster_operations_handlers import action_check_shard_consistency, action_aggregate_collections_tenants, action_collections_configuration, action_metadata, action_nodes_and_shards, action_collection_schema, action_statistics, action_read_repairs
+from utils.cluster.cluster_operations_handlers import action_load_balance, action_memory_estimate, action_compression_rollout, action_performance_lint, action_check_shard_consistency, action_aggregate_collections_tenants, action_collections_configuration, action_metadata, action_nodes_and_shards, action_collection_schema, action_statistics, action_read_repairs
 from utils.sidebar.navigation import navigate
 from utils.connection.weaviate_connection import close_weaviate_client
+from utils.cluster.metrics_store import stop_poller
 from utils.sidebar.helper import update_side_bar_labels, clear_session_state
 
 # ------------------------ß--------------------------------------------------
@@ -61,6 +62,7 @@ else:
 	).strip()
 
 if st.sidebar.button("Connect", use_container_width=True, type="secondary"):
+	stop_poller()
 	close_weaviate_client()
 	clear_session_state()
 	if use_local:
@@ -79,6 +81,7 @@ if st.sidebar.button("Connect", use_container_width=True, type="secondary"):
 
 if st.sidebar.button("Disconnect", use_container_width=True, type="primary"):
 	if st.session_state.get("client_ready"):
+		stop_poller()
 		message = close_weaviate_client()
 		clear_session_state()
 		st.rerun()
@@ -100,7 +103,8 @@ st.markdown("###### Any function with (APIs) means it is run using RESTful endpo
 # --------------------------------------------------------------------------
 col1, col2, col3 = st.columns([1, 1, 1])
 col4, col5, col6 = st.columns([1, 1, 1])
-col7, col8 = st.columns([1,1])
+col7, col8, col9 = st.columns([1, 1, 1])
+col10, col11, col12 = st.columns([1, 1, 1])
 
 # Dictionary: button name => action function
 button_actions = {
@@ -111,12 +115,17 @@ button_actions = {
 	"statistics": lambda: action_statistics(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
 	"metadata": lambda: action_metadata(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
 	"check_shard_consistency": action_check_shard_consistency,
+	"load_balance": action_load_balance,
+	"memory_estimate": lambda: action_memory_estimate(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
+	"compression_rollout": lambda: action_compression_rollout(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
+	"performance_lint": lambda: action_performance_lint(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
 	"read_repairs": lambda: action_read_repairs(st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key")),
 }
 
 with col1:
 	if st.button("Aggregate Collections & Tenants", use_container_width=True):
 		st.session_state["active_button"] = "aggregate_collections_tenants"
+		st.session_state.pop("aggregate_result", None)
 
 with col2:
 	if st.button("Collection Properties", use_container_width=True):
@@ -146,6 +155,24 @@ with col8:
 	if st.button("Read Repair (APIs)", use_container_width=True):
 		st.session_state["active_button"] = "read_repairs"
 
+with col9:
+	if st.button("Shard Load Balance", use_container_width=True):
+		st.session_state["active_button"] = "load_balance"
+
+with col10:
+	if st.button("Memory Estimate (APIs)", use_container_width=True):
+		st.session_state["active_button"] = "memory_estimate"
+		st.session_state.pop("memory_estimate", None)
+
+with col11:
+	if st.button("Compression Rollout (APIs)", use_container_width=True):
+		st.session_state["active_button"] = "compression_rollout"
+		st.session_state.pop("compression_candidates", None)
+
+with col12:
+	if st.button("Performance Lint (APIs)", use_container_width=True):
+		st.session_state["active_button"] = "performance_lint"
+
 st.markdown("---")
 
 # --------------------------------------------------------------------------
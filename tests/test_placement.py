@@ -0,0 +1,28 @@
+import pandas as pd
+from utils.multitenancy.placement import build_tenant_placement
+
+def shard_frame(rows):
+	return pd.DataFrame(rows, columns=["Node Name", "Shard Name", "Object Count"])
+
+def test_placement_counts_nodes_without_tenants():
+	shard_df = shard_frame([
+		("node-0", "tenant-a", 100),
+		("node-0", "tenant-b", 300),
+		("node-1", "tenant-c", 200),
+	])
+	tenant_states = {"tenant-a": "ACTIVE", "tenant-b": "ACTIVE", "tenant-c": "INACTIVE"}
+	placement = build_tenant_placement(shard_df, tenant_states, node_names=["node-0", "node-1", "node-2"])
+
+	node_df = placement["node_df"].set_index("Node Name")
+	assert list(node_df.loc["node-2", ["Tenants", "HOT Tenants", "Objects", "Largest Tenant (Objects)"]]) == [0, 0, 0, 0]
+	# Mean over three nodes: 1 tenant and 200 objects per node
+	assert placement["skew"]["Tenants"] == 2.0
+	assert placement["skew"]["Objects"] == 2.0
+	assert node_df.loc["node-2", "Objects vs Mean"] == 0.0
+
+def test_placement_without_node_names_uses_shard_nodes():
+	shard_df = shard_frame([("node-0", "tenant-a", 100), ("node-1", "tenant-b", 100)])
+	placement = build_tenant_placement(shard_df, {"tenant-a": "ACTIVE", "tenant-b": "ACTIVE"})
+
+	assert len(placement["node_df"]) == 2
+	assert placement["skew"] == {"Tenants": 1.0, "HOT Tenants": 1.0, "Objects": 1.0}
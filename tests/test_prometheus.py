@@ -0,0 +1,41 @@
+import math
+from pathlib import Path
+import pandas as pd
+from utils.cluster.prometheus import parse_prometheus_text, histogram_quantiles, metric_values
+
+FIXTURE = Path(__file__).parent / "fixtures" / "metrics.txt"
+
+def load_samples():
+	frames = [parse_prometheus_text(FIXTURE.read_text(), node=node) for node in ("weaviate-0", "weaviate-1")]
+	return pd.concat(frames, ignore_index=True)
+
+def test_parse_types_labels_and_buckets():
+	samples = parse_prometheus_text(FIXTURE.read_text(), node="weaviate-0")
+	assert len(samples) == 16
+	goroutines = samples[samples["metric"] == "go_goroutines"].iloc[0]
+	assert goroutines["type"] == "gauge"
+	assert goroutines["value"] == 412
+	buckets = samples[samples["metric"] == "queries_durations_ms_bucket"]
+	assert set(buckets["family"]) == {"queries_durations_ms"}
+	assert set(buckets["type"]) == {"histogram"}
+	assert math.isinf(buckets["le"].max())
+	assert "le=" not in buckets["labels"].iloc[0]
+	assert "shard_name=s1" in buckets["labels"].iloc[0]
+
+def test_histogram_quantiles_per_node():
+	quantiles = histogram_quantiles(load_samples(), "queries_durations_ms")
+	# Buckets of both shards are summed per node: 100 of 200 queries within 10 ms, 180 within 50 ms
+	assert list(quantiles["node"]) == ["weaviate-0", "weaviate-1"]
+	row = quantiles.iloc[0]
+	assert row["count"] == 200
+	assert row["p50"] == 10.0
+	assert row["p95"] == 75.0
+
+def test_histogram_quantiles_per_label_set():
+	quantiles = histogram_quantiles(load_samples(), "queries_durations_ms", by=("node", "labels"))
+	assert len(quantiles) == 4
+	assert set(quantiles["count"]) == {100}
+
+def test_metric_values_pivot():
+	values = metric_values(load_samples(), ["lsm_active_segments"])
+	assert values["lsm_active_segments"].sum() == 16
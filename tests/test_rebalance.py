@@ -0,0 +1,42 @@
+import pandas as pd
+from utils.cluster.rebalance import analyze_node_load, plan_replica_moves
+
+SHARD_COLUMNS = ["Node Name", "Class", "Shard Name", "Object Count", "Vector Queue Length", "Index Status"]
+
+def snapshot():
+	# Synthetic shard_data of process_shards_data: node-0 holds most objects, node-2 holds nothing
+	return pd.DataFrame([
+		("node-0", "Articles", "s1", 600, 10, "READY"),
+		("node-0", "Articles", "s2", 300, 0, "INDEXING"),
+		("node-0", "Products", "p1", 300, 5, "READY"),
+		("node-1", "Articles", "s3", 200, 0, "READY"),
+		("node-1", "Products", "p2", 100, 0, "READY"),
+	], columns=SHARD_COLUMNS)
+
+def test_node_load_flags_hot_node_and_keeps_empty_node():
+	load_df = analyze_node_load(snapshot(), hot_threshold=1.2, node_names=["node-0", "node-1", "node-2"]).set_index("Node Name")
+	assert list(load_df.index) == ["node-0", "node-1", "node-2"]
+	assert load_df.loc["node-0", "Objects"] == 1200
+	assert load_df.loc["node-0", "Indexing Shards"] == 1
+	assert load_df.loc["node-2", "Shards"] == 0
+	# Mean over three nodes is 500 objects
+	assert load_df.loc["node-0", "Objects vs Mean"] == 2.4
+	assert list(load_df["Hot"]) == [True, False, False]
+
+def test_node_load_without_shards():
+	empty = pd.DataFrame()
+	assert analyze_node_load(empty).empty
+	load_df = analyze_node_load(empty, node_names=["node-1", "node-0"])
+	assert sorted(load_df["Node Name"]) == ["node-0", "node-1"]
+	assert (load_df["Objects"] == 0).all()
+	assert not load_df["Hot"].any()
+
+def test_replica_moves_fill_the_empty_node():
+	moves_df, projected_df = plan_replica_moves(snapshot(), tolerance=0.1, node_names=["node-0", "node-1", "node-2"])
+	assert not moves_df.empty
+	projected = projected_df.set_index("Node Name")
+	assert projected.loc["node-2", "Objects Before"] == 0
+	assert projected.loc["node-2", "Objects After"] > 0
+	assert projected["Objects After"].sum() == 1500
+	assert projected["Objects After"].max() < 1200
+	assert set(moves_df["Source Node"]) == {"node-0"}
@@ -0,0 +1,62 @@
+import json
+import uuid
+from types import SimpleNamespace
+from utils.collections.reindex import copy_objects
+
+AUTHOR = uuid.UUID(int=1)
+TAGS = [uuid.UUID(int=2), uuid.UUID(int=3)]
+
+class FakeSource:
+	def __init__(self, objects):
+		self.objects = objects
+		self.iterator_kwargs = None
+
+	def iterator(self, **kwargs):
+		self.iterator_kwargs = kwargs
+		return iter(self.objects)
+
+class FakeTarget:
+	def __init__(self):
+		self.inserted = []
+		self.data = SimpleNamespace(insert_many=self.insert_many)
+
+	def insert_many(self, batch):
+		self.inserted.extend(batch)
+		return SimpleNamespace(errors={})
+
+def source_object(index, references):
+	return SimpleNamespace(
+		uuid=uuid.UUID(int=100 + index),
+		properties={"title": f"article {index}"},
+		vector={"default": [0.1, 0.2]},
+		references=references,
+	)
+
+def reference(uuids):
+	return SimpleNamespace(objects=[SimpleNamespace(uuid=value) for value in uuids])
+
+def test_copy_keeps_references(tmp_path):
+	source = FakeSource([
+		source_object(0, {"author": reference([AUTHOR]), "tags": reference(TAGS)}),
+		source_object(1, {"author": reference([]), "tags": None}),
+	])
+	target = FakeTarget()
+	checkpoint_file = str(tmp_path / "checkpoint.json")
+	result = copy_objects(source, target, checkpoint_file, batch_size=10, writers=1, reference_names=["author", "tags"], progress_interval=0.01)
+
+	assert result["copied"] == 2
+	assert [ref.link_on for ref in source.iterator_kwargs["return_references"]] == ["author", "tags"]
+	copied = {str(obj.uuid): obj for obj in target.inserted}
+	assert copied[str(uuid.UUID(int=100))].references == {"author": [AUTHOR], "tags": TAGS}
+	assert copied[str(uuid.UUID(int=101))].references is None
+	with open(checkpoint_file) as f:
+		assert json.load(f)["completed"]
+
+def test_copy_without_references(tmp_path):
+	source = FakeSource([source_object(0, None)])
+	target = FakeTarget()
+	copy_objects(source, target, str(tmp_path / "checkpoint.json"), writers=1, progress_interval=0.01)
+
+	assert source.iterator_kwargs["return_references"] is None
+	assert target.inserted[0].references is None
+	assert target.inserted[0].vector == [0.1, 0.2]
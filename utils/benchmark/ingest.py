@@ -0,0 +1,184 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from weaviate.classes.data import DataObject
+from utils.cluster.collection import create_collection_from_config, copy_collection_config
+from utils.cluster.cluster_operations import get_shards_info
+
+BATCH_MODES = ["fixed", "dynamic", "rate_limit"]
+
+# Tenant used when the source collection has multi-tenancy enabled
+SCRATCH_TENANT = "benchmark"
+
+# Objects generated at a time for the dynamic and rate-limited batching runs
+GENERATION_CHUNK = 1000
+
+VOCABULARY = np.array([
+	"alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet",
+	"kilo", "lima", "mike", "november", "oscar", "papa", "quebec", "romeo", "sierra", "tango",
+	"uniform", "victor", "whiskey", "xray", "yankee", "zulu", "vector", "index", "shard", "tenant",
+])
+
+def build_scratch_config(config, scratch_name):
+	"""
+	Copy of a collection config (as returned by fetch_collection_config) for a scratch collection.
+	Vectorizers are replaced by "none" so that synthetic vectors are imported as-is, and the
+	server-computed sharding fields are dropped.
+	"""
+	scratch = copy_collection_config(config, scratch_name)
+	if "vectorConfig" in scratch:
+		for vector_details in scratch["vectorConfig"].values():
+			vector_details["vectorizer"] = {"none": {}}
+	if "vectorizer" in scratch:
+		scratch["vectorizer"] = "none"
+	return scratch
+
+def _primitive_properties(config):
+	return [(prop["name"], prop["dataType"][0]) for prop in config.get("properties", []) if prop["dataType"][0][0].islower()]
+
+def generate_objects(config, count, dimensions, rng=None):
+	"""
+	Synthetic objects matching the collection properties (references are skipped) with random float32 vectors.
+	dimensions maps each vector name ("default" for a single vector) to its size.
+	"""
+	rng = rng or np.random.default_rng()
+	vectors = {name: rng.standard_normal((count, dims), dtype=np.float32) for name, dims in dimensions.items() if dims}
+	columns = {}
+	now = datetime.now(timezone.utc)
+	for name, data_type in _primitive_properties(config):
+		if data_type in ("text", "string"):
+			words = VOCABULARY[rng.integers(0, len(VOCABULARY), (count, 8))]
+			columns[name] = [" ".join(row) for row in words]
+		elif data_type in ("text[]", "string[]"):
+			columns[name] = VOCABULARY[rng.integers(0, len(VOCABULARY), (count, 3))].tolist()
+		elif data_type == "int":
+			columns[name] = rng.integers(0, 1_000_000, count).tolist()
+		elif data_type == "int[]":
+			columns[name] = rng.integers(0, 1_000_000, (count, 3)).tolist()
+		elif data_type == "number":
+			columns[name] = rng.random(count).tolist()
+		elif data_type == "number[]":
+			columns[name] = rng.random((count, 3)).tolist()
+		elif data_type == "boolean":
+			columns[name] = (rng.random(count) < 0.5).tolist()
+		elif data_type == "date":
+			columns[name] = [(now - timedelta(seconds=int(seconds))).isoformat() for seconds in rng.integers(0, 365 * 86400, count)]
+		elif data_type == "uuid":
+			columns[name] = [str(uuid.uuid4()) for _ in range(count)]
+
+	objects = []
+	for i in range(count):
+		vector = {name: values[i].tolist() for name, values in vectors.items()}
+		if list(vector) == ["default"]:
+			vector = vector["default"]
+		objects.append({
+			"properties": {name: values[i] for name, values in columns.items()},
+			"vector": vector or None,
+			"uuid": str(uuid.uuid4()),
+		})
+	return objects
+
+def iter_object_batches(config, count, dimensions, batch_size, rng=None):
+	# Generate the synthetic objects one batch at a time so that only one batch is held in memory
+	rng = rng or np.random.default_rng()
+	for start in range(0, count, batch_size):
+		yield generate_objects(config, min(batch_size, count - start), dimensions, rng)
+
+def import_objects(collection, object_batches, mode, batch_size=100, requests_per_minute=600):
+	"""
+	Import batches of objects with fixed size batches (insert_many per batch, so each batch latency is measured),
+	the client's dynamic batching or its rate-limited batching. Batches are generated lazily. With fixed batching
+	the generation time between the batches is left out of the throughput; the client batchers send in the
+	background while the next chunk is generated, so their wall-clock time is kept and no batch latency is reported.
+	"""
+	batch_latencies = []
+	failed = 0
+	imported = 0
+	generation_seconds = 0.0
+	start = time.perf_counter()
+
+	def timed_batches():
+		nonlocal generation_seconds
+		batches = iter(object_batches)
+		while True:
+			generation_start = time.perf_counter()
+			chunk = next(batches, None)
+			generation_seconds += time.perf_counter() - generation_start
+			if chunk is None:
+				return
+			yield chunk
+
+	if mode == "fixed":
+		for chunk in timed_batches():
+			batch_start = time.perf_counter()
+			result = collection.data.insert_many([
+				DataObject(properties=obj["properties"], vector=obj["vector"], uuid=obj["uuid"]) for obj in chunk
+			])
+			batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+			failed += len(result.errors)
+			imported += len(chunk)
+	else:
+		batcher = collection.batch.dynamic() if mode == "dynamic" else collection.batch.rate_limit(requests_per_minute=requests_per_minute)
+		with batcher as batch:
+			for chunk in object_batches:
+				for obj in chunk:
+					batch.add_object(properties=obj["properties"], vector=obj["vector"], uuid=obj["uuid"])
+				imported += len(chunk)
+		failed = len(collection.batch.failed_objects)
+	elapsed = time.perf_counter() - start - generation_seconds
+	return {
+		"objects": imported,
+		"failed": failed,
+		"seconds": round(elapsed, 2),
+		"objects_per_second": round((imported - failed) / elapsed, 1) if elapsed else 0.0,
+		"batch_p50_ms": round(float(np.percentile(batch_latencies, 50)), 1) if batch_latencies else None,
+		"batch_p95_ms": round(float(np.percentile(batch_latencies, 95)), 1) if batch_latencies else None,
+	}
+
+# Vector index queue left behind by the import, summed over the scratch collection's shards
+def scratch_queue_backlog(client, scratch_name):
+	backlog = 0
+	for node in get_shards_info(client):
+		for shard in node.shards:
+			if shard.collection == scratch_name:
+				backlog += shard.vector_queue_length or 0
+	return backlog
+
+def run_ingest_benchmark(client, cluster_url, api_key, config, dimensions, runs, object_count=10000, requests_per_minute=600, progress_callback=None):
+	"""
+	For each (mode, batch_size) run: create a scratch collection matching config, import object_count synthetic
+	objects, record throughput, batch latency and the vector queue backlog, then delete the scratch collection.
+	A run whose scratch collection cannot be created is reported with its error and still counts as done.
+	"""
+	multi_tenancy = config.get("multiTenancyConfig", {}).get("enabled", False)
+	rng = np.random.default_rng()
+	results = []
+	for index, (mode, batch_size) in enumerate(runs):
+		scratch_name = f"{config['class']}_IngestBenchmark_{uuid.uuid4().hex[:8]}"
+		created = create_collection_from_config(cluster_url, api_key, build_scratch_config(config, scratch_name))
+		if "error" in created:
+			print(f"Error creating scratch collection '{scratch_name}': {created['error']}")
+			results.append({"mode": mode, "batch_size": batch_size, "error": created["error"]})
+		else:
+			try:
+				collection = client.collections.get(scratch_name)
+				if multi_tenancy:
+					collection.tenants.create(SCRATCH_TENANT)
+					collection = collection.with_tenant(SCRATCH_TENANT)
+				# Fixed batching imports one generated batch per request, the client batchers take larger chunks
+				chunk_size = batch_size if mode == "fixed" else GENERATION_CHUNK
+				object_batches = iter_object_batches(config, object_count, dimensions, chunk_size, rng)
+				result = import_objects(collection, object_batches, mode, batch_size=batch_size, requests_per_minute=requests_per_minute)
+				result["vector_queue_backlog"] = scratch_queue_backlog(client, scratch_name)
+				results.append({"mode": mode, "batch_size": batch_size if mode == "fixed" else None, **result, "error": ""})
+			except Exception as e:
+				results.append({"mode": mode, "batch_size": batch_size, "error": str(e)})
+			finally:
+				try:
+					client.collections.delete(scratch_name)
+				except Exception as e:
+					print(f"Error deleting scratch collection '{scratch_name}': {e}")
+		if progress_callback:
+			progress_callback(index + 1, len(runs))
+	return results
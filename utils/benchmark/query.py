@@ -0,0 +1,155 @@
+import json
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pandas as pd
+from weaviate.classes.query import Filter, MetadataQuery
+
+# Local file collecting the results of every benchmark run (one JSON object per line)
+RESULTS_PATH = os.path.join("benchmark_results", "query_benchmarks.jsonl")
+
+WORKLOADS = ["fetch_objects", "near_vector", "bm25", "hybrid", "filtered"]
+
+def get_benchmark_collection(client, collection_name, tenant_name=None):
+	collection = client.collections.get(collection_name)
+	if tenant_name:
+		collection = collection.with_tenant(tenant_name)
+	return collection
+
+def sample_query_inputs(collection, sample_size=100, vector_name=None):
+	"""
+	Sample objects to build realistic query inputs: vectors for near_vector/hybrid, words from text properties
+	for bm25/hybrid and property values for filters.
+	"""
+	result = collection.query.fetch_objects(limit=sample_size, include_vector=True)
+	vectors, words, values = [], [], {}
+	for obj in result.objects:
+		if obj.vector:
+			vector = obj.vector.get(vector_name) if vector_name else next(iter(obj.vector.values()))
+			if vector:
+				vectors.append(vector)
+		for name, value in (obj.properties or {}).items():
+			if isinstance(value, str):
+				words.extend(word for word in value.split()[:20] if word.isalnum())
+			if isinstance(value, (str, int, float, bool)):
+				values.setdefault(name, []).append(value)
+	return {"vectors": vectors, "words": words or ["the"], "values": values}
+
+def build_query(collection, workload, inputs, limit=10, filter_property=None, vector_name=None, alpha=0.5):
+	"""
+	Return a no-argument callable running one query of the given workload with inputs sampled at random.
+	"""
+	if workload == "fetch_objects":
+		return lambda: collection.query.fetch_objects(limit=limit, return_properties=[])
+	if workload == "near_vector":
+		if not inputs["vectors"]:
+			raise ValueError("No vectors sampled for near_vector")
+		return lambda: collection.query.near_vector(
+			near_vector=random.choice(inputs["vectors"]),
+			target_vector=vector_name,
+			limit=limit,
+			return_metadata=MetadataQuery(distance=True),
+			return_properties=[]
+		)
+	if workload == "bm25":
+		return lambda: collection.query.bm25(query=random.choice(inputs["words"]), limit=limit, return_properties=[])
+	if workload == "hybrid":
+		def hybrid():
+			vector = random.choice(inputs["vectors"]) if inputs["vectors"] else None
+			return collection.query.hybrid(
+				query=random.choice(inputs["words"]),
+				vector=vector,
+				target_vector=vector_name if vector is not None else None,
+				alpha=alpha,
+				limit=limit,
+				return_properties=[]
+			)
+		return hybrid
+	if workload == "filtered":
+		values = inputs["values"].get(filter_property)
+		if not filter_property or not values:
+			raise ValueError("No values sampled for the filter property")
+		return lambda: collection.query.fetch_objects(
+			filters=Filter.by_property(filter_property).equal(random.choice(values)),
+			limit=limit,
+			return_properties=[]
+		)
+	raise ValueError(f"Unknown workload: {workload}")
+
+def run_workload(query_fn, requests_count=200, concurrency=4):
+	"""
+	Run query_fn requests_count times with concurrency threads.
+	Returns QPS, p50/p95/p99 latency in ms and the error rate.
+	"""
+	def timed_call(_):
+		start = time.perf_counter()
+		try:
+			query_fn()
+			return (time.perf_counter() - start) * 1000, None
+		except Exception as e:
+			return (time.perf_counter() - start) * 1000, str(e)
+
+	start = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=concurrency) as executor:
+		results = list(executor.map(timed_call, range(requests_count)))
+	elapsed = time.perf_counter() - start
+
+	latencies = pd.Series([latency for latency, error in results if error is None], dtype="float64")
+	errors = [error for _, error in results if error is not None]
+	return {
+		"requests": requests_count,
+		"concurrency": concurrency,
+		"qps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+		"p50_ms": round(latencies.quantile(0.50), 2) if not latencies.empty else None,
+		"p95_ms": round(latencies.quantile(0.95), 2) if not latencies.empty else None,
+		"p99_ms": round(latencies.quantile(0.99), 2) if not latencies.empty else None,
+		"error_rate": round(len(errors) / requests_count, 4),
+		"first_error": errors[0] if errors else "",
+	}
+
+def run_benchmark(collection, workloads, concurrency_levels, requests_count=200, limit=10, sample_size=100, filter_property=None, vector_name=None, progress_callback=None):
+	"""
+	Run every workload at every concurrency level against the collection (or tenant).
+	Returns one result row per workload and concurrency level.
+	"""
+	inputs = sample_query_inputs(collection, sample_size=sample_size, vector_name=vector_name)
+	results = []
+	total = len(workloads) * len(concurrency_levels)
+	for workload in workloads:
+		try:
+			query_fn = build_query(collection, workload, inputs, limit=limit, filter_property=filter_property, vector_name=vector_name)
+		except ValueError as e:
+			for concurrency in concurrency_levels:
+				results.append({"workload": workload, "concurrency": concurrency, "requests": 0, "error_rate": 1.0, "first_error": str(e)})
+			continue
+		for concurrency in concurrency_levels:
+			result = run_workload(query_fn, requests_count=requests_count, concurrency=concurrency)
+			results.append({"workload": workload, **result})
+			if progress_callback:
+				progress_callback(len(results), total)
+	return results
+
+def save_benchmark_results(results, collection_name, tenant_name=None, server_version=None, label="", path=RESULTS_PATH):
+	run_id = uuid.uuid4().hex[:8]
+	timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "a") as f:
+		for result in results:
+			f.write(json.dumps({
+				"run_id": run_id,
+				"timestamp": timestamp,
+				"label": label,
+				"server_version": server_version,
+				"collection": collection_name,
+				"tenant": tenant_name,
+				**result
+			}) + "\n")
+	return run_id
+
+def load_benchmark_results(path=RESULTS_PATH):
+	if not os.path.exists(path):
+		return pd.DataFrame()
+	return pd.read_json(path, lines=True)
@@ -0,0 +1,163 @@
+import time
+import numpy as np
+import pandas as pd
+from utils.cluster.collection import fetch_collection_config, update_collection_config, get_vector_index_config
+from utils.benchmark.query import get_benchmark_collection
+
+SUPPORTED_DISTANCES = ["cosine", "dot", "l2-squared"]
+
+def sample_corpus(collection, corpus_size=50000, vector_name=None):
+	"""
+	Read up to corpus_size vectors with the cursor API. Objects are returned in UUID order, so for random
+	(v4) UUIDs the first corpus_size objects are a uniform sample of the collection.
+	Returns (uuids, float32 matrix).
+	"""
+	uuids, vectors = [], []
+	for obj in collection.iterator(include_vector=True, return_properties=[]):
+		vector = obj.vector.get(vector_name) if vector_name else next(iter(obj.vector.values()), None)
+		if vector is not None:
+			uuids.append(str(obj.uuid))
+			vectors.append(vector)
+		if len(uuids) >= corpus_size:
+			break
+	return uuids, np.asarray(vectors, dtype=np.float32)
+
+def _prepare(vectors, distance):
+	if distance == "cosine":
+		norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+		return vectors / np.where(norms == 0, 1, norms)
+	return vectors
+
+def exact_top_k(corpus, queries, k, distance="cosine", block_size=256):
+	"""
+	Exact top-k row indices of corpus for each query, by brute force in blocks of queries.
+	cosine and dot rank by (normalized) dot product, l2-squared by squared euclidean distance.
+	"""
+	if distance not in SUPPORTED_DISTANCES:
+		raise ValueError(f"Unsupported distance for ground truth: {distance}")
+	corpus = _prepare(corpus, distance)
+	queries = _prepare(queries, distance)
+	k = min(k, len(corpus))
+	corpus_sq_norms = (corpus * corpus).sum(axis=1) if distance == "l2-squared" else None
+	results = np.empty((len(queries), k), dtype=np.int64)
+	for start in range(0, len(queries), block_size):
+		block = queries[start:start + block_size]
+		scores = block @ corpus.T
+		if distance == "l2-squared":
+			# argmin ||q - c||^2 == argmax (2 q.c - ||c||^2)
+			scores = 2 * scores - corpus_sq_norms
+		top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+		order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+		results[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+	return results
+
+# HNSW settings of a vector index config; the dynamic index keeps them in its "hnsw" sub-config
+def hnsw_config(index_config):
+	return index_config["hnsw"] if isinstance(index_config.get("hnsw"), dict) else index_config
+
+def set_ef(cluster_url, api_key, collection_name, ef, vector_name=None):
+	# Patch only ef on the current config so that concurrent changes to other settings are kept
+	config = fetch_collection_config(cluster_url, api_key, collection_name)
+	if "error" in config:
+		return config
+	index_config = get_vector_index_config(config, vector_name)
+	if index_config is None:
+		return {"error": "Vector index config not found"}
+	hnsw_config(index_config)["ef"] = ef
+	return update_collection_config(cluster_url, api_key, config)
+
+def run_ann_queries(collection, queries, k, vector_name=None):
+	"""
+	near_vector top-k for each query. Returns (result uuids per query, latencies in ms).
+	"""
+	result_ids, latencies = [], []
+	for query in queries:
+		start = time.perf_counter()
+		response = collection.query.near_vector(
+			near_vector=query.tolist(),
+			target_vector=vector_name,
+			limit=k,
+			return_properties=[]
+		)
+		latencies.append((time.perf_counter() - start) * 1000)
+		result_ids.append([str(obj.uuid) for obj in response.objects])
+	return result_ids, latencies
+
+def sample_recall(result_ids, ranked_ids, corpus_ids):
+	"""
+	Recall of one query measured inside the corpus sample. The m results that belong to the corpus are compared
+	with the exact top-m of the corpus: a perfect index returns exactly those, and every true neighbour it misses
+	inside the corpus pushes one of them out. With a corpus covering the collection m = k and this is recall@k.
+	Returns None when no result is in the corpus.
+	"""
+	in_corpus = [uuid for uuid in result_ids if uuid in corpus_ids]
+	if not in_corpus:
+		return None
+	return len(set(in_corpus) & set(ranked_ids[:len(in_corpus)])) / len(in_corpus)
+
+def tune_ef(client, cluster_url, api_key, config, collection_name, ef_values, k=10, query_count=100, corpus_size=50000, tenant_name=None, vector_name=None, settle_seconds=2.0, progress_callback=None):
+	"""
+	Measure recall@k against latency for each ef value.
+	Queries are corpus vectors, so each query's own object is dropped from both the ANN results (k + 1 are
+	requested) and the exact ranking. Recall is measured inside the sampled corpus (see sample_recall): exact when
+	the corpus covers the whole collection and an estimate otherwise.
+	Only ef is changed, and the original ef is restored at the end.
+	"""
+	index_config = get_vector_index_config(config, vector_name)
+	if index_config is None:
+		raise ValueError("Vector index config not found")
+	distance = index_config.get("distance", "cosine")
+	if distance not in SUPPORTED_DISTANCES:
+		raise ValueError(f"Unsupported distance for ground truth: {distance}")
+	original_ef = hnsw_config(index_config).get("ef", -1)
+
+	collection = get_benchmark_collection(client, collection_name, tenant_name)
+	total_count = collection.aggregate.over_all(total_count=True).total_count
+	uuids, corpus = sample_corpus(collection, corpus_size, vector_name)
+	if len(uuids) < 2:
+		raise ValueError("Not enough vectors found in the collection")
+	rng = np.random.default_rng()
+	query_rows = rng.choice(len(corpus), size=min(query_count, len(corpus)), replace=False)
+	queries = corpus[query_rows]
+
+	runs = []
+	try:
+		for index, ef in enumerate(ef_values):
+			updated = set_ef(cluster_url, api_key, collection_name, ef, vector_name)
+			if "error" in updated:
+				raise Exception(updated["error"])
+			time.sleep(settle_seconds)
+			result_ids, latencies = run_ann_queries(collection, queries, k + 1, vector_name)
+			result_ids = [[uuid for uuid in ids if uuid != uuids[row]][:k] for ids, row in zip(result_ids, query_rows)]
+			runs.append({"ef": ef, "result_ids": result_ids, "latencies": latencies})
+			if progress_callback:
+				progress_callback(index + 1, len(ef_values))
+	finally:
+		restored = set_ef(cluster_url, api_key, collection_name, original_ef, vector_name)
+		if "error" in restored:
+			print(f"Error restoring ef={original_ef} on '{collection_name}': {restored['error']}")
+
+	corpus_ids = set(uuids)
+	ground_truth = exact_top_k(corpus, queries, k + 1, distance)
+	ranked = [[uuids[i] for i in top if i != row][:k] for top, row in zip(ground_truth, query_rows)]
+
+	rows = []
+	for run in runs:
+		recalls = [sample_recall(ids, truth, corpus_ids) for ids, truth in zip(run["result_ids"], ranked)]
+		recalls = [recall for recall in recalls if recall is not None]
+		latencies = pd.Series(run["latencies"])
+		rows.append({
+			"ef": run["ef"],
+			"recall": round(float(np.mean(recalls)), 4) if recalls else None,
+			"p50_ms": round(latencies.quantile(0.50), 2),
+			"p95_ms": round(latencies.quantile(0.95), 2),
+			"p99_ms": round(latencies.quantile(0.99), 2),
+		})
+	return {
+		"results": pd.DataFrame(rows),
+		"distance": distance,
+		"original_ef": original_ef,
+		"corpus_size": len(uuids),
+		"total_count": total_count,
+		"exact": len(uuids) >= total_count,
+	}
@@ -0,0 +1,83 @@
+import time
+import pandas as pd
+
+SHARD_KEYS = ["node", "collection", "shard"]
+
+# Shard samples (same columns as the metrics store) from one nodes verbose snapshot
+def shard_samples_from_nodes(node_info, ts=None):
+	ts = ts or time.time()
+	rows = []
+	for node in node_info:
+		for shard in node.shards:
+			rows.append({
+				"ts": ts,
+				"node": node.name,
+				"collection": shard.collection,
+				"shard": shard.name,
+				"queue_length": shard.vector_queue_length,
+				"index_status": shard.vector_indexing_status,
+			})
+	return pd.DataFrame(rows)
+
+def compute_queue_drain(samples, keys=SHARD_KEYS, stall_seconds=300):
+	"""
+	Drain rate of the async vector index queue from successive samples (ts, keys..., queue_length, index_status).
+	Rate is objects/s leaving the queue between the first and last sample (negative when growing), ETA is the
+	last queue length divided by that rate. A queue is stalled when it is not empty and did not shrink during
+	the last stall_seconds.
+	"""
+	if samples.empty:
+		return pd.DataFrame()
+
+	df = samples.sort_values("ts").copy()
+	df["queue_length"] = pd.to_numeric(df["queue_length"], errors="coerce").fillna(0)
+	grouped = df.groupby(keys)
+	summary = grouped.agg(
+		samples=("ts", "size"),
+		first_ts=("ts", "first"),
+		last_ts=("ts", "last"),
+		first_queue=("queue_length", "first"),
+		last_queue=("queue_length", "last"),
+		status=("index_status", "last"),
+	)
+
+	recent = df[df["ts"] >= grouped["ts"].transform("max") - stall_seconds].groupby(keys).agg(
+		recent_first_queue=("queue_length", "first"),
+		recent_last_queue=("queue_length", "last"),
+	)
+	summary = summary.join(recent)
+
+	duration = summary["last_ts"] - summary["first_ts"]
+	summary["drain_rate"] = ((summary["first_queue"] - summary["last_queue"]) / duration.where(duration > 0)).round(2)
+	summary["eta_seconds"] = (summary["last_queue"] / summary["drain_rate"].where(summary["drain_rate"] > 0)).round(0)
+
+	alert = pd.Series("", index=summary.index)
+	alert[summary["last_queue"] > summary["first_queue"]] = "GROWING"
+	stalled = (summary["last_queue"] > 0) & (summary["recent_last_queue"] >= summary["recent_first_queue"]) & (duration >= stall_seconds)
+	alert[stalled & (alert == "")] = "STALLED"
+	alert[(summary["last_queue"] == 0)] = ""
+	summary["alert"] = alert
+
+	result = summary.reset_index()[keys + ["status", "samples", "last_queue", "drain_rate", "eta_seconds", "alert"]]
+	result = result.rename(columns={
+		"node": "Node Name",
+		"collection": "Collection",
+		"shard": "Shard Name",
+		"status": "Index Status",
+		"samples": "Samples",
+		"last_queue": "Vector Queue Length",
+		"drain_rate": "Drain Rate (objects/s)",
+		"eta_seconds": "ETA (s)",
+		"alert": "Alert",
+	})
+	return result.sort_values("Vector Queue Length", ascending=False)
+
+# Same as compute_queue_drain, with the queues of each node summed per sample
+def compute_node_queue_drain(samples, stall_seconds=300):
+	if samples.empty:
+		return pd.DataFrame()
+	per_node = samples.assign(queue_length=pd.to_numeric(samples["queue_length"], errors="coerce").fillna(0)).groupby(["ts", "node"]).agg(
+		queue_length=("queue_length", "sum"),
+		index_status=("index_status", lambda statuses: "INDEXING" if (statuses == "INDEXING").any() else statuses.iloc[-1]),
+	).reset_index()
+	return compute_queue_drain(per_node, keys=["node"], stall_seconds=stall_seconds)
@@ -2,7 +2,17 @@ import pandas as pd
 import streamlit as st
 import requests
 import time
-from utils.cluster.collection import aggregate_collections, get_schema, list_collections, process_collection_config, fetch_collection_config, get_collectios_count
+from utils.cluster.collection import aggregate_collections, get_schema, list_collections, process_collection_config, fetch_collection_config, fetch_all_collection_configs, get_collectios_count
+from utils.cluster.memory import COMPRESSIONS, collect_vector_dimensions, estimate_memory, summarize_memory
+from utils.cluster.lint import collection_object_counts, async_indexing_observed, lint_collections
+from utils.cluster.compression import INDEX_COMPRESSIONS, list_compression_candidates, select_compression_targets, apply_compression_rollout, compression_progress, compression_training_limit
+from utils.cluster.rebalance import analyze_node_load, plan_replica_moves
+from utils.cluster.prometheus import default_metrics_url, scrape_metrics, histogram_quantiles, metric_values
+from utils.cluster.raft import raft_samples_from_statistics, compute_raft_lag
+from utils.cluster.replication import validate_moves, execute_replication_plan
+from utils.collections.data import get_tenant_names
+from utils.collections.properties import collect_property_stats
+from utils.collections.delete import plan_prune, prune_empty_collections_and_tenants
 from utils.cluster.cluster_operations import fetch_cluster_statistics, process_statistics, get_shards_info, process_shards_data, get_metadata, check_shard_consistency, read_repairs
 
 # --------------------------------------------------------------------------
@@ -58,9 +68,169 @@ def action_nodes_and_shards():
 						st.error(f"Failed to update shards in '{collection_name}': {e}")
 		else:
 			st.info("No read-only shards found in the cluster.")
+
+		prometheus_panels()
 	else:
 		st.error("Failed to retrieve node and shard details.")
 
+# Latency, memory and LSM panels from the Prometheus /metrics endpoint of each node.
+def prometheus_panels():
+	st.markdown("#### Prometheus Metrics (APIs)")
+	st.markdown("###### Requires PROMETHEUS_MONITORING_ENABLED=true on the nodes. Enter one /metrics URL per node.")
+	urls_text = st.text_area(
+		"Metrics URLs",
+		value=st.session_state.get("metrics_urls", default_metrics_url(st.session_state.cluster_endpoint)),
+		key="metrics_urls_input"
+	)
+	if st.button("Scrape Metrics", use_container_width=True):
+		st.session_state.metrics_urls = urls_text
+		urls = [url.strip() for url in urls_text.splitlines() if url.strip()]
+		with st.spinner("Scraping metrics..."):
+			samples, errors = scrape_metrics(urls)
+		for error in errors:
+			st.error(f"Failed to scrape {error}")
+		if samples.empty:
+			st.warning("No metrics scraped.")
+			return
+
+		st.markdown("##### Query Latency (ms)")
+		query_latency = histogram_quantiles(samples, "queries_durations_ms")
+		if not query_latency.empty:
+			st.dataframe(query_latency, use_container_width=True)
+		else:
+			st.info("No query duration histograms found.")
+
+		st.markdown("##### Batch Latency (ms)")
+		batch_latency = histogram_quantiles(samples, "batch_durations_ms")
+		if not batch_latency.empty:
+			st.dataframe(batch_latency, use_container_width=True)
+		else:
+			st.info("No batch duration histograms found.")
+
+		st.markdown("##### Memory & Goroutines")
+		memory = metric_values(samples, ["go_memstats_heap_inuse_bytes", "go_memstats_heap_alloc_bytes", "go_goroutines"])
+		if not memory.empty:
+			st.dataframe(memory, use_container_width=True)
+
+		st.markdown("##### Vector Index Size")
+		vector_index = metric_values(samples, ["vector_index_size", "vector_index_tombstones", "vector_index_queue_delete_count"])
+		if not vector_index.empty:
+			st.dataframe(vector_index, use_container_width=True)
+
+		st.markdown("##### LSM Segments & Compaction")
+		lsm = metric_values(samples, ["lsm_segment_count", "lsm_active_segments", "lsm_segment_objects", "lsm_segment_size"])
+		if not lsm.empty:
+			st.dataframe(lsm, use_container_width=True)
+		compaction = histogram_quantiles(samples, "lsm_bucket_compaction_duration_ms")
+		if not compaction.empty:
+			st.dataframe(compaction, use_container_width=True)
+
+# Analyze per-node load and plan replica moves to even out objects per node.
+def action_load_balance():
+	print("Analyzing shard load balance...")
+	node_info = get_shards_info(st.session_state.client)
+	if not node_info:
+		st.error("Failed to retrieve node and shard details.")
+		return
+	shard_table = process_shards_data(node_info)["shard_data"]
+	if shard_table.empty:
+		st.warning("No shard details available.")
+		return
+
+	col1, col2, col3 = st.columns(3)
+	with col1:
+		hot_threshold = st.number_input("Hot node threshold (x mean objects)", min_value=1.0, value=1.2, step=0.05, key="balance_hot_threshold")
+	with col2:
+		tolerance = st.number_input("Balance tolerance (fraction of mean)", min_value=0.0, max_value=1.0, value=0.1, step=0.05, key="balance_tolerance")
+	with col3:
+		max_moves = st.number_input("Max replica moves", min_value=1, max_value=10000, value=100, key="balance_max_moves")
+
+	# Nodes without shards are part of the balance too, e.g. a newly added empty node
+	node_names = [node.name for node in node_info]
+	load_table = analyze_node_load(shard_table, hot_threshold=hot_threshold, node_names=node_names)
+	st.markdown("#### Node Load")
+	hot_nodes = load_table[load_table["Hot"]]["Node Name"].tolist()
+	if hot_nodes:
+		st.warning(f"Hot node(s): **{', '.join(hot_nodes)}**")
+	else:
+		st.success("No hot nodes found.")
+	st.dataframe(load_table, use_container_width=True)
+
+	# Keep the reviewed plan so that the rerun of the Execute click runs this plan and not a recomputed one
+	plan_params = (tolerance, int(max_moves))
+	plan = st.session_state.get("rebalance_plan")
+	if plan is None or plan["params"] != plan_params:
+		moves_table, projected_table = plan_replica_moves(shard_table, tolerance=tolerance, max_moves=int(max_moves), node_names=node_names)
+		plan = {"params": plan_params, "moves": moves_table, "projected": projected_table}
+		st.session_state.rebalance_plan = plan
+	moves_table, projected_table = plan["moves"], plan["projected"]
+
+	st.markdown("#### Rebalancing Plan")
+	if st.button("Recompute Plan", key="rebalance_recompute"):
+		st.session_state.pop("rebalance_plan", None)
+		st.rerun()
+	if moves_table.empty:
+		st.info("No replica moves needed (or possible) within the given tolerance.")
+		return
+	st.markdown(f"###### {len(moves_table)} replica move(s) through the replication API (/v1/replication/replicate):")
+	st.dataframe(moves_table.astype(str), use_container_width=True)
+	st.markdown("##### Projected Objects per Node")
+	st.dataframe(projected_table, use_container_width=True)
+	execute_rebalance_plan(node_info, moves_table)
+
+# Run the replica moves of a rebalancing plan through the replication API.
+def execute_rebalance_plan(node_info, moves_table):
+	st.markdown("#### Execute Plan (APIs)")
+	col1, col2, col3, col4 = st.columns(4)
+	with col1:
+		replication_type = st.selectbox("Operation", ["MOVE", "COPY"], key="replication_type")
+	with col2:
+		max_in_flight = st.number_input("Operations in flight", min_value=1, max_value=32, value=2, key="replication_in_flight")
+	with col3:
+		poll_interval = st.number_input("Poll interval (seconds)", min_value=1.0, max_value=300.0, value=5.0, step=1.0, key="replication_poll_interval")
+	with col4:
+		max_errors = st.number_input("Abort after errors", min_value=1, max_value=100, value=3, key="replication_max_errors")
+	operation_timeout = st.number_input("Cancel an operation after (minutes)", min_value=1, max_value=1440, value=60, key="replication_timeout")
+
+	st.warning("⬇️ This operation requires administrator privileges and a Weaviate version with the replication API. Please ensure you are connected with an admin API key.")
+	if st.button("Execute Rebalancing Plan", type="primary", use_container_width=True):
+		moves, invalid_moves = validate_moves(node_info, moves_table.to_dict("records"))
+		if invalid_moves:
+			st.warning(f"Skipping {len(invalid_moves)} move(s) that do not match the current shard placement.")
+			st.dataframe(pd.DataFrame(invalid_moves).astype(str), use_container_width=True)
+		if not moves:
+			st.error("No valid moves to execute.")
+			return
+
+		progress_bar = st.progress(0.0)
+		summary_container = st.empty()
+		operations_container = st.empty()
+
+		def on_progress(operations, summary):
+			progress_bar.progress((summary["Completed"] + summary["Failed"]) / len(moves))
+			summary_container.dataframe(pd.DataFrame([summary]).astype(str), use_container_width=True)
+			if operations:
+				operations_container.dataframe(pd.DataFrame(operations).astype(str), use_container_width=True)
+
+		operations, summary = execute_replication_plan(
+			st.session_state.cluster_endpoint,
+			st.session_state.cluster_api_key,
+			moves,
+			replication_type=replication_type,
+			max_in_flight=int(max_in_flight),
+			poll_interval=poll_interval,
+			max_errors=int(max_errors),
+			operation_timeout=operation_timeout * 60,
+			progress_callback=on_progress
+		)
+		if summary["Aborted"]:
+			st.error(f"Execution aborted after {summary['Failed']} failed or timed out operation(s), the operations in flight were cancelled.")
+		elif summary["Failed"]:
+			st.warning(f"{summary['Completed']} operation(s) completed, {summary['Failed']} failed.")
+		else:
+			st.success(f"{summary['Completed']} operation(s) completed ({summary['Objects/s']} objects/s).")
+		st.session_state.pop("rebalance_plan", None)
+
 # Check for shard consistency.
 def action_check_shard_consistency():
 	print("Checking shard consistency...")
@@ -77,14 +247,219 @@ def action_check_shard_consistency():
 	else:
 		st.error("Failed to retrieve node and shard details.")
 
+# Estimate vector index memory per node, collection and tenant with the projected savings of each compression type.
+def action_memory_estimate(cluster_endpoint, api_key):
+	print("Estimating vector index memory...")
+	st.markdown("###### Estimates are based on object counts from nodes verbose, vector dimensions (module config or one sampled object) and each vector's index type, compression and maxConnections. Actual usage also depends on caches, deleted objects and the LSM stores.")
+	# Keep the estimate in session state so that reruns do not sample every collection again
+	if "memory_estimate" not in st.session_state:
+		with st.spinner("Collecting shards, configs and vector dimensions..."):
+			node_info = get_shards_info(st.session_state.client)
+			if not node_info:
+				st.error("Failed to retrieve node and shard details.")
+				return
+			shard_table = process_shards_data(node_info)["shard_data"]
+			configs = fetch_all_collection_configs(cluster_endpoint, api_key)
+			if "error" in configs:
+				st.error(configs["error"])
+				return
+			dimensions = collect_vector_dimensions(st.session_state.client, configs, shard_table)
+			st.session_state.memory_estimate = estimate_memory(shard_table, configs, dimensions)
+	estimate = st.session_state.memory_estimate
+	if estimate.empty:
+		st.warning("No shard details available.")
+		return
+
+	total_mb = estimate["Total Bytes"].sum() / 1024**2
+	st.markdown(f"###### Estimated Vector Index Memory (all replicas): **{total_mb:,.1f} MB**")
+	unknown = sorted(estimate[estimate["Dimensions"].isna()]["Collection"].unique())
+	if unknown:
+		st.warning(f"Vector dimensions unknown (no vectorizer dimensions and no stored objects) for: **{', '.join(unknown)}**")
+
+	st.markdown("#### Per Node")
+	st.dataframe(summarize_memory(estimate, "Node Name"), use_container_width=True)
+	st.markdown("#### Per Collection")
+	collection_summary = summarize_memory(estimate, ["Collection", "Vector", "Index Type", "Compression"])
+	st.dataframe(collection_summary, use_container_width=True)
+
+	tenants = estimate[estimate["Tenant"] != ""]
+	if not tenants.empty:
+		st.markdown("#### Per Tenant")
+		selected = st.selectbox("Multi-tenant collection", sorted(tenants["Collection"].unique()), key="memory_tenant_collection")
+		st.dataframe(summarize_memory(tenants[tenants["Collection"] == selected], ["Tenant", "Node Name"]), use_container_width=True)
+
+	st.markdown("#### Projected Cluster Memory by Compression")
+	projected = pd.DataFrame([
+		{"Compression": compression.upper(), "Memory (MB)": round(estimate[f"Projected Bytes ({compression})"].fillna(estimate["Total Bytes"]).sum() / 1024**2, 1)}
+		for compression in COMPRESSIONS
+	])
+	st.bar_chart(projected.set_index("Compression"), use_container_width=True)
+	st.markdown("###### NONE = all vectors uncompressed. Flat indexes only support BQ, other types keep their current size in the projection.")
+
+# Pick collections by predicate, enable a compression type on them in throttled batches and track the shards' compressed flag.
+def action_compression_rollout(cluster_endpoint, api_key):
+	print("Preparing compression rollout...")
+	st.markdown("###### Enables PQ, BQ, SQ or RQ on the selected collections through schema updates. PQ and SQ train on existing data, BQ and SQ may only be accepted on new collections depending on the server version; rejected updates are reported per collection.")
+	# Keep the candidates in session state, they are refreshed with the button
+	if "compression_candidates" not in st.session_state:
+		with st.spinner("Collecting configs and shards..."):
+			configs = fetch_all_collection_configs(cluster_endpoint, api_key)
+			if "error" in configs:
+				st.error(configs["error"])
+				return
+			shard_table = process_shards_data(get_shards_info(st.session_state.client))["shard_data"]
+			st.session_state.compression_candidates = {"candidates": list_compression_candidates(configs, shard_table)}
+	candidates = st.session_state.compression_candidates["candidates"]
+	if candidates.empty:
+		st.warning("No vector indexes found.")
+		return
+
+	col1, col2, col3 = st.columns(3)
+	with col1:
+		compression = st.selectbox("Compression", ["pq", "bq", "sq", "rq"], format_func=str.upper, key="compression_type")
+		only_uncompressed = st.checkbox("Only collections without compression", value=True, key="compression_only_uncompressed")
+	with col2:
+		min_objects = st.number_input("Minimum objects", min_value=0, value=100000, step=10000, key="compression_min_objects")
+		index_types = st.multiselect("Index types", list(INDEX_COMPRESSIONS), default=["hnsw", "dynamic"], key="compression_index_types")
+	with col3:
+		name_pattern = st.text_input("Collection name pattern (glob)", value="*", key="compression_name_pattern").strip()
+		options = {}
+		if compression == "pq":
+			segments = st.number_input("PQ segments (0 = server default)", min_value=0, value=0, key="compression_pq_segments")
+			if segments:
+				options["segments"] = int(segments)
+		if compression == "rq":
+			options["bits"] = st.selectbox("RQ bits", [8, 1], key="compression_rq_bits")
+
+	targets = select_compression_targets(candidates, compression, min_objects=min_objects, index_types=index_types, name_pattern=name_pattern, only_uncompressed=only_uncompressed)
+	st.markdown(f"#### Targets ({len(targets)} vector index(es) in {targets['Collection'].nunique() if not targets.empty else 0} collection(s))")
+	st.dataframe(targets, use_container_width=True)
+
+	col4, col5 = st.columns(2)
+	with col4:
+		batch_size = st.number_input("Collections per batch", min_value=1, max_value=100, value=5, key="compression_batch_size")
+	with col5:
+		pause_seconds = st.number_input("Pause between batches (seconds)", min_value=0.0, max_value=600.0, value=10.0, step=1.0, key="compression_pause")
+
+	st.warning("⬇️ This operation requires administrator privileges. Please ensure you are connected with an admin API key.")
+	if st.button(f"Enable {compression.upper()} on Targets", type="primary", use_container_width=True, key="compression_apply"):
+		if targets.empty:
+			st.error("No collections match the selection")
+			return
+		progress_bar = st.progress(0.0)
+		results = apply_compression_rollout(
+			cluster_endpoint,
+			api_key,
+			list(zip(targets["Collection"], targets["Vector"])),
+			compression,
+			options=options,
+			batch_size=int(batch_size),
+			pause_seconds=pause_seconds,
+			progress_callback=lambda done, total: progress_bar.progress(done / total)
+		)
+		st.session_state.compression_rollout = {
+			"compression": compression,
+			"training_limit": compression_training_limit(compression, options),
+			"results": pd.DataFrame(results),
+			"collections": [row["Collection"] for row in results if row["Success"]],
+		}
+		# The cached candidates are stale now
+		st.session_state.pop("compression_candidates", None)
+
+	rollout = st.session_state.get("compression_rollout")
+	if rollout:
+		track_compression_rollout(rollout)
+
+# Compressed flag of every shard replica of the rolled out collections, polled until all trainable shards are compressed.
+def track_compression_rollout(rollout):
+	st.markdown(f"#### {rollout['compression'].upper()} Rollout")
+	results = rollout["results"]
+	failed = results[~results["Success"]]
+	if not failed.empty:
+		st.error(f"{len(failed)} of {len(results)} collection update(s) failed.")
+	st.dataframe(results.astype(str), use_container_width=True)
+	if not rollout["collections"]:
+		return
+
+	col1, col2, col3 = st.columns(3)
+	with col1:
+		watch = st.checkbox("Track until complete", value=True, key="compression_watch")
+	with col2:
+		interval = st.number_input("Poll interval (seconds)", min_value=5, max_value=600, value=30, key="compression_watch_interval")
+	with col3:
+		if st.button("Stop Tracking", use_container_width=True, key="compression_watch_stop"):
+			st.session_state.pop("compression_rollout", None)
+			st.rerun()
+
+	training_limit = rollout.get("training_limit", 0)
+	shard_table = process_shards_data(get_shards_info(st.session_state.client))["shard_data"]
+	progress = compression_progress(shard_table, rollout["collections"], training_limit)
+	replicas = progress["Shard Replicas"].sum()
+	st.progress(progress["Compressed"].sum() / replicas if replicas else 1.0)
+	st.dataframe(progress, use_container_width=True)
+	if progress["Done"].all():
+		below = f" Shards below {training_limit:,} objects compress once they reach the training limit." if training_limit else ""
+		st.success(f"All shards that can be trained report compressed=True.{below}")
+		# The rollout is finished, the next rerun starts from a clean state
+		st.session_state.pop("compression_rollout", None)
+		return
+	if watch:
+		time.sleep(interval)
+		st.rerun()
+
+# Flag costly collection settings (inverted indexes, compression, HNSW parameters, replication) with an estimated cost.
+def action_performance_lint(cluster_endpoint, api_key):
+	print("Running performance lint...")
+	configs = fetch_all_collection_configs(cluster_endpoint, api_key)
+	if "error" in configs:
+		st.error(configs["error"])
+		return
+	node_info = get_shards_info(st.session_state.client)
+	if not node_info:
+		st.error("Failed to retrieve node and shard details.")
+		return
+	shard_table = process_shards_data(node_info)["shard_data"]
+
+	start = time.perf_counter()
+	findings = lint_collections(configs, collection_object_counts(shard_table), len(node_info), async_indexing_observed(shard_table))
+	elapsed_ms = (time.perf_counter() - start) * 1000
+	st.markdown(f"###### Analyzed **{len(configs)}** collection(s) in **{elapsed_ms:.0f} ms**. Costs are rough estimates from object counts and config values; filter usage is not known to the cluster, so check each finding against your queries.")
+	if findings.empty:
+		st.success("No findings.")
+		return
+
+	severity_counts = findings["Severity"].value_counts()
+	col1, col2, col3 = st.columns(3)
+	col1.metric("High", int(severity_counts.get("HIGH", 0)))
+	col2.metric("Medium", int(severity_counts.get("MEDIUM", 0)))
+	col3.metric("Low", int(severity_counts.get("LOW", 0)))
+
+	col4, col5 = st.columns(2)
+	with col4:
+		severities = st.multiselect("Severity", ["HIGH", "MEDIUM", "LOW"], default=["HIGH", "MEDIUM", "LOW"], key="lint_severities")
+	with col5:
+		rules = st.multiselect("Rules", sorted(findings["Rule"].unique()), key="lint_rules")
+	selected = findings[findings["Severity"].isin(severities)]
+	if rules:
+		selected = selected[selected["Rule"].isin(rules)]
+
+	st.markdown("#### Findings by Rule")
+	st.dataframe(selected.groupby(["Rule", "Severity"]).agg(Findings=("Collection", "size"), Collections=("Collection", "nunique"), **{"Estimated MB": ("Estimated MB", "sum")}).reset_index(), use_container_width=True)
+	st.markdown(f"#### Findings ({len(selected)})")
+	st.dataframe(selected, use_container_width=True)
+
 # Aggregate collections and tenants.
 def action_aggregate_collections_tenants():
 	print("Aggregating collections and tenants...")
 	st.markdown("###### Collections & Tenants aggregation time may vary depending on the dataset size, as it iterates through all collections and tenants. Check below for tables with statistics.")
-	result = aggregate_collections(st.session_state.client)
-	if "error" in result:
-		st.error(f"Error retrieving collections: {result['error']}")
-		return
+	# Keep the aggregation in session state so that reruns (e.g. prune buttons) do not recount every collection
+	if "aggregate_result" not in st.session_state:
+		result = aggregate_collections(st.session_state.client)
+		if "error" in result:
+			st.error(f"Error retrieving collections: {result['error']}")
+			return
+		st.session_state.aggregate_result = result
+	result = st.session_state.aggregate_result
 
 	# Display collection statistics
 	collection_count = result["collection_count"]
@@ -149,6 +524,81 @@ def action_aggregate_collections_tenants():
 		empty_tenants_df = pd.DataFrame(empty_tenants_details)
 		st.dataframe(empty_tenants_df, use_container_width=True)
 
+	if empty_collections_list or empty_tenants_details:
+		prune_empty_collections_tenants(empty_collections_list, empty_tenants_details)
+
+# Dry run and throttled deletion of the empty collections and tenants found by the aggregation.
+def prune_empty_collections_tenants(empty_collections_list, empty_tenants_details):
+	st.markdown("#### Prune Empty Collections & Tenants")
+	st.markdown("###### Empty tenants still hold shard metadata, file handles and memory on every node. The lists below come from the last aggregation and are not recounted before deletion.")
+
+	collection_options = [row["Collection"] for row in empty_collections_list]
+	tenant_options = [(row["Collection"], row["Tenant"]) for row in empty_tenants_details]
+
+	selected_collections = []
+	if collection_options:
+		if st.checkbox(f"Select all {len(collection_options)} empty collections", key="prune_all_collections"):
+			selected_collections = collection_options
+		else:
+			selected_collections = st.multiselect("Empty collections to prune", collection_options, key="prune_collections")
+
+	selected_tenants = []
+	if tenant_options:
+		if st.checkbox(f"Select all {len(tenant_options)} empty tenants", key="prune_all_tenants"):
+			selected_tenants = tenant_options
+		else:
+			selected_tenants = st.multiselect(
+				"Empty tenants to prune",
+				tenant_options,
+				format_func=lambda key: f"{key[0]} / {key[1]}",
+				key="prune_tenants"
+			)
+
+	col1, col2 = st.columns([1, 1])
+	with col1:
+		batch_size = st.number_input("Batch size (items per delete request)", min_value=1, max_value=1000, value=25, key="prune_batch_size")
+	with col2:
+		pause_seconds = st.number_input("Pause between batches (seconds)", min_value=0.0, max_value=60.0, value=1.0, step=0.5, key="prune_pause")
+
+	plan = plan_prune(empty_collections_list, empty_tenants_details, selected_collections, selected_tenants)
+
+	col3, col4 = st.columns([1, 1])
+	with col3:
+		dry_run_clicked = st.button("Dry Run", use_container_width=True, key="prune_dry_run")
+	with col4:
+		prune_clicked = st.button("🗑️ Prune Selected", type="primary", use_container_width=True, key="prune_execute")
+
+	if dry_run_clicked:
+		if plan:
+			st.info(f"Dry run: {sum(1 for row in plan if row['Type'] == 'Collection')} collection(s) and {sum(1 for row in plan if row['Type'] == 'Tenant')} tenant(s) would be deleted.")
+			st.dataframe(pd.DataFrame(plan).astype(str), use_container_width=True)
+		else:
+			st.warning("Nothing selected to prune.")
+
+	if prune_clicked:
+		if not plan:
+			st.error("Please select at least one collection or tenant to prune")
+			return
+		st.warning("⬇️ This operation requires administrator privileges. Please ensure you are connected with an admin API key.")
+		progress_bar = st.progress(0.0)
+		results = prune_empty_collections_and_tenants(
+			st.session_state.client,
+			selected_collections,
+			selected_tenants,
+			batch_size=int(batch_size),
+			pause_seconds=pause_seconds,
+			progress_callback=lambda done, total: progress_bar.progress(done / total)
+		)
+		results_df = pd.DataFrame(results)
+		failed = results_df[~results_df["Success"]]
+		if failed.empty:
+			st.success(f"Pruned {len(plan)} empty collection(s)/tenant(s).")
+		else:
+			st.error(f"{len(failed)} of {len(results_df)} batch(es) failed.")
+		st.dataframe(results_df.astype(str), use_container_width=True)
+		# The cached aggregation is stale now, recount on the next run
+		st.session_state.pop("aggregate_result", None)
+
 # Fetch and display collection properties.
 def action_collection_schema():
 	print("Fetching schema...")
@@ -179,9 +629,53 @@ def action_collection_schema():
 						st.dataframe(pd.DataFrame(properties_data), use_container_width=True)
 					else:
 						st.markdown("*No properties found.*")
+			property_statistics(schema)
 	else:
 		st.warning("No collection(s) available.")
 
+# Per-property statistics of a collection (or selected tenants) from concurrent aggregate queries, cached per selection.
+def property_statistics(schema):
+	st.markdown("#### Property Statistics")
+	st.markdown("###### Null counts, distinct values (from the top occurrences), min/max/mean and the most frequent values from aggregate queries; text lengths from a sample of objects. Useful to spot inverted indexes that can be dropped.")
+	collection_name = st.selectbox("Collection", sorted(schema.keys()), key="property_stats_collection")
+	tenant_names = get_tenant_names(st.session_state.client, collection_name, st.session_state.get("cluster_endpoint"), st.session_state.get("cluster_api_key"))
+	selected_tenants = []
+	if tenant_names:
+		tenant_names = sorted(tenant_names)
+		selected_tenants = st.multiselect("Tenants", tenant_names, default=tenant_names[:5], key="property_stats_tenants")
+
+	col1, col2, col3 = st.columns(3)
+	with col1:
+		max_workers = st.number_input("Concurrent queries", min_value=1, max_value=64, value=8, key="property_stats_workers")
+	with col2:
+		top_limit = st.number_input("Top occurrences", min_value=1, max_value=1000, value=10, key="property_stats_top")
+	with col3:
+		sample_size = st.number_input("Objects sampled for text length", min_value=1, max_value=10000, value=200, key="property_stats_sample")
+
+	cache = st.session_state.setdefault("property_stats", {})
+	cache_key = (collection_name, tuple(selected_tenants), int(top_limit), int(sample_size))
+	if st.button("Compute Property Statistics", use_container_width=True, key="property_stats_run"):
+		if tenant_names and not selected_tenants:
+			st.error("Please select at least one tenant")
+			return
+		properties = [(prop.name, prop.data_type.value) for prop in schema[collection_name].properties]
+		with st.spinner("Running aggregate queries..."):
+			cache[cache_key] = collect_property_stats(
+				st.session_state.client,
+				collection_name,
+				properties,
+				tenant_names=selected_tenants or None,
+				top_limit=int(top_limit),
+				sample_size=int(sample_size),
+				max_workers=int(max_workers)
+			)
+	stats = cache.get(cache_key)
+	if stats is not None:
+		if stats.empty:
+			st.info("No properties with aggregatable data types.")
+		else:
+			st.dataframe(stats.astype(str), use_container_width=True)
+
 # Fetch and display cluster statistics (RAFT).
 def action_statistics(cluster_endpoint, api_key):
 	st.markdown("#### Cluster Statistics Details")
@@ -220,6 +714,48 @@ def action_statistics(cluster_endpoint, api_key):
 
 	except Exception as e:
 		st.error(f"Error fetching cluster statistics: {e}")
+		return
+
+	raft_watch(stats)
+
+# Keep polling the statistics and show the Raft apply lag, leader changes and stale contacts over time.
+def raft_watch(stats):
+	st.markdown("##### Raft Replication Lag Watch")
+	watch = st.checkbox("Watch mode (poll statistics)", value=False, key="raft_watch")
+	col1, col2, col3, col4 = st.columns(4)
+	with col1:
+		interval = st.number_input("Poll interval (seconds)", min_value=1, max_value=300, value=5, key="raft_watch_interval")
+	with col2:
+		lag_threshold = st.number_input("Apply lag threshold (entries)", min_value=0, value=100, key="raft_lag_threshold")
+	with col3:
+		velocity_threshold = st.number_input("Lag velocity threshold (entries/s)", min_value=0.0, value=1.0, key="raft_velocity_threshold")
+	with col4:
+		contact_threshold = st.number_input("Stale lastContact (seconds)", min_value=0.1, value=5.0, key="raft_contact_threshold")
+
+	if not watch:
+		st.session_state.pop("raft_watch_samples", None)
+		return
+
+	# Samples of the last hour are kept in the session
+	samples = pd.concat([st.session_state.get("raft_watch_samples", pd.DataFrame()), raft_samples_from_statistics(stats)], ignore_index=True)
+	samples = samples[samples["ts"] >= time.time() - 3600]
+	st.session_state.raft_watch_samples = samples
+
+	lag = compute_raft_lag(samples, lag_threshold=lag_threshold, velocity_threshold=velocity_threshold, contact_threshold_seconds=contact_threshold)
+	nodes_table = lag["nodes"]
+	alerting = nodes_table[nodes_table["Alerts"] != ""]
+	if alerting.empty:
+		st.success("No Raft lag alerts.")
+	else:
+		st.error(f"Raft alerts on: **{', '.join(alerting['Node Name'])}**")
+	st.dataframe(nodes_table.astype(str), use_container_width=True)
+	st.line_chart(lag["lag"])
+	if not lag["leader_changes"].empty:
+		st.warning(f"{len(lag['leader_changes'])} leader change(s) while watching")
+		st.dataframe(lag["leader_changes"].astype(str), use_container_width=True)
+
+	time.sleep(interval)
+	st.rerun()
 
 # Fetch and display cluster metadata.
 def action_metadata(cluster_endpoint, api_key):
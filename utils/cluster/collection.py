@@ -1,3 +1,4 @@
+import copy
 import pandas as pd
 import requests
 
@@ -141,6 +142,17 @@ def fetch_collection_config(cluster_url, api_key, collection_name):
 	return {"error": f"Error fetching schema: {response.status_code} - {response.text}"}
 
 
+# Raw config of every collection by name
+def fetch_all_collection_configs(cluster_url, api_key):
+	headers = {"Authorization": f"Bearer {api_key}"}
+	endpoint = f"{cluster_url}/v1/schema/"
+	response = requests.get(endpoint, headers=headers)
+
+	if response.status_code == 200:
+		return {cls["class"]: cls for cls in response.json().get("classes", [])}
+	return {"error": f"Error fetching schema: {response.status_code} - {response.text}"}
+
+
 def process_collection_config(config):
 	if not config:
 		return {"error": "No configuration available"}
@@ -179,3 +191,42 @@ def process_collection_config(config):
 		keys_to_display["Named Vectors Config"] = named_vectors_info
 
 	return keys_to_display
+
+
+# Copy of a collection config under a new name, without the server-computed sharding fields
+def copy_collection_config(config, collection_name):
+	copied = copy.deepcopy(config)
+	copied["class"] = collection_name
+	sharding = copied.get("shardingConfig", {})
+	copied["shardingConfig"] = {key: sharding[key] for key in ("desiredCount", "virtualPerPhysical") if key in sharding}
+	return copied
+
+
+def create_collection_from_config(cluster_url, api_key, config):
+	headers = {"Authorization": f"Bearer {api_key}"}
+	endpoint = f"{cluster_url}/v1/schema"
+	response = requests.post(endpoint, headers=headers, json=config)
+
+	if response.status_code == 200:
+		return response.json()
+	return {"error": f"Error creating collection: {response.status_code} - {response.text}"}
+
+
+def update_collection_config(cluster_url, api_key, config):
+	headers = {"Authorization": f"Bearer {api_key}"}
+	endpoint = f"{cluster_url}/v1/schema/{config['class']}"
+	response = requests.put(endpoint, headers=headers, json=config)
+
+	if response.status_code == 200:
+		return response.json()
+	return {"error": f"Error updating collection: {response.status_code} - {response.text}"}
+
+
+# Vector index config of the default vector or of a named vector (None when the name does not exist)
+def get_vector_index_config(config, vector_name=None):
+	if vector_name:
+		return config.get("vectorConfig", {}).get(vector_name, {}).get("vectorIndexConfig")
+	if "vectorConfig" in config and "vectorIndexConfig" not in config:
+		first_vector = next(iter(config["vectorConfig"].values()), {})
+		return first_vector.get("vectorIndexConfig")
+	return config.get("vectorIndexConfig")
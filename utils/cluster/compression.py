@@ -0,0 +1,172 @@
+import copy
+import fnmatch
+import time
+import pandas as pd
+from utils.cluster.collection import fetch_collection_config, update_collection_config
+from utils.cluster.memory import get_vector_index_settings
+
+# Compression types that can be enabled per index type
+INDEX_COMPRESSIONS = {
+	"hnsw": ["pq", "bq", "sq", "rq"],
+	"dynamic": ["pq", "bq", "sq", "rq"],
+	"flat": ["bq"],
+}
+
+# Compressions that train on the shard's vectors first
+TRAINED_COMPRESSIONS = {"pq", "sq"}
+DEFAULT_TRAINING_LIMIT = 100000
+
+def _numeric(series):
+	return pd.to_numeric(series, errors="coerce").fillna(0).astype("int64")
+
+def list_compression_candidates(configs, shard_df):
+	"""
+	One row per collection and vector with its index type, current compression, objects (largest replica of each
+	shard) and shards reporting compressed=True in nodes verbose.
+	"""
+	shard_stats = pd.DataFrame(columns=["Class", "Objects", "Shards", "Compressed Shards"])
+	if not shard_df.empty:
+		shards = shard_df[["Class", "Shard Name", "Object Count", "Compressed"]].copy()
+		shards["Object Count"] = _numeric(shards["Object Count"])
+		shards["Compressed"] = shards["Compressed"].fillna(False).astype(bool)
+		per_shard = shards.groupby(["Class", "Shard Name"]).agg(objects=("Object Count", "max"), compressed=("Compressed", "all")).reset_index()
+		shard_stats = per_shard.groupby("Class").agg(
+			**{"Objects": ("objects", "sum"), "Shards": ("objects", "size"), "Compressed Shards": ("compressed", "sum")}
+		).reset_index()
+	stats = shard_stats.set_index("Class").to_dict("index")
+
+	rows = []
+	for collection_name, config in configs.items():
+		collection_stats = stats.get(collection_name, {})
+		for vector_name, settings in get_vector_index_settings(config).items():
+			if settings["skip"]:
+				continue
+			compression = settings["flat_compression"] if settings["index_type"] == "flat" else settings["compression"]
+			rows.append({
+				"Collection": collection_name,
+				"Vector": vector_name,
+				"Index Type": settings["index_type"],
+				"Compression": compression,
+				"Objects": int(collection_stats.get("Objects", 0)),
+				"Shards": int(collection_stats.get("Shards", 0)),
+				"Compressed Shards": int(collection_stats.get("Compressed Shards", 0)),
+			})
+	return pd.DataFrame(rows, columns=["Collection", "Vector", "Index Type", "Compression", "Objects", "Shards", "Compressed Shards"])
+
+def select_compression_targets(candidates_df, compression, min_objects=0, index_types=None, name_pattern="*", only_uncompressed=True):
+	"""
+	Filter list_compression_candidates rows by size, index type, collection name (glob) and current compression.
+	Vectors whose index type cannot use the compression are left out.
+	"""
+	if candidates_df.empty:
+		return candidates_df
+	supported = candidates_df["Index Type"].map(lambda index_type: compression in INDEX_COMPRESSIONS.get(index_type, []))
+	mask = supported & (candidates_df["Objects"] >= min_objects)
+	mask &= candidates_df["Collection"].map(lambda name: fnmatch.fnmatchcase(name, name_pattern or "*"))
+	if index_types:
+		mask &= candidates_df["Index Type"].isin(index_types)
+	if only_uncompressed:
+		mask &= candidates_df["Compression"] == "none"
+	return candidates_df[mask].sort_values("Objects", ascending=False)
+
+def build_compression_config(config, compression, vector_names, options=None):
+	"""
+	Copy of a raw collection config with the compression enabled on the given vectors ("default" for the
+	single vector). Dynamic indexes get it on their hnsw part (bq also on the flat part). Settings already on the
+	compression (trainingLimit, rescoreLimit, cache, ...) are kept unless options overrides them.
+	"""
+	updated = copy.deepcopy(config)
+	options = options or {}
+	for vector_name in vector_names:
+		if updated.get("vectorConfig"):
+			vector_config = updated["vectorConfig"][vector_name]
+			index_type = vector_config.get("vectorIndexType", "hnsw")
+			index_config = vector_config.setdefault("vectorIndexConfig", {})
+		else:
+			index_type = updated.get("vectorIndexType", "hnsw")
+			index_config = updated.setdefault("vectorIndexConfig", {})
+		if compression not in INDEX_COMPRESSIONS.get(index_type, []):
+			raise ValueError(f"{compression} is not supported by the {index_type} index of '{updated['class']}'")
+
+		if index_type == "dynamic":
+			parts = [index_config.setdefault("hnsw", {})]
+			if compression == "bq":
+				parts.append(index_config.setdefault("flat", {}))
+		else:
+			parts = [index_config]
+		for part in parts:
+			part[compression] = {**(part.get(compression) or {}), "enabled": True, **options}
+	return updated
+
+def apply_compression_rollout(cluster_url, api_key, targets, compression, options=None, batch_size=5, pause_seconds=2.0, progress_callback=None):
+	"""
+	Enable the compression on the target (collection, vector) pairs with one schema update per collection,
+	batch_size collections at a time with a pause between batches. Each config is fetched right before its
+	update so that schema changes made since the targets were listed are kept.
+	Returns one result row per collection.
+	"""
+	vectors_by_collection = {}
+	for collection_name, vector_name in targets:
+		vectors_by_collection.setdefault(collection_name, []).append(vector_name)
+	collection_names = list(vectors_by_collection)
+
+	results = []
+	for start in range(0, len(collection_names), batch_size):
+		batch = collection_names[start:start + batch_size]
+		for collection_name in batch:
+			started = time.time()
+			try:
+				config = fetch_collection_config(cluster_url, api_key, collection_name)
+				if "error" in config:
+					error = config["error"]
+				else:
+					updated = build_compression_config(config, compression, vectors_by_collection[collection_name], options)
+					response = update_collection_config(cluster_url, api_key, updated)
+					error = response.get("error", "")
+			except Exception as e:
+				error = str(e)
+			results.append({
+				"Collection": collection_name,
+				"Vectors": ", ".join(vectors_by_collection[collection_name]),
+				"Compression": compression,
+				"Success": not error,
+				"Error": error,
+				"Duration (s)": round(time.time() - started, 2),
+			})
+			print(f"Compression {compression} on {collection_name}: {'OK' if not error else error}")
+		if progress_callback:
+			progress_callback(len(results), len(collection_names))
+		if start + batch_size < len(collection_names):
+			time.sleep(pause_seconds)
+	return results
+
+def compression_progress(shard_df, collection_names, training_limit=0):
+	"""
+	Per collection, the shard replicas reporting compressed=True in nodes verbose. Shards below training_limit
+	objects (PQ/SQ train on that many vectors before compressing, empty shards have nothing to train on) never
+	report compressed and are counted apart instead of holding back Done.
+	"""
+	rows = []
+	shards = shard_df[shard_df["Class"].isin(collection_names)].copy() if not shard_df.empty else pd.DataFrame(columns=["Class", "Object Count", "Compressed"])
+	shards["Object Count"] = _numeric(shards["Object Count"])
+	shards["Compressed"] = shards["Compressed"].fillna(False).astype(bool)
+	for collection_name in collection_names:
+		collection_shards = shards[shards["Class"] == collection_name]
+		trainable = collection_shards[collection_shards["Object Count"] >= max(training_limit, 1)]
+		total = len(trainable)
+		compressed = int(trainable["Compressed"].sum())
+		rows.append({
+			"Collection": collection_name,
+			"Shard Replicas": total,
+			"Below Training Limit": len(collection_shards) - total,
+			"Compressed": compressed,
+			"Progress %": round(compressed / total * 100, 1) if total else 100.0,
+			"Done": compressed == total,
+		})
+	return pd.DataFrame(rows, columns=["Collection", "Shard Replicas", "Below Training Limit", "Compressed", "Progress %", "Done"])
+
+# Objects a PQ/SQ shard needs before it is trained and compressed (trainingLimit, server default 100000)
+def compression_training_limit(compression, options=None):
+	if compression not in TRAINED_COMPRESSIONS:
+		return 0
+	return int((options or {}).get("trainingLimit", DEFAULT_TRAINING_LIMIT))
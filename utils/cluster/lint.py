@@ -0,0 +1,160 @@
+from collections import Counter
+import pandas as pd
+from utils.cluster.memory import get_vector_dimensions, get_vector_index_settings, object_memory
+
+SEVERITY_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
+# Rough sizes for inverted index costs: tokens per text value and bytes per posting (disk)
+AVG_TOKENS_PER_TEXT = 32
+POSTING_BYTES = 8
+
+DEFAULT_THRESHOLDS = {
+	"large_objects": 1_000_000,
+	"text_index_objects": 100_000,
+	"max_ef_construction": 256,
+	"max_connections": 64,
+	"flat_objects": 100_000,
+}
+
+def collection_object_counts(shard_df):
+	# Objects per collection counting each shard once (largest replica)
+	if shard_df.empty:
+		return {}
+	counts = pd.to_numeric(shard_df["Object Count"], errors="coerce").fillna(0)
+	per_shard = counts.groupby([shard_df["Class"], shard_df["Shard Name"]]).max()
+	return per_shard.groupby(level=0).sum().astype("int64").to_dict()
+
+def async_indexing_observed(shard_df):
+	# Vector queues only fill up with ASYNC_INDEXING=true. An empty queue is also the normal state of a drained
+	# cluster, so this is True or None (unknown), never False
+	if shard_df.empty:
+		return None
+	queued = pd.to_numeric(shard_df["Vector Queue Length"], errors="coerce").fillna(0) > 0
+	indexing = shard_df["Index Status"] == "INDEXING"
+	return True if (queued | indexing).any() else None
+
+def _mb(value):
+	return round(value / 1024**2, 1)
+
+def lint_collections(configs, object_counts, node_count, async_indexing=None, thresholds=None):
+	"""
+	Flag costly settings across all collection configs. object_counts maps collection names to objects
+	(see collection_object_counts), node_count is the number of nodes in the cluster.
+	Single pass over configs and properties, no requests. Returns one row per finding with an estimated cost.
+	"""
+	limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+	factors = {name: (config.get("replicationConfig") or {}).get("factor", 1) for name, config in configs.items()}
+	common_factor = Counter(factors.values()).most_common(1)[0][0] if factors else 1
+	findings = []
+
+	def finding(severity, collection, target, rule, detail, cost, resource, estimated_mb=None):
+		findings.append({
+			"Severity": severity,
+			"Collection": collection,
+			"Target": target,
+			"Rule": rule,
+			"Detail": detail,
+			"Estimated Cost": cost,
+			"Resource": resource,
+			"Estimated MB": estimated_mb,
+		})
+
+	for name, config in configs.items():
+		objects = object_counts.get(name, 0)
+
+		# Inverted indexes on text properties
+		if objects >= limits["text_index_objects"]:
+			text_index_mb = _mb(objects * AVG_TOKENS_PER_TEXT * POSTING_BYTES)
+			for prop in config.get("properties", []):
+				if not any(data_type in ("text", "text[]") for data_type in prop.get("dataType", [])):
+					continue
+				filterable = prop.get("indexFilterable", True)
+				searchable = prop.get("indexSearchable", True)
+				if filterable and searchable:
+					finding("MEDIUM", name, prop["name"], "text-filterable-and-searchable",
+						"Text property has both the filterable and the searchable inverted index. Drop indexFilterable unless it is used in where filters.",
+						f"~{text_index_mb:,} MB disk and slower imports for the filterable index", "disk", text_index_mb)
+
+		inverted = config.get("invertedIndexConfig") or {}
+		extras = [key for key in ("indexTimestamps", "indexNullState", "indexPropertyLength") if inverted.get(key)]
+		if extras and objects >= limits["large_objects"]:
+			finding("LOW", name, ", ".join(extras), "inverted-index-extras",
+				"Extra inverted indexes are enabled on a large collection. Disable the ones not used in filters.",
+				f"{len(extras)} extra index write(s) per object", "disk", _mb(objects * len(extras) * POSTING_BYTES))
+
+		# Vector indexes
+		dimensions = get_vector_dimensions(config)
+		for vector_name, settings in get_vector_index_settings(config).items():
+			if settings["skip"]:
+				continue
+			target = vector_name
+			dims = dimensions.get(vector_name)
+			index_type = settings["index_type"]
+			index_config = (config.get("vectorConfig") or {}).get(vector_name, {}).get("vectorIndexConfig") if config.get("vectorConfig") else config.get("vectorIndexConfig")
+			index_config = index_config or {}
+			hnsw_config = (index_config.get("hnsw") or {}) if index_type == "dynamic" else index_config
+
+			if index_type in ("hnsw", "dynamic") and settings["compression"] == "none" and objects >= limits["large_objects"]:
+				saved_mb = None
+				cost = "uncompressed float32 vectors in memory"
+				if dims:
+					current = object_memory(settings, dims, "hnsw", "none")
+					compressed = object_memory(settings, dims, "hnsw", "rq")
+					saved_mb = _mb(objects * (sum(current) - sum(compressed)))
+					cost = f"~{saved_mb:,} MB memory saved per replica with 8-bit RQ"
+				finding("HIGH", name, target, "no-compression",
+					f"{objects:,} objects in an uncompressed {index_type} index.", cost, "memory", saved_mb)
+
+			if index_type == "flat" and objects >= limits["flat_objects"]:
+				finding("HIGH", name, target, "flat-index-large",
+					f"Flat index scans every vector per query ({objects:,} objects). Use hnsw or dynamic.",
+					f"{objects:,} distance calculations per query", "CPU/latency")
+
+			ef_construction = hnsw_config.get("efConstruction")
+			if index_type in ("hnsw", "dynamic") and ef_construction and ef_construction > limits["max_ef_construction"]:
+				finding("MEDIUM", name, target, "high-ef-construction",
+					f"efConstruction={ef_construction} (default 128).",
+					f"~{ef_construction / 128:.1f}x index build time per object", "CPU/import")
+
+			max_connections = hnsw_config.get("maxConnections")
+			if index_type in ("hnsw", "dynamic") and max_connections and max_connections > limits["max_connections"]:
+				extra_mb = _mb(objects * (max_connections - 32) * 2 * 8)
+				finding("MEDIUM", name, target, "high-max-connections",
+					f"maxConnections={max_connections} (default 32).",
+					f"~{extra_mb:,} MB graph memory per replica above the default", "memory", extra_mb)
+
+			cache_limit = hnsw_config.get("vectorCacheMaxObjects")
+			if index_type in ("hnsw", "dynamic") and cache_limit and objects > cache_limit:
+				finding("HIGH", name, target, "vector-cache-too-small",
+					f"vectorCacheMaxObjects={cache_limit:,} is below the {objects:,} objects of the collection.",
+					"vectors read from disk during search", "latency")
+
+			# A dynamic index can only be created with ASYNC_INDEXING=true
+			if index_type == "dynamic":
+				async_indexing = True
+
+		# Replication
+		factor = factors[name]
+		if factor > node_count:
+			finding("HIGH", name, f"factor={factor}", "replication-factor-above-nodes",
+				f"Replication factor {factor} is higher than the {node_count} node(s) of the cluster.",
+				"writes fail to reach the requested replicas", "availability")
+		elif factor == 1 and node_count > 1:
+			finding("MEDIUM", name, "factor=1", "no-replication",
+				f"Single replica on a {node_count}-node cluster.",
+				"shard unavailable when its node is down", "availability")
+		if factor != common_factor:
+			finding("LOW", name, f"factor={factor}", "replication-factor-mismatch",
+				f"Replication factor differs from the factor {common_factor} used by most collections.",
+				f"{factor / common_factor:.1f}x storage and write load of comparable collections", "disk/CPU")
+
+	if async_indexing is not True and any(objects >= limits["large_objects"] for objects in object_counts.values()):
+		finding("LOW", "(cluster)", "ASYNC_INDEXING", "async-indexing-not-observed",
+			"No shard reported a vector queue. Large imports are faster with ASYNC_INDEXING=true.",
+			"imports wait for the vector index", "import")
+
+	df = pd.DataFrame(findings, columns=["Severity", "Collection", "Target", "Rule", "Detail", "Estimated Cost", "Resource", "Estimated MB"])
+	if df.empty:
+		return df
+	df["order"] = df["Severity"].map(SEVERITY_ORDER)
+	return df.sort_values(["order", "Estimated MB"], ascending=[True, False], na_position="last").drop(columns="order").reset_index(drop=True)
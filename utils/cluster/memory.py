@@ -0,0 +1,225 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Weaviate defaults when a setting is not part of the vector index config
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_DYNAMIC_THRESHOLD = 10000
+DEFAULT_RQ_BITS = 8
+
+# PQ code size when segments is not set (one byte per segment, one segment per 4 dimensions)
+DEFAULT_PQ_DIMENSIONS_PER_SEGMENT = 4
+
+COMPRESSIONS = ["none", "pq", "bq", "sq", "rq"]
+
+# Compression types the flat index supports
+FLAT_COMPRESSIONS = ["none", "bq"]
+
+# Get the configured dimensions of each vector from the module config (None when the vectorizer does not expose it)
+def get_vector_dimensions(config):
+	dimensions = {}
+	if "vectorConfig" in config:
+		for vector_name, vector_details in config["vectorConfig"].items():
+			dims = None
+			for module_conf in (vector_details.get("vectorizer") or {}).values():
+				if isinstance(module_conf, dict) and module_conf.get("dimensions"):
+					dims = int(module_conf["dimensions"])
+			dimensions[vector_name] = dims
+	else:
+		dims = None
+		vectorizer = config.get("vectorizer")
+		module_conf = config.get("moduleConfig", {}).get(vectorizer, {})
+		if isinstance(module_conf, dict) and module_conf.get("dimensions"):
+			dims = int(module_conf["dimensions"])
+		dimensions["default"] = dims
+	return dimensions
+
+# Get the dimensions of each vector from one stored object
+def sample_vector_dimensions(client, collection_name, tenant_name=None):
+	collection = client.collections.get(collection_name)
+	if tenant_name:
+		collection = collection.with_tenant(tenant_name)
+	result = collection.query.fetch_objects(limit=1, include_vector=True)
+	if not result.objects:
+		return {}
+	return {name: len(vector) for name, vector in result.objects[0].vector.items()}
+
+def collect_vector_dimensions(client, configs, shard_df, max_workers=8):
+	"""
+	Dimensions of each vector per collection: the module config when it has them, otherwise one sampled object
+	(from a non-empty shard, i.e. a tenant for multi-tenant collections). Returns {collection: {vector: dims}}.
+	"""
+	dimensions = {name: get_vector_dimensions(config) for name, config in configs.items()}
+	missing = [name for name, dims in dimensions.items() if not dims or not all(dims.values())]
+	if not missing:
+		return dimensions
+
+	populated = shard_df[pd.to_numeric(shard_df["Object Count"], errors="coerce").fillna(0) > 0] if not shard_df.empty else shard_df
+	sample_shards = populated.drop_duplicates("Class").set_index("Class")["Shard Name"].to_dict() if not populated.empty else {}
+
+	def sample(collection_name):
+		if collection_name not in sample_shards:
+			return collection_name, {}
+		multi_tenant = configs[collection_name].get("multiTenancyConfig", {}).get("enabled", False)
+		try:
+			return collection_name, sample_vector_dimensions(client, collection_name, sample_shards[collection_name] if multi_tenant else None)
+		except Exception as e:
+			print(f"Error sampling vector dimensions of {collection_name}: {e}")
+			return collection_name, {}
+
+	with ThreadPoolExecutor(max_workers=max_workers) as executor:
+		for collection_name, sampled in executor.map(sample, missing):
+			dimensions[collection_name].update(sampled)
+	return dimensions
+
+def _compression(index_config):
+	for name in COMPRESSIONS[1:]:
+		if (index_config.get(name) or {}).get("enabled"):
+			return name
+	return "none"
+
+def get_vector_index_settings(config):
+	"""
+	Memory-relevant index settings of each vector (named vector or "default") of a raw collection config:
+	index type, compression, maxConnections, PQ segments, RQ bits and the dynamic index threshold.
+	"""
+	if config.get("vectorConfig"):
+		vectors = {name: (details.get("vectorIndexType", "hnsw"), details.get("vectorIndexConfig") or {}) for name, details in config["vectorConfig"].items()}
+	else:
+		vectors = {"default": (config.get("vectorIndexType", "hnsw"), config.get("vectorIndexConfig") or {})}
+
+	settings = {}
+	for vector_name, (index_type, index_config) in vectors.items():
+		hnsw_config = (index_config.get("hnsw") or {}) if index_type == "dynamic" else index_config
+		flat_config = (index_config.get("flat") or {}) if index_type == "dynamic" else index_config
+		settings[vector_name] = {
+			"index_type": index_type,
+			"skip": bool(index_config.get("skip")),
+			"threshold": index_config.get("threshold") or DEFAULT_DYNAMIC_THRESHOLD,
+			"max_connections": hnsw_config.get("maxConnections") or DEFAULT_MAX_CONNECTIONS,
+			"compression": _compression(hnsw_config),
+			"flat_compression": _compression(flat_config),
+			"pq_segments": (hnsw_config.get("pq") or {}).get("segments") or 0,
+			"rq_bits": (hnsw_config.get("rq") or {}).get("bits") or DEFAULT_RQ_BITS,
+		}
+	return settings
+
+# Bytes of one vector held in memory for a compression type
+def vector_code_bytes(dims, compression, pq_segments=0, rq_bits=DEFAULT_RQ_BITS):
+	if compression == "pq":
+		return pq_segments or math.ceil(dims / DEFAULT_PQ_DIMENSIONS_PER_SEGMENT)
+	if compression == "bq":
+		return math.ceil(dims / 8)
+	if compression == "sq":
+		return dims
+	if compression == "rq":
+		return math.ceil(dims * rq_bits / 8)
+	return dims * 4
+
+def object_memory(settings, dims, index_type, compression):
+	"""
+	(vector bytes, graph bytes) in memory per object for an hnsw or flat index, None when the index type does not
+	support the compression. HNSW keeps the (compressed) vectors plus the layer-0 links (2 * maxConnections uint64).
+	Flat reads uncompressed vectors from disk and only keeps the BQ codes cached.
+	"""
+	if settings["skip"] or not dims:
+		return 0, 0
+	if index_type == "flat":
+		if compression not in FLAT_COMPRESSIONS:
+			return None
+		return (math.ceil(dims / 8) if compression == "bq" else 0), 0
+	return vector_code_bytes(dims, compression, settings["pq_segments"], settings["rq_bits"]), settings["max_connections"] * 2 * 8
+
+def estimate_memory(shard_df, configs, dimensions):
+	"""
+	Estimated vector and graph memory of every shard replica and vector, with the projected total for each compression
+	type. shard_df is the shard_data frame of process_shards_data, configs the raw configs by collection name and
+	dimensions the output of collect_vector_dimensions. Dynamic indexes count as flat below their threshold.
+	Returns one row per node, collection, shard and vector.
+	"""
+	# One profile row per collection and vector with the per-object bytes of both index types
+	profiles = []
+	for collection_name, config in configs.items():
+		multi_tenant = config.get("multiTenancyConfig", {}).get("enabled", False)
+		for vector_name, settings in get_vector_index_settings(config).items():
+			dims = dimensions.get(collection_name, {}).get(vector_name)
+			if dims is None and vector_name == "default":
+				dims = next((value for value in dimensions.get(collection_name, {}).values() if value), None)
+			threshold = {"hnsw": 0, "flat": math.inf}.get(settings["index_type"], settings["threshold"])
+			profile = {
+				"Class": collection_name,
+				"Vector": vector_name,
+				"Multi Tenant": multi_tenant,
+				"Dimensions": dims,
+				"Configured Index": settings["index_type"],
+				"threshold": threshold,
+				"hnsw_compression": settings["compression"],
+				"flat_compression": settings["flat_compression"],
+			}
+			for index_type, compression in [("hnsw", settings["compression"]), ("flat", settings["flat_compression"])]:
+				# The branch of the index type a non-dynamic collection does not use can hold an unsupported combination
+				vector_bytes, graph_bytes = object_memory(settings, dims, index_type, compression) or (0, 0)
+				profile[f"{index_type}_vector"] = vector_bytes
+				profile[f"{index_type}_graph"] = graph_bytes
+				for projected in COMPRESSIONS:
+					memory = object_memory(settings, dims, index_type, projected)
+					profile[f"{index_type}_{projected}"] = sum(memory) if memory is not None else np.nan
+			profiles.append(profile)
+
+	if shard_df.empty or not profiles:
+		return pd.DataFrame()
+
+	shards = shard_df[["Node Name", "Class", "Shard Name", "Object Count", "Loaded"]].copy()
+	shards["Object Count"] = pd.to_numeric(shards["Object Count"], errors="coerce").fillna(0).astype("int64")
+	df = shards.merge(pd.DataFrame(profiles), on="Class", how="inner")
+
+	flat = df["Object Count"] < df["threshold"]
+	objects = df["Object Count"]
+	estimate = pd.DataFrame({
+		"Node Name": df["Node Name"],
+		"Collection": df["Class"],
+		"Shard": df["Shard Name"],
+		"Tenant": df["Shard Name"].where(df["Multi Tenant"], ""),
+		"Vector": df["Vector"],
+		"Loaded": df["Loaded"],
+		"Dimensions": df["Dimensions"],
+		"Index Type": np.where(flat, "flat", "hnsw"),
+		"Compression": np.where(flat, df["flat_compression"], df["hnsw_compression"]),
+		"Objects": objects,
+		"Vector Bytes": objects * np.where(flat, df["flat_vector"], df["hnsw_vector"]),
+		"Graph Bytes": objects * np.where(flat, df["flat_graph"], df["hnsw_graph"]),
+	})
+	estimate["Total Bytes"] = estimate["Vector Bytes"] + estimate["Graph Bytes"]
+	for compression in COMPRESSIONS:
+		estimate[f"Projected Bytes ({compression})"] = objects * np.where(flat, df[f"flat_{compression}"], df[f"hnsw_{compression}"])
+	return estimate
+
+def summarize_memory(estimate_df, by):
+	"""
+	Sum an estimate_memory frame by the given columns, in MB, with the projected savings of each compression type.
+	Unsupported compressions (e.g. PQ on a flat index) keep the current size in the projection.
+	"""
+	if estimate_df.empty:
+		return pd.DataFrame()
+	df = estimate_df.copy()
+	for compression in COMPRESSIONS:
+		column = f"Projected Bytes ({compression})"
+		df[column] = df[column].fillna(df["Total Bytes"])
+	columns = ["Objects", "Vector Bytes", "Graph Bytes", "Total Bytes"] + [f"Projected Bytes ({compression})" for compression in COMPRESSIONS]
+	summary = df.groupby(by)[columns].sum().reset_index()
+
+	mb = 1024 ** 2
+	summary["Vector MB"] = (summary["Vector Bytes"] / mb).round(1)
+	summary["Graph MB"] = (summary["Graph Bytes"] / mb).round(1)
+	summary["Total MB"] = (summary["Total Bytes"] / mb).round(1)
+	for compression in COMPRESSIONS[1:]:
+		projected = summary[f"Projected Bytes ({compression})"]
+		summary[f"With {compression.upper()} MB"] = (projected / mb).round(1)
+		summary[f"{compression.upper()} Savings %"] = np.where(
+			summary["Total Bytes"] > 0,
+			((1 - projected / summary["Total Bytes"].where(summary["Total Bytes"] > 0, 1)) * 100).round(1),
+			0.0
+		)
+	summary = summary.drop(columns=[column for column in columns if column != "Objects"])
+	return summary.sort_values("Total MB", ascending=False)
@@ -0,0 +1,151 @@
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+import pandas as pd
+from utils.cluster.cluster_operations import fetch_cluster_statistics
+from utils.cluster.raft import RAFT_COLUMNS, raft_rows_from_statistics
+
+# Directory holding one SQLite file of samples per cluster
+METRICS_DIR = "cluster_metrics"
+
+# Module-level variable to hold the singleton background poller
+_poller = None
+_lock = threading.Lock()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS node_samples (
+	ts REAL, node TEXT, status TEXT, objects INTEGER, shards INTEGER
+);
+CREATE TABLE IF NOT EXISTS shard_samples (
+	ts REAL, node TEXT, collection TEXT, shard TEXT, objects INTEGER,
+	queue_length INTEGER, index_status TEXT, compressed INTEGER, loaded INTEGER
+);
+CREATE TABLE IF NOT EXISTS raft_samples (
+	ts REAL, node TEXT, state TEXT, leader_id TEXT, term INTEGER, commit_index INTEGER,
+	applied_index INTEGER, last_log_index INTEGER, fsm_pending INTEGER, last_contact TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_node_samples_ts ON node_samples (ts);
+CREATE INDEX IF NOT EXISTS idx_shard_samples_ts ON shard_samples (ts);
+CREATE INDEX IF NOT EXISTS idx_raft_samples_ts ON raft_samples (ts);
+"""
+
+# Path of the samples file for a cluster endpoint
+def metrics_path(cluster_url):
+	host = urlparse(cluster_url).netloc.replace(":", "_") or "local"
+	return os.path.join(METRICS_DIR, f"{host}.db")
+
+def open_store(path):
+	os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+	conn = sqlite3.connect(path, check_same_thread=False)
+	conn.executescript(SCHEMA)
+	return conn
+
+def record_nodes_sample(conn, ts, node_info):
+	node_rows = []
+	shard_rows = []
+	for node in node_info:
+		node_rows.append((ts, node.name, node.status, node.stats.object_count, node.stats.shard_count))
+		for shard in node.shards:
+			shard_rows.append((
+				ts, node.name, shard.collection, shard.name, shard.object_count,
+				shard.vector_queue_length, shard.vector_indexing_status, int(bool(shard.compressed)), int(bool(shard.loaded))
+			))
+	with _lock:
+		conn.executemany("INSERT INTO node_samples VALUES (?, ?, ?, ?, ?)", node_rows)
+		conn.executemany("INSERT INTO shard_samples VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", shard_rows)
+		conn.commit()
+
+def record_statistics_sample(conn, ts, stats):
+	# Rows are parsed by the Raft helper so that stored and live samples share the same columns
+	rows = [tuple(row[column] for column in RAFT_COLUMNS) for row in raft_rows_from_statistics(stats, ts)]
+	with _lock:
+		conn.executemany(f"INSERT INTO raft_samples ({', '.join(RAFT_COLUMNS)}) VALUES ({', '.join('?' * len(RAFT_COLUMNS))})", rows)
+		conn.commit()
+
+# Drop samples older than the retention window
+def apply_retention(conn, retention_hours):
+	cutoff = time.time() - retention_hours * 3600
+	with _lock:
+		for table in ["node_samples", "shard_samples", "raft_samples"]:
+			conn.execute(f"DELETE FROM {table} WHERE ts < ?", (cutoff,))
+		conn.commit()
+
+def read_samples(path, table, since_hours=None):
+	if not os.path.exists(path):
+		return pd.DataFrame()
+	conn = sqlite3.connect(path)
+	try:
+		query = f"SELECT * FROM {table}"
+		params = ()
+		if since_hours:
+			query += " WHERE ts >= ?"
+			params = (time.time() - since_hours * 3600,)
+		df = pd.read_sql_query(query + " ORDER BY ts", conn, params=params)
+	finally:
+		conn.close()
+	if not df.empty:
+		df["time"] = pd.to_datetime(df["ts"], unit="s")
+	return df
+
+def _poll(client, cluster_url, api_key, interval, retention_hours, path, stop_event, state):
+	conn = open_store(path)
+	try:
+		while not stop_event.is_set():
+			ts = time.time()
+			try:
+				record_nodes_sample(conn, ts, client.cluster.nodes(output="verbose"))
+				stats = fetch_cluster_statistics(cluster_url, api_key)
+				if "error" in stats:
+					raise Exception(stats["error"])
+				record_statistics_sample(conn, ts, stats)
+				apply_retention(conn, retention_hours)
+				state["samples"] += 1
+				state["last_sample"] = ts
+				state["last_error"] = None
+			except Exception as e:
+				print(f"Metrics poller error: {e}")
+				state["last_error"] = str(e)
+			stop_event.wait(max(0.0, interval - (time.time() - ts)))
+	finally:
+		conn.close()
+
+def start_poller(client, cluster_url, api_key, interval=30, retention_hours=24):
+	global _poller
+	stop_poller()
+	path = metrics_path(cluster_url)
+	stop_event = threading.Event()
+	state = {"path": path, "interval": interval, "retention_hours": retention_hours, "samples": 0, "last_sample": None, "last_error": None}
+	thread = threading.Thread(
+		target=_poll,
+		args=(client, cluster_url, api_key, interval, retention_hours, path, stop_event, state),
+		daemon=True,
+		name="weaviate-metrics-poller"
+	)
+	thread.start()
+	_poller = {"thread": thread, "stop_event": stop_event, "state": state}
+	return path
+
+def stop_poller():
+	global _poller
+	if _poller:
+		_poller["stop_event"].set()
+		_poller["thread"].join(timeout=5)
+		_poller = None
+
+# Poller state (None when not running)
+def poller_status():
+	if _poller and _poller["thread"].is_alive():
+		return _poller["state"]
+	return None
+
+# Rows where a shard's index status differs from its previous sample
+def shard_status_changes(shard_samples):
+	if shard_samples.empty:
+		return pd.DataFrame()
+	df = shard_samples.sort_values(["node", "collection", "shard", "ts"])
+	previous = df.groupby(["node", "collection", "shard"])["index_status"].shift()
+	changed = df[previous.notna() & (previous != df["index_status"])].copy()
+	changed["previous_status"] = previous[changed.index]
+	return changed[["time", "node", "collection", "shard", "previous_status", "index_status"]].sort_values("time", ascending=False)
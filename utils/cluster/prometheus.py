@@ -0,0 +1,139 @@
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import pandas as pd
+import requests
+
+# Weaviate serves Prometheus metrics on this port when PROMETHEUS_MONITORING_ENABLED=true
+DEFAULT_METRICS_PORT = 2112
+
+SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.*)\})?\s+(\S+)(\s+\S+)?$")
+LABEL_PAIR = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+
+# Default metrics URL for a cluster endpoint (same host, Prometheus port)
+def default_metrics_url(cluster_url):
+	parsed = urlparse(cluster_url)
+	return f"{parsed.scheme or 'http'}://{parsed.hostname}:{DEFAULT_METRICS_PORT}/metrics"
+
+def _parse_value(value):
+	if value in ("+Inf", "Inf"):
+		return math.inf
+	if value == "-Inf":
+		return -math.inf
+	return float(value)
+
+def parse_prometheus_text(text, node=None):
+	"""
+	Parse the Prometheus text exposition format into a frame with one row per sample:
+	node, family, metric, type, labels (sorted "k=v" pairs without le), le and value.
+	"""
+	types = {}
+	rows = []
+	for line in text.splitlines():
+		line = line.strip()
+		if not line:
+			continue
+		if line.startswith("#"):
+			parts = line.split(None, 3)
+			if len(parts) >= 4 and parts[1] == "TYPE":
+				types[parts[2]] = parts[3]
+			continue
+		match = SAMPLE_LINE.match(line)
+		if not match:
+			continue
+		metric, _, raw_labels, value = match.group(1), match.group(2), match.group(3), match.group(4)
+		labels = dict(LABEL_PAIR.findall(raw_labels or ""))
+		le = labels.pop("le", None)
+
+		family = metric
+		if metric not in types:
+			for suffix in HISTOGRAM_SUFFIXES:
+				if metric.endswith(suffix) and metric[:-len(suffix)] in types:
+					family = metric[:-len(suffix)]
+					break
+		try:
+			parsed_value = _parse_value(value)
+		except ValueError:
+			continue
+		rows.append({
+			"node": node,
+			"family": family,
+			"metric": metric,
+			"type": types.get(family, "untyped"),
+			"labels": ",".join(f"{key}={labels[key]}" for key in sorted(labels)),
+			"le": _parse_value(le) if le is not None else None,
+			"value": parsed_value,
+		})
+	return pd.DataFrame(rows, columns=["node", "family", "metric", "type", "labels", "le", "value"])
+
+def _bucket_quantile(quantile, bounds, counts):
+	# Same linear interpolation as PromQL histogram_quantile over cumulative bucket counts
+	total = counts[-1]
+	if total == 0:
+		return None
+	rank = quantile * total
+	for i, (bound, count) in enumerate(zip(bounds, counts)):
+		if count >= rank:
+			if math.isinf(bound):
+				return bounds[i - 1] if i > 0 else None
+			lower_bound = bounds[i - 1] if i > 0 else 0.0
+			lower_count = counts[i - 1] if i > 0 else 0.0
+			bucket_count = count - lower_count
+			if bucket_count == 0:
+				return bound
+			return lower_bound + (bound - lower_bound) * (rank - lower_count) / bucket_count
+	return None
+
+def histogram_quantiles(samples, family, quantiles=(0.5, 0.95, 0.99), by=("node",)):
+	"""
+	Quantiles of a histogram family computed from its _bucket samples. Buckets are summed over the other labels
+	(e.g. class and shard) per by columns and le first, so the default gives one latency row per node.
+	Pass by=("node", "labels") for one row per label set. Returns the by columns, count and one p<NN> column per quantile.
+	"""
+	by = list(by)
+	buckets = samples[(samples["metric"] == f"{family}_bucket") & samples["le"].notna()]
+	if buckets.empty:
+		return pd.DataFrame()
+	summed = buckets.groupby(by + ["le"], dropna=False)["value"].sum().reset_index()
+	rows = []
+	for keys, group in summed.groupby(by, dropna=False):
+		group = group.sort_values("le")
+		bounds = group["le"].tolist()
+		counts = group["value"].tolist()
+		row = dict(zip(by, keys if isinstance(keys, tuple) else (keys,)))
+		row["count"] = counts[-1]
+		for quantile in quantiles:
+			row[f"p{int(quantile * 100)}"] = _bucket_quantile(quantile, bounds, counts)
+		rows.append(row)
+	return pd.DataFrame(rows)
+
+def scrape_metrics(urls, timeout=10, max_workers=8):
+	"""
+	Scrape the /metrics endpoint of each node concurrently.
+	Returns (samples frame, list of errors); the node column is the host of each URL.
+	"""
+	def scrape(url):
+		node = urlparse(url).netloc or url
+		try:
+			response = requests.get(url, timeout=timeout)
+			if response.status_code != 200:
+				return pd.DataFrame(), f"{url}: {response.status_code} - {response.text[:200]}"
+			return parse_prometheus_text(response.text, node=node), None
+		except requests.exceptions.RequestException as e:
+			return pd.DataFrame(), f"{url}: {e}"
+
+	with ThreadPoolExecutor(max_workers=max_workers) as executor:
+		results = list(executor.map(scrape, urls))
+	frames = [frame for frame, _ in results if not frame.empty]
+	errors = [error for _, error in results if error]
+	return (pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()), errors
+
+# Latest value of gauge-like families per node and labels, pivoted for display
+def metric_values(samples, families):
+	selected = samples[samples["family"].isin(families) & samples["le"].isna() & (samples["metric"] == samples["family"])]
+	if selected.empty:
+		return pd.DataFrame()
+	return selected.pivot_table(index=["node", "labels"], columns="family", values="value", aggfunc="sum").reset_index()
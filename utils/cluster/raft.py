@@ -0,0 +1,109 @@
+import re
+import time
+import pandas as pd
+
+GO_DURATION_UNITS = {"ns": 1e-9, "us": 1e-6, "µs": 1e-6, "ms": 1e-3, "s": 1.0, "m": 60.0, "h": 3600.0}
+GO_DURATION_PART = re.compile(r"([0-9]*\.?[0-9]+)(ns|us|µs|ms|s|m|h)")
+
+# Seconds of a Go duration string such as "35.2ms" or "1m2.5s" (None for "never" or unparsable values)
+def parse_go_duration(value):
+	if value is None:
+		return None
+	value = str(value).strip()
+	if value in ("0", "0s"):
+		return 0.0
+	parts = GO_DURATION_PART.findall(value)
+	if not parts or "".join(number + unit for number, unit in parts) != value:
+		return None
+	return sum(float(number) * GO_DURATION_UNITS[unit] for number, unit in parts)
+
+def _to_int(value):
+	try:
+		return int(value)
+	except (TypeError, ValueError):
+		return None
+
+# Columns of a Raft sample, in the order of the metrics store raft_samples table
+RAFT_COLUMNS = ["ts", "node", "state", "leader_id", "term", "commit_index", "applied_index", "last_log_index", "fsm_pending", "last_contact"]
+
+# Raft sample rows (dicts keyed by RAFT_COLUMNS) from one /v1/cluster/statistics response
+def raft_rows_from_statistics(stats, ts=None):
+	ts = ts or time.time()
+	rows = []
+	for node in stats.get("statistics", []):
+		raft = node.get("raft", {})
+		rows.append({
+			"ts": ts,
+			"node": node.get("name"),
+			"state": raft.get("state"),
+			"leader_id": node.get("leaderId"),
+			"term": _to_int(raft.get("term")),
+			"commit_index": _to_int(raft.get("commitIndex")),
+			"applied_index": _to_int(raft.get("appliedIndex")),
+			"last_log_index": _to_int(raft.get("lastLogIndex")),
+			"fsm_pending": _to_int(raft.get("fsmPending")),
+			"last_contact": str(raft.get("lastContact", "")),
+		})
+	return rows
+
+def raft_samples_from_statistics(stats, ts=None):
+	return pd.DataFrame(raft_rows_from_statistics(stats, ts), columns=RAFT_COLUMNS)
+
+def compute_raft_lag(samples, lag_threshold=100, velocity_threshold=1.0, contact_threshold_seconds=5.0):
+	"""
+	Per-node commit -> applied lag from Raft samples, with its velocity (entries/s between the last two samples),
+	leader changes over time and stale lastContact values.
+	Returns {"nodes": latest state per node with alerts, "lag": lag series, "leader_changes": leader change events}.
+	"""
+	if samples.empty:
+		return {"nodes": pd.DataFrame(), "lag": pd.DataFrame(), "leader_changes": pd.DataFrame()}
+
+	df = samples.sort_values("ts").copy()
+	df["time"] = pd.to_datetime(df["ts"], unit="s")
+	df["lag"] = pd.to_numeric(df["commit_index"], errors="coerce") - pd.to_numeric(df["applied_index"], errors="coerce")
+	df["last_contact_seconds"] = df["last_contact"].map(parse_go_duration)
+	previous = df.groupby("node")[["ts", "lag"]].shift()
+	df["lag_velocity"] = ((df["lag"] - previous["lag"]) / (df["ts"] - previous["ts"])).round(2)
+
+	latest = df.groupby("node").tail(1).copy()
+	alerts = []
+	for _, row in latest.iterrows():
+		node_alerts = []
+		if pd.notna(row["lag"]) and row["lag"] > lag_threshold:
+			node_alerts.append(f"apply lag {int(row['lag'])} > {lag_threshold}")
+		if pd.notna(row["lag_velocity"]) and row["lag_velocity"] > velocity_threshold:
+			node_alerts.append(f"lag growing {row['lag_velocity']}/s")
+		if row["state"] != "Leader" and (row["last_contact_seconds"] is None or pd.isna(row["last_contact_seconds"]) or row["last_contact_seconds"] > contact_threshold_seconds):
+			node_alerts.append(f"stale lastContact ({row['last_contact']})")
+		alerts.append("; ".join(node_alerts))
+	latest["alerts"] = alerts
+
+	nodes = latest[["node", "state", "leader_id", "term", "commit_index", "applied_index", "lag", "lag_velocity", "fsm_pending", "last_contact", "alerts"]].rename(columns={
+		"node": "Node Name",
+		"state": "State",
+		"leader_id": "Leader ID",
+		"term": "Term",
+		"commit_index": "Commit Index",
+		"applied_index": "Applied Index",
+		"lag": "Apply Lag",
+		"lag_velocity": "Lag Velocity (entries/s)",
+		"fsm_pending": "FSM Pending",
+		"last_contact": "Last Contact",
+		"alerts": "Alerts",
+	})
+
+	# The leader reported by most nodes at each sample
+	leaders = df.dropna(subset=["leader_id"]).groupby("ts")["leader_id"].agg(lambda ids: ids.mode().iloc[0]).reset_index()
+	leaders["previous_leader"] = leaders["leader_id"].shift()
+	leader_changes = leaders[leaders["previous_leader"].notna() & (leaders["previous_leader"] != leaders["leader_id"])]
+	leader_changes = pd.DataFrame({
+		"Time": pd.to_datetime(leader_changes["ts"], unit="s"),
+		"Previous Leader": leader_changes["previous_leader"],
+		"New Leader": leader_changes["leader_id"],
+	})
+
+	return {
+		"nodes": nodes,
+		"lag": df.pivot_table(index="time", columns="node", values="lag", aggfunc="max"),
+		"leader_changes": leader_changes,
+	}
@@ -0,0 +1,120 @@
+import bisect
+import pandas as pd
+
+def _numeric(series):
+	return pd.to_numeric(series, errors="coerce").fillna(0).astype("int64")
+
+def analyze_node_load(shard_df, hot_threshold=1.2, node_names=None):
+	"""
+	Per-node object, shard and vector queue load from the shard_data frame of process_shards_data.
+	node_names adds the nodes without shards (e.g. a newly added node) with zero load.
+	A node is flagged hot when its object count is above hot_threshold times the mean.
+	"""
+	if shard_df.empty:
+		if not node_names:
+			return pd.DataFrame()
+		# The frame of a cluster without shards has no columns, every node has zero load
+		load_df = pd.DataFrame(0, index=pd.Index([], name="Node Name"), columns=["Objects", "Shards", "Vector Queue Length", "Indexing Shards"])
+	else:
+		shards = shard_df[["Node Name", "Object Count", "Vector Queue Length", "Index Status"]].copy()
+		shards["Object Count"] = _numeric(shards["Object Count"])
+		shards["Vector Queue Length"] = _numeric(shards["Vector Queue Length"])
+		shards["Indexing"] = shards["Index Status"] == "INDEXING"
+
+		load_df = shards.groupby("Node Name").agg(
+			**{
+				"Objects": ("Object Count", "sum"),
+				"Shards": ("Object Count", "size"),
+				"Vector Queue Length": ("Vector Queue Length", "sum"),
+				"Indexing Shards": ("Indexing", "sum"),
+			}
+		)
+	if node_names:
+		load_df = load_df.reindex(sorted(set(load_df.index) | set(node_names)), fill_value=0)
+	load_df = load_df.rename_axis("Node Name").reset_index()
+
+	for column in ["Objects", "Shards", "Vector Queue Length"]:
+		mean = load_df[column].mean()
+		load_df[f"{column} vs Mean"] = (load_df[column] / mean).round(2) if mean else 0.0
+	load_df["Hot"] = load_df["Objects vs Mean"] > hot_threshold
+	return load_df.sort_values("Objects", ascending=False)
+
+def plan_replica_moves(shard_df, tolerance=0.1, max_moves=100, max_candidates=1000, node_names=None):
+	"""
+	Greedy plan of replica moves that evens out the objects per node.
+	Each step moves, from the most loaded node to the least loaded node that does not already hold a replica
+	of that shard, the largest shard that does not overshoot (at most half of the gap between both nodes).
+	Stops when the gap is within tolerance of the mean node load, or after max_moves.
+	node_names adds the nodes without shards, which start with zero load and are the first recipients.
+	Pure function over the shard_data frame of process_shards_data: one sort of the shards, then per move a sort
+	of the nodes and a list removal/insert on the donor and recipient (linear in their shard counts).
+	Returns (moves_df, projected_df).
+	"""
+	if shard_df.empty:
+		return pd.DataFrame(), pd.DataFrame()
+
+	shards = shard_df[["Node Name", "Class", "Shard Name", "Object Count"]].copy()
+	shards["Object Count"] = _numeric(shards["Object Count"])
+	shards = shards.sort_values("Object Count", kind="stable")
+
+	# Per node, shards sorted by object count as (objects, collection, shard) tuples
+	replicas = {}
+	node_shards = {node: [] for node in list(shards["Node Name"].unique()) + list(node_names or [])}
+	for node, objects, collection, shard_name in zip(shards["Node Name"], shards["Object Count"].tolist(), shards["Class"], shards["Shard Name"]):
+		node_shards[node].append((objects, collection, shard_name))
+		replicas.setdefault((collection, shard_name), set()).add(node)
+
+	initial_load = {node: sum(item[0] for item in items) for node, items in node_shards.items()}
+	load = dict(initial_load)
+	mean_load = sum(load.values()) / len(load)
+
+	moves = []
+	while len(moves) < max_moves:
+		donor = max(load, key=load.get)
+		move = None
+		for recipient in sorted(load, key=load.get):
+			gap = load[donor] - load[recipient]
+			if gap <= tolerance * mean_load:
+				break
+			donor_shards = node_shards[donor]
+			# Largest shard with at most gap / 2 objects, skipping shards already replicated on the recipient
+			index = bisect.bisect_right(donor_shards, (gap // 2, chr(0x10FFFF), chr(0x10FFFF))) - 1
+			for candidate_index in range(index, max(index - max_candidates, -1), -1):
+				objects, collection, shard_name = donor_shards[candidate_index]
+				if objects <= 0:
+					break
+				if recipient not in replicas[(collection, shard_name)]:
+					move = (candidate_index, recipient)
+					break
+			if move:
+				break
+		if not move:
+			break
+
+		candidate_index, recipient = move
+		objects, collection, shard_name = node_shards[donor].pop(candidate_index)
+		bisect.insort(node_shards[recipient], (objects, collection, shard_name))
+		replicas[(collection, shard_name)].discard(donor)
+		replicas[(collection, shard_name)].add(recipient)
+		load[donor] -= objects
+		load[recipient] += objects
+		moves.append({
+			"Collection": collection,
+			"Shard": shard_name,
+			"Source Node": donor,
+			"Target Node": recipient,
+			"Object Count": objects,
+			"Type": "MOVE",
+		})
+
+	projected_df = pd.DataFrame([
+		{
+			"Node Name": node,
+			"Objects Before": initial_load[node],
+			"Objects After": load[node],
+			"Before vs Mean": round(initial_load[node] / mean_load, 2) if mean_load else 0.0,
+			"After vs Mean": round(load[node] / mean_load, 2) if mean_load else 0.0,
+		}
+		for node in sorted(load)
+	])
+	return pd.DataFrame(moves), projected_df
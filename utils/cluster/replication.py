@@ -0,0 +1,159 @@
+import time
+from collections import deque
+import requests
+
+# Replication operation states that will not change anymore
+FINAL_STATES = {"READY", "CANCELLED"}
+
+# One pooled HTTP session reused by every replication call of a run
+def create_session(api_key):
+	session = requests.Session()
+	session.headers.update({"Authorization": f"Bearer {api_key}"})
+	return session
+
+def submit_replication(session, cluster_url, move, replication_type="MOVE"):
+	payload = {
+		"collection": move["Collection"],
+		"shard": move["Shard"],
+		"sourceNode": move["Source Node"],
+		"targetNode": move["Target Node"],
+		"type": replication_type,
+	}
+	response = session.post(f"{cluster_url}/v1/replication/replicate", json=payload)
+	if response.status_code != 200:
+		raise Exception(f"Error submitting replication: {response.status_code} - {response.text}")
+	return response.json()["id"]
+
+def get_replication_status(session, cluster_url, operation_id):
+	response = session.get(f"{cluster_url}/v1/replication/replicate/{operation_id}")
+	if response.status_code != 200:
+		raise Exception(f"Error fetching replication status: {response.status_code} - {response.text}")
+	return response.json()
+
+def cancel_replication(session, cluster_url, operation_id):
+	response = session.post(f"{cluster_url}/v1/replication/replicate/{operation_id}/cancel")
+	return response.status_code in (200, 204)
+
+# Drop the moves that no longer match the node/shard snapshot of get_shards_info
+def validate_moves(node_info, moves):
+	placement = {}
+	for node in node_info:
+		for shard in node.shards:
+			placement.setdefault((shard.collection, shard.name), set()).add(node.name)
+
+	valid, invalid = [], []
+	for move in moves:
+		nodes = placement.get((move["Collection"], move["Shard"]), set())
+		if move["Source Node"] not in nodes:
+			invalid.append({**move, "Reason": "Shard is not on the source node anymore"})
+		elif move["Target Node"] in nodes:
+			invalid.append({**move, "Reason": "Target node already holds a replica"})
+		else:
+			valid.append(move)
+	return valid, invalid
+
+def execute_replication_plan(cluster_url, api_key, moves, replication_type="MOVE", max_in_flight=2, poll_interval=5.0, max_errors=3, operation_timeout=3600.0, progress_callback=None):
+	"""
+	Submit the replica moves of a plan keeping at most max_in_flight operations running, polling their state
+	every poll_interval seconds. An operation that has not reached a final state within operation_timeout seconds
+	(including one whose status cannot be fetched) is cancelled and counted as failed. Once max_errors operations
+	have failed the run aborts: nothing new is submitted and the operations in flight are cancelled.
+	progress_callback(operations, summary) is called after each poll.
+	Returns (operations, summary) where operations is one row per move.
+	"""
+	if not moves:
+		return [], {}
+	session = create_session(api_key)
+	pending = deque(moves)
+	in_flight = {}
+	operations = []
+	errors = 0
+	submitted = 0
+	objects_done = 0
+	started = time.time()
+	aborted = False
+
+	def cancel(operation_id, move, start, state, error):
+		cancelled = False
+		try:
+			cancelled = cancel_replication(session, cluster_url, operation_id)
+		except Exception as e:
+			print(f"Error cancelling replication {operation_id}: {e}")
+		record(move, operation_id, state, start, error if cancelled else f"{error} (cancel request failed)")
+
+	def record(move, operation_id, state, start, error=""):
+		operations.append({
+			"Operation ID": operation_id,
+			"Collection": move["Collection"],
+			"Shard": move["Shard"],
+			"Source Node": move["Source Node"],
+			"Target Node": move["Target Node"],
+			"Type": replication_type,
+			"State": state,
+			"Object Count": move.get("Object Count", 0),
+			"Duration (s)": round(time.time() - start, 1),
+			"Error": error,
+		})
+
+	while pending or in_flight:
+		while pending and len(in_flight) < max_in_flight and not aborted:
+			move = pending.popleft()
+			submitted += 1
+			try:
+				operation_id = submit_replication(session, cluster_url, move, replication_type)
+				in_flight[operation_id] = (move, time.time())
+			except Exception as e:
+				errors += 1
+				record(move, "", "FAILED", time.time(), str(e))
+			if errors >= max_errors:
+				aborted = True
+
+		for operation_id, (move, start) in list(in_flight.items()):
+			try:
+				status = get_replication_status(session, cluster_url, operation_id).get("status", {})
+			except Exception as e:
+				print(f"Error polling replication {operation_id}: {e}")
+				status = {}
+			state = status.get("state", "UNKNOWN")
+			if state not in FINAL_STATES and time.time() - start > operation_timeout:
+				del in_flight[operation_id]
+				errors += 1
+				cancel(operation_id, move, start, "TIMED OUT", f"No final state after {operation_timeout:.0f}s (last state {state})")
+				if errors >= max_errors:
+					aborted = True
+				continue
+			# Errors are also reported for attempts the server retries, only a cancelled operation has failed
+			if state in FINAL_STATES:
+				del in_flight[operation_id]
+				if state == "READY":
+					objects_done += move.get("Object Count", 0) or 0
+					record(move, operation_id, state, start)
+				else:
+					errors += 1
+					record(move, operation_id, state, start, "; ".join(str(error) for error in status.get("errors") or []))
+					if errors >= max_errors:
+						aborted = True
+
+		if aborted:
+			pending.clear()
+			for operation_id, (move, start) in list(in_flight.items()):
+				del in_flight[operation_id]
+				cancel(operation_id, move, start, "CANCELLED", "Cancelled after the run aborted")
+
+		elapsed = time.time() - started
+		summary = {
+			"Submitted": submitted,
+			"In Flight": len(in_flight),
+			"Completed": sum(1 for operation in operations if operation["State"] == "READY"),
+			"Failed": errors,
+			"Remaining": len(pending),
+			"Objects Moved": objects_done,
+			"Objects/s": round(objects_done / elapsed, 1) if elapsed else 0.0,
+			"Aborted": aborted,
+		}
+		if progress_callback:
+			progress_callback(operations, summary)
+		if in_flight:
+			time.sleep(poll_interval)
+
+	return operations, summary
@@ -1,5 +1,6 @@
 import pandas as pd
 from weaviate.classes.query import Sort
+from utils.multitenancy.tenantdetails import iter_tenants
 
 def list_all_collections(client):
 	"""
@@ -12,12 +13,15 @@ def list_all_collections(client):
 		print(f"Error retrieving collections: {e}")
 		return []
 
-def get_tenant_names(client, collection_name):
+def get_tenant_names(client, collection_name, cluster_url=None, api_key=None):
 	"""
 	Retrieves tenant names for a given collection if multi-tenancy is enabled.
 	Returns a list of tenant names or an empty list if not enabled.
+	When the cluster endpoint is given, names are streamed page by page instead of building every tenant object.
 	"""
 	try:
+		if cluster_url:
+			return [name for page in iter_tenants(cluster_url, api_key, collection_name) for name, _ in page]
 		collection = client.collections.get(collection_name)
 		tenants = collection.tenants.get()
 		return [tenant.name for tenant in tenants.values()] if tenants else []
@@ -1,3 +1,7 @@
+import time
+from datetime import datetime, timedelta, timezone
+from weaviate.classes.query import Filter
+
 def delete_collections(client, collection_names):
     """
     Delete one or multiple collections.
@@ -29,3 +33,263 @@ def delete_tenants_from_collection(client, collection_name, tenant_names):
         return True, f"Successfully deleted tenants: {', '.join(tenant_names)} from collection {collection_name}"
     except Exception as e:
         return False, f"Error deleting tenants from collection {collection_name}: {str(e)}"
+
+def plan_prune(empty_collections_list, empty_tenants_details, collection_names, tenant_keys):
+    """
+    Dry run of a prune: lists what would be deleted, based on the lists computed by aggregate_collections.
+    Args:
+        empty_collections_list: List of {"Collection", "Count"} rows from aggregate_collections
+        empty_tenants_details: List of {"Collection", "Tenant", "Count"} rows from aggregate_collections
+        collection_names: Selected collection names
+        tenant_keys: Selected (collection_name, tenant_name) tuples
+    Returns:
+        list: Rows of {"Type", "Collection", "Tenant", "Count"}
+    """
+    selected_collections = set(collection_names)
+    selected_tenants = set(tenant_keys)
+    plan = []
+    for row in empty_collections_list:
+        if row["Collection"] in selected_collections:
+            plan.append({"Type": "Collection", "Collection": row["Collection"], "Tenant": "", "Count": row["Count"]})
+    for row in empty_tenants_details:
+        if (row["Collection"], row["Tenant"]) in selected_tenants:
+            plan.append({"Type": "Tenant", "Collection": row["Collection"], "Tenant": row["Tenant"], "Count": row["Count"]})
+    return plan
+
+def prune_empty_collections_and_tenants(client, collection_names, tenant_keys, batch_size=25, pause_seconds=1.0, progress_callback=None):
+    """
+    Delete empty collections and tenants in throttled batches.
+    Args:
+        client: Weaviate client
+        collection_names: List of collection names to delete
+        tenant_keys: List of (collection_name, tenant_name) tuples to delete
+        batch_size: Number of collections or tenants deleted per request
+        pause_seconds: Sleep between two batches to limit the schema load on the cluster
+        progress_callback: Optional callable(done, total) invoked after each batch
+    Returns:
+        list: One {"Type", "Collection", "Items", "Success", "Message"} row per batch
+    """
+    tenants_by_collection = {}
+    for collection_name, tenant_name in tenant_keys:
+        tenants_by_collection.setdefault(collection_name, []).append(tenant_name)
+
+    batches = []
+    collection_names = list(collection_names)
+    for i in range(0, len(collection_names), batch_size):
+        batches.append(("Collection", None, collection_names[i:i + batch_size]))
+    for collection_name, tenant_names in tenants_by_collection.items():
+        for i in range(0, len(tenant_names), batch_size):
+            batches.append(("Tenant", collection_name, tenant_names[i:i + batch_size]))
+
+    results = []
+    total = sum(len(items) for _, _, items in batches)
+    done = 0
+    for index, (kind, collection_name, items) in enumerate(batches):
+        if kind == "Collection":
+            success, message = delete_collections(client, items)
+        else:
+            success, message = delete_tenants_from_collection(client, collection_name, items)
+        results.append({
+            "Type": kind,
+            "Collection": collection_name or ", ".join(items),
+            "Items": len(items),
+            "Success": success,
+            "Message": message
+        })
+        done += len(items)
+        if progress_callback:
+            progress_callback(done, total)
+        if pause_seconds and index < len(batches) - 1:
+            time.sleep(pause_seconds)
+    return results
+
+def delete_objects_by_ids(client, collection_name, object_ids, tenant_name=None, batch_size=100, pause_seconds=0.5, progress_callback=None):
+    """
+    Delete objects by UUID in throttled batches with delete_many and an id filter.
+    Args:
+        client: Weaviate client
+        collection_name: Name of the collection
+        object_ids: List of UUIDs to delete
+        tenant_name: Tenant of the objects for multi-tenant collections
+        batch_size: Number of UUIDs per delete_many request
+        pause_seconds: Sleep between two batches to limit the load on the cluster
+        progress_callback: Optional callable(done, total, deleted) invoked after each batch
+    Returns:
+        dict: {"deleted", "failed", "errors", "seconds", "objects_per_second"}
+    """
+    collection = client.collections.get(collection_name)
+    if tenant_name:
+        collection = collection.with_tenant(tenant_name)
+
+    object_ids = list(object_ids)
+    deleted = 0
+    failed = 0
+    errors = []
+    start = time.time()
+    for i in range(0, len(object_ids), batch_size):
+        batch = object_ids[i:i + batch_size]
+        try:
+            result = collection.data.delete_many(where=Filter.by_id().contains_any(batch))
+            deleted += result.successful
+            failed += result.failed
+        except Exception as e:
+            failed += len(batch)
+            errors.append(str(e))
+        if progress_callback:
+            progress_callback(min(i + batch_size, len(object_ids)), len(object_ids), deleted)
+        if pause_seconds and i + batch_size < len(object_ids):
+            time.sleep(pause_seconds)
+    elapsed = time.time() - start
+    return {
+        "deleted": deleted,
+        "failed": failed,
+        "errors": errors,
+        "seconds": round(elapsed, 2),
+        "objects_per_second": round(deleted / elapsed, 1) if elapsed else 0.0
+    }
+
+# Pseudo properties for object metadata in filter conditions
+CREATION_TIME = "(creation time)"
+UPDATE_TIME = "(last update time)"
+
+FILTER_OPERATORS = ["equal", "not_equal", "less_than", "less_or_equal", "greater_than", "greater_or_equal", "like", "contains_any", "is_none"]
+
+def parse_filter_value(value, data_type):
+    """
+    Convert a text input to the type of a property.
+    Args:
+        value: Text value; dates also accept "<N>d" for N days ago, lists are comma separated (contains_any)
+        data_type: Weaviate data type ("text", "int", "number", "boolean", "date", ...)
+    Returns:
+        The converted value
+    """
+    value = value.strip()
+    data_type = str(data_type).removesuffix("[]")
+    if data_type == "int":
+        return int(value)
+    if data_type == "number":
+        return float(value)
+    if data_type == "boolean":
+        return value.lower() in ("true", "1", "yes")
+    if data_type == "date":
+        if value.endswith("d") and value[:-1].isdigit():
+            return datetime.now(timezone.utc) - timedelta(days=int(value[:-1]))
+        parsed = datetime.fromisoformat(value)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return value
+
+def build_delete_filter(conditions, combine="all"):
+    """
+    Build a Filter from conditions.
+    Args:
+        conditions: List of {"property", "data_type", "operator", "value"} dicts; property can be CREATION_TIME or UPDATE_TIME
+        combine: "all" (AND) or "any" (OR)
+    Returns:
+        Filter, or None when there is no condition
+    """
+    filters = []
+    for condition in conditions:
+        if condition["property"] == CREATION_TIME:
+            target, data_type = Filter.by_creation_time(), "date"
+        elif condition["property"] == UPDATE_TIME:
+            target, data_type = Filter.by_update_time(), "date"
+        else:
+            target, data_type = Filter.by_property(condition["property"]), condition["data_type"]
+
+        operator = condition["operator"]
+        if operator == "is_none":
+            filters.append(target.is_none(condition["value"].strip().lower() != "false"))
+        elif operator == "contains_any":
+            filters.append(target.contains_any([parse_filter_value(item, data_type) for item in condition["value"].split(",")]))
+        else:
+            filters.append(getattr(target, operator)(parse_filter_value(condition["value"], data_type)))
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return Filter.all_of(filters) if combine == "all" else Filter.any_of(filters)
+
+def count_matching_objects(client, collection_name, filters, tenant_names=None):
+    """
+    Dry run of a delete by filter: aggregate count of the matching objects.
+    Args:
+        client: Weaviate client
+        collection_name: Name of the collection
+        filters: Filter from build_delete_filter
+        tenant_names: Tenants to count in (multi-tenant collections)
+    Returns:
+        list: One {"Tenant", "Matching"} row per tenant (a single row for regular collections)
+    """
+    collection = client.collections.get(collection_name)
+    rows = []
+    for tenant_name in tenant_names or [None]:
+        target = collection.with_tenant(tenant_name) if tenant_name else collection
+        try:
+            matching = target.aggregate.over_all(filters=filters, total_count=True).total_count
+        except Exception as e:
+            matching = f"ERROR: {e}"
+        rows.append({"Tenant": tenant_name or "", "Matching": matching})
+    return rows
+
+def delete_objects_by_filter(client, collection_name, filters, tenant_names=None, chunk_size=1000, pause_seconds=1.0, progress_callback=None):
+    """
+    Delete the objects matching a filter in chunks: fetch up to chunk_size matching UUIDs, delete them with
+    delete_objects_by_ids, pause, repeat until nothing matches. Runs tenant by tenant.
+    Args:
+        client: Weaviate client
+        collection_name: Name of the collection
+        filters: Filter from build_delete_filter
+        tenant_names: Tenants to delete from (multi-tenant collections)
+        chunk_size: Objects deleted per request
+        pause_seconds: Sleep between two chunks to limit the load on the cluster
+        progress_callback: Optional callable(tenant_name, deleted, objects_per_second, finished) invoked after each
+            chunk, and once more with finished=True when the tenant is done
+    Returns:
+        list: One {"Tenant", "Deleted", "Failed", "Chunks", "Seconds", "Objects/s", "Error"} row per tenant
+    """
+    collection = client.collections.get(collection_name)
+    results = []
+    for tenant_name in tenant_names or [None]:
+        target = collection.with_tenant(tenant_name) if tenant_name else collection
+        deleted = 0
+        failed = 0
+        chunks = 0
+        error = ""
+        start = time.time()
+        while True:
+            try:
+                ids = [obj.uuid for obj in target.query.fetch_objects(filters=filters, limit=chunk_size, return_properties=[]).objects]
+            except Exception as e:
+                error = str(e)
+                break
+            if not ids:
+                break
+            result = delete_objects_by_ids(client, collection_name, ids, tenant_name=tenant_name, batch_size=chunk_size, pause_seconds=0)
+            chunks += 1
+            deleted += result["deleted"]
+            failed += result["failed"]
+            elapsed = time.time() - start
+            if progress_callback:
+                progress_callback(tenant_name, deleted, round(deleted / elapsed, 1) if elapsed else 0.0, False)
+            if result["errors"]:
+                error = result["errors"][0]
+                break
+            # Objects that cannot be deleted would be fetched again forever
+            if result["deleted"] == 0:
+                error = f"No object deleted in the last chunk ({result['failed']} failed)"
+                break
+            if pause_seconds:
+                time.sleep(pause_seconds)
+        elapsed = time.time() - start
+        if progress_callback:
+            progress_callback(tenant_name, deleted, round(deleted / elapsed, 1) if elapsed else 0.0, True)
+        results.append({
+            "Tenant": tenant_name or "",
+            "Deleted": deleted,
+            "Failed": failed,
+            "Chunks": chunks,
+            "Seconds": round(elapsed, 2),
+            "Objects/s": round(deleted / elapsed, 1) if elapsed else 0.0,
+            "Error": error
+        })
+    return results
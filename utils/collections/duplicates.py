@@ -0,0 +1,59 @@
+import hashlib
+import json
+import uuid
+import pandas as pd
+
+# 128-bit content hashes keep collisions negligible at billions of objects
+HASH_BYTES = 16
+
+def content_hash(properties, property_names):
+	# blake2b over the canonical JSON of the selected properties (missing properties hash as null)
+	payload = json.dumps([properties.get(name) for name in property_names], sort_keys=True, default=str, ensure_ascii=False)
+	return hashlib.blake2b(payload.encode("utf-8"), digest_size=HASH_BYTES).digest()
+
+def scan_duplicates(collection, property_names, progress_callback=None, progress_every=10000):
+	"""
+	Stream the collection with the cursor API and hash the selected properties of each object.
+	Keeps a hash -> first UUID table (raw bytes) plus the UUIDs of the extra copies, so memory grows with
+	the unique hashes and duplicates, not with object size. The first object in UUID order is the one kept.
+	Objects where every selected property is missing or null have no content to compare and are skipped.
+	Returns {scanned, skipped, unique, groups (DataFrame), extras (list of UUID strings)}.
+	"""
+	first_seen = {}
+	extras = {}
+	scanned = 0
+	skipped = 0
+	for obj in collection.iterator(return_properties=property_names):
+		scanned += 1
+		properties = obj.properties or {}
+		if all(properties.get(name) is None for name in property_names):
+			skipped += 1
+			continue
+		digest = content_hash(properties, property_names)
+		object_id = obj.uuid.bytes
+		if digest in first_seen:
+			extras.setdefault(digest, []).append(object_id)
+		else:
+			first_seen[digest] = object_id
+		if progress_callback and scanned % progress_every == 0:
+			progress_callback(scanned, len(first_seen), sum(len(ids) for ids in extras.values()))
+
+	groups = pd.DataFrame(
+		[
+			{
+				"Hash": digest.hex(),
+				"Kept uuid": str(uuid.UUID(bytes=first_seen[digest])),
+				"Copies": len(ids) + 1,
+				"Extra uuids": ", ".join(str(uuid.UUID(bytes=object_id)) for object_id in ids[:10]) + (" ..." if len(ids) > 10 else ""),
+			}
+			for digest, ids in extras.items()
+		],
+		columns=["Hash", "Kept uuid", "Copies", "Extra uuids"]
+	)
+	return {
+		"scanned": scanned,
+		"skipped": skipped,
+		"unique": len(first_seen),
+		"groups": groups.sort_values("Copies", ascending=False).reset_index(drop=True),
+		"extras": [str(uuid.UUID(bytes=object_id)) for ids in extras.values() for object_id in ids],
+	}
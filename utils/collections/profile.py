@@ -0,0 +1,148 @@
+import json
+import math
+import random
+import uuid
+import numpy as np
+import pandas as pd
+
+# 95% two-sided normal quantile
+Z_95 = 1.96
+
+def sample_objects(collection, walks=50, walk_length=20, seed=None):
+	"""
+	Uniform-ish random sample without a full scan: each walk starts the cursor after a random UUID and reads
+	walk_length objects. Objects are keyed by UUID, so for random (v4) UUIDs the walks land at random places;
+	objects after large gaps in the key space are slightly favoured. Returns (objects, failed walks).
+	"""
+	rng = random.Random(seed)
+	objects = {}
+	failed = 0
+	for _ in range(walks):
+		start = uuid.UUID(int=rng.getrandbits(128))
+		try:
+			result = collection.query.fetch_objects(after=start, limit=walk_length)
+		except Exception as e:
+			print(f"Sampling walk after {start} failed: {e}")
+			failed += 1
+			continue
+		for obj in result.objects:
+			objects[str(obj.uuid)] = obj.properties or {}
+	return list(objects.values()), failed
+
+def wilson_interval(successes, n, z=Z_95):
+	# Wilson score interval of a proportion, vectorized over arrays
+	successes = np.asarray(successes, dtype="float64")
+	if n == 0:
+		return np.full_like(successes, np.nan), np.full_like(successes, np.nan)
+	p = successes / n
+	denominator = 1 + z**2 / n
+	center = (p + z**2 / (2 * n)) / denominator
+	margin = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denominator
+	return np.maximum(center - margin, 0.0), np.minimum(center + margin, 1.0)
+
+def _payload_bytes(series):
+	# UTF-8 size of strings, JSON size of everything else
+	strings = series.map(lambda value: isinstance(value, str))
+	sizes = pd.Series(np.nan, index=series.index)
+	if strings.any():
+		sizes[strings] = series[strings].str.encode("utf-8").str.len()
+	others = series.notna() & ~strings
+	if others.any():
+		sizes[others] = series[others].map(lambda value: len(json.dumps(value, default=str).encode("utf-8")))
+	return sizes
+
+def profile_sample(objects, total_count=None, expected_types=None):
+	"""
+	Per-property profile of sampled objects with 95% confidence bounds: fill rate and empty rate (Wilson),
+	values whose type differs from the expected (schema) or dominant type, numeric-looking strings,
+	and the mean payload size (normal approximation). With total_count the total payload is extrapolated.
+	"""
+	n = len(objects)
+	if n == 0:
+		return pd.DataFrame()
+	expected_types = expected_types or {}
+	# Schema properties come first so that one empty in the whole sample is still profiled (0% filled),
+	# then any property found only in the objects
+	names = list(expected_types)
+	for obj in objects:
+		for name in obj:
+			if name not in names:
+				names.append(name)
+	rows = []
+	for name in names:
+		# Values are kept as object dtype, a DataFrame would turn dates into Timestamps and ints with gaps into floats
+		series = pd.Series([obj.get(name) for obj in objects], dtype=object)
+		filled = series.notna()
+		values = series[filled]
+		types = values.map(lambda value: type(value).__name__)
+		dominant = types.mode().iloc[0] if not types.empty else ""
+		expected = expected_types.get(name) or dominant
+		empty = values.map(lambda value: value == "" or value == [] or value == {})
+		strings = values[types == "str"]
+		numeric_strings = strings.str.fullmatch(r"\s*-?\d+(\.\d+)?\s*").sum() if not strings.empty else 0
+
+		sizes = _payload_bytes(values)
+		mean_bytes = sizes.mean() if not sizes.empty else 0.0
+		margin = Z_95 * sizes.std(ddof=1) / math.sqrt(len(sizes)) if len(sizes) > 1 else 0.0
+		rows.append({
+			"Property": name,
+			"Type": dominant,
+			"filled": int(filled.sum()),
+			"empty": int(empty.sum()),
+			"Type Anomalies": int((types != expected).sum()),
+			"Numeric Strings": int(numeric_strings),
+			"Avg Bytes": round(mean_bytes, 1),
+			"Avg Bytes Low": round(max(mean_bytes - margin, 0.0), 1),
+			"Avg Bytes High": round(mean_bytes + margin, 1),
+		})
+
+	profile = pd.DataFrame(rows)
+	fill_low, fill_high = wilson_interval(profile["filled"], n)
+	empty_low, empty_high = wilson_interval(profile["empty"], n)
+	profile.insert(2, "Fill Rate", (profile["filled"] / n).round(4))
+	profile.insert(3, "Fill Low", fill_low.round(4))
+	profile.insert(4, "Fill High", fill_high.round(4))
+	profile.insert(5, "Empty Rate", (profile["empty"] / n).round(4))
+	profile.insert(6, "Empty High", empty_high.round(4))
+	if total_count is not None:
+		# Expected payload = objects x fill rate x mean size, bounded by both intervals
+		profile["Est. Total MB"] = (total_count * profile["Fill Rate"] * profile["Avg Bytes"] / 1024**2).round(2)
+		profile["Est. Total MB Low"] = (total_count * profile["Fill Low"] * profile["Avg Bytes Low"] / 1024**2).round(2)
+		profile["Est. Total MB High"] = (total_count * profile["Fill High"] * profile["Avg Bytes High"] / 1024**2).round(2)
+	return profile.drop(columns=["filled", "empty"]).sort_values("Avg Bytes", ascending=False).reset_index(drop=True)
+
+# Python type name of the values of each schema data type
+SCHEMA_VALUE_TYPES = {
+	"text": "str",
+	"int": "int",
+	"number": "float",
+	"boolean": "bool",
+	"date": "datetime",
+	"uuid": "UUID",
+}
+
+def expected_value_types(properties):
+	# properties is a list of (name, data type); array types are lists
+	return {
+		name: "list" if str(data_type).endswith("[]") else SCHEMA_VALUE_TYPES.get(str(data_type))
+		for name, data_type in properties
+	}
+
+def run_sampling_profile(client, collection_name, tenant_name=None, walks=50, walk_length=20, seed=None):
+	"""
+	Sample a collection (or tenant) with random cursor walks and profile the sample.
+	Returns {profile, sampled, failed_walks, total_count, sample_fraction}.
+	"""
+	collection = client.collections.get(collection_name)
+	if tenant_name:
+		collection = collection.with_tenant(tenant_name)
+	total_count = collection.aggregate.over_all(total_count=True).total_count
+	properties = [(prop.name, prop.data_type.value) for prop in collection.config.get().properties]
+	objects, failed = sample_objects(collection, walks=walks, walk_length=walk_length, seed=seed)
+	return {
+		"profile": profile_sample(objects, total_count, expected_value_types(properties)),
+		"sampled": len(objects),
+		"failed_walks": failed,
+		"total_count": total_count,
+		"sample_fraction": len(objects) / total_count if total_count else 0.0,
+	}
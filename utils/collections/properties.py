@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from weaviate.classes.query import Metrics
+
+# Aggregate metric type of each property data type (arrays aggregate their values)
+STAT_TYPES = {
+	"text": "text",
+	"int": "integer",
+	"number": "number",
+	"boolean": "boolean",
+	"date": "date",
+}
+
+def property_stat_type(data_type):
+	return STAT_TYPES.get(str(data_type).removesuffix("[]"))
+
+def build_property_metric(name, stat_type, top_limit=10):
+	metric = Metrics(name)
+	if stat_type == "text":
+		return metric.text(count=True, top_occurrences_count=True, top_occurrences_value=True, limit=top_limit)
+	if stat_type == "integer":
+		return metric.integer(count=True, minimum=True, maximum=True, mean=True)
+	if stat_type == "number":
+		return metric.number(count=True, minimum=True, maximum=True, mean=True)
+	if stat_type == "boolean":
+		return metric.boolean(count=True, total_true=True, total_false=True)
+	return metric.date_(count=True, minimum=True, maximum=True)
+
+def aggregate_property(collection, name, data_type, top_limit=10):
+	"""
+	Statistics of one property from a single aggregate query: values, nulls (scalar types only, array types
+	count values), distinct values from the top occurrences, min/max/mean and the most frequent values.
+	"""
+	stat_type = property_stat_type(data_type)
+	row = {"Property": name, "Data Type": data_type}
+	response = collection.aggregate.over_all(total_count=True, return_metrics=build_property_metric(name, stat_type, top_limit))
+	metrics = response.properties[name]
+	count = metrics.count or 0
+	row["Objects"] = response.total_count
+	row["Values"] = count
+	row["Nulls"] = response.total_count - count if not str(data_type).endswith("[]") else None
+
+	if stat_type == "text":
+		occurrences = metrics.top_occurrences or []
+		# Fewer top occurrences than the limit means every distinct value was returned
+		row["Distinct"] = str(len(occurrences)) if len(occurrences) < top_limit else f">= {top_limit}"
+		row["Top Values"] = ", ".join(f"{occurrence.value} ({occurrence.count})" for occurrence in occurrences)
+	elif stat_type == "boolean":
+		row["Distinct"] = str(sum(1 for total in (metrics.total_true, metrics.total_false) if total))
+		row["Top Values"] = f"true ({metrics.total_true}), false ({metrics.total_false})"
+	else:
+		row["Min"] = metrics.minimum
+		row["Max"] = metrics.maximum
+		if stat_type != "date":
+			row["Mean"] = round(metrics.mean, 4) if metrics.mean is not None else None
+	return row
+
+def sample_text_lengths(collection, text_properties, sample_size=200):
+	# Mean and max character length of text properties over a sample of objects
+	result = collection.query.fetch_objects(limit=sample_size, return_properties=text_properties)
+	lengths = {name: [] for name in text_properties}
+	for obj in result.objects:
+		for name in text_properties:
+			value = (obj.properties or {}).get(name)
+			if isinstance(value, list):
+				lengths[name].extend(len(item) for item in value if isinstance(item, str))
+			elif isinstance(value, str):
+				lengths[name].append(len(value))
+	return {
+		name: {"Avg Length": round(sum(values) / len(values), 1), "Max Length": max(values)} if values else {}
+		for name, values in lengths.items()
+	}
+
+def collect_property_stats(client, collection_name, properties, tenant_names=None, top_limit=10, sample_size=200, max_workers=8):
+	"""
+	Per-property statistics of a collection, or of each given tenant, with one aggregate query per property and
+	tenant plus one sampled fetch per tenant for text lengths. Queries run concurrently on at most max_workers threads.
+	properties is a list of (name, data type) pairs; unsupported types (references, geo, blobs, objects) are skipped.
+	Returns one row per tenant and property.
+	"""
+	supported = [(name, data_type) for name, data_type in properties if property_stat_type(data_type)]
+	text_properties = [name for name, data_type in supported if property_stat_type(data_type) == "text"]
+	collection = client.collections.get(collection_name)
+	targets = [(tenant_name, collection.with_tenant(tenant_name)) for tenant_name in tenant_names] if tenant_names else [(None, collection)]
+
+	def property_task(target, name, data_type):
+		tenant_name, target_collection = target
+		try:
+			row = aggregate_property(target_collection, name, data_type, top_limit)
+		except Exception as e:
+			row = {"Property": name, "Data Type": data_type, "Error": str(e)}
+		return {"Tenant": tenant_name or "", **row}
+
+	def length_task(target):
+		tenant_name, target_collection = target
+		try:
+			return tenant_name or "", sample_text_lengths(target_collection, text_properties, sample_size)
+		except Exception as e:
+			print(f"Error sampling text lengths of {collection_name} {tenant_name or ''}: {e}")
+			return tenant_name or "", {}
+
+	with ThreadPoolExecutor(max_workers=max_workers) as executor:
+		property_futures = [executor.submit(property_task, target, name, data_type) for target in targets for name, data_type in supported]
+		length_futures = [executor.submit(length_task, target) for target in targets] if text_properties else []
+		rows = [future.result() for future in property_futures]
+		lengths = dict(future.result() for future in length_futures)
+
+	for row in rows:
+		row.update(lengths.get(row["Tenant"], {}).get(row["Property"], {}))
+	columns = ["Tenant", "Property", "Data Type", "Objects", "Values", "Nulls", "Distinct", "Top Values", "Min", "Max", "Mean", "Avg Length", "Max Length", "Error"]
+	df = pd.DataFrame(rows)
+	return df.reindex(columns=[column for column in columns if column in df.columns])
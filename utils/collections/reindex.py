@@ -0,0 +1,248 @@
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from weaviate.classes.data import DataObject
+from weaviate.classes.query import QueryReference
+from weaviate.classes.tenants import Tenant
+
+# Checkpoints live next to the app, one JSON file per source/target/tenant
+CHECKPOINT_DIR = "reindex_checkpoints"
+# Attempts of one insert_many batch before the copy stops
+WRITE_ATTEMPTS = 3
+# Failed object messages kept in the result
+MAX_ERRORS = 20
+
+def checkpoint_path(source_collection, target_collection, tenant_name=None):
+	return os.path.join(CHECKPOINT_DIR, f"{source_collection}__{target_collection}__{tenant_name or 'all'}.json")
+
+def load_checkpoint(path):
+	if not os.path.exists(path):
+		return None
+	try:
+		with open(path) as f:
+			return json.load(f)
+	except Exception as e:
+		print(f"Error reading checkpoint {path}: {e}")
+		return None
+
+def save_checkpoint(path, state):
+	# Write then rename so an interrupted write never leaves a truncated checkpoint
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	temp_path = f"{path}.tmp"
+	with open(temp_path, "w") as f:
+		json.dump({**state, "updated": datetime.now().isoformat(timespec="seconds")}, f, indent=2)
+	os.replace(temp_path, path)
+
+def to_data_object(obj, copy_vectors=True, named_vectors=False):
+	vector = None
+	if copy_vectors and obj.vector:
+		vector = obj.vector if named_vectors else obj.vector.get("default")
+	# References are written back as the UUIDs they point to
+	references = {
+		name: [ref.uuid for ref in reference.objects]
+		for name, reference in (obj.references or {}).items()
+		if reference and reference.objects
+	}
+	return DataObject(properties=obj.properties, uuid=obj.uuid, vector=vector, references=references or None)
+
+def copy_objects(source, target, checkpoint_file, after=None, batch_size=200, writers=4, queue_size=8, max_objects_per_second=0, copy_vectors=True, named_vectors=False, reference_names=None, progress_callback=None, progress_interval=1.0):
+	"""
+	Copy every object of source (a collection or tenant handle) into target. One reader thread walks the cursor
+	from after (vectors included) and fills a bounded queue of batches; writer threads insert the batches with
+	insert_many. The checkpoint holds the last UUID of the longest run of fully written batches, so a resume
+	starts right after it and re-writes the batches after it, which overwrite themselves since UUIDs are kept.
+	A batch with failed objects is not fully written: the checkpoint stays before it, the copy is not marked
+	completed and a resume retries it.
+	The reference_names properties are read with the objects and copied as the UUIDs they point to.
+	max_objects_per_second (0 = unlimited) paces the reader, which the bounded queue passes on to the writers.
+	Returns {copied, failed, errors, last_uuid, seconds, objects_per_second, stopped}.
+	"""
+	batches = queue.Queue(maxsize=queue_size)
+	stop = threading.Event()
+	lock = threading.Lock()
+	state = {"copied": 0, "failed": 0, "errors": [], "read": 0, "last_uuid": after, "stopped": ""}
+	finished = {}
+	next_sequence = [0]
+	started = time.time()
+
+	def put(item):
+		# Keep retrying the put so the reader notices a stop instead of blocking on a full queue
+		while True:
+			try:
+				batches.put(item, timeout=0.5)
+				return
+			except queue.Full:
+				if stop.is_set() and item is not None:
+					return
+
+	def reader():
+		batch = []
+		sequence = 0
+		read = 0
+		return_references = [QueryReference(link_on=name) for name in reference_names] if reference_names else None
+		try:
+			for obj in source.iterator(include_vector=copy_vectors, return_references=return_references, after=after, cache_size=batch_size):
+				if stop.is_set():
+					break
+				batch.append(to_data_object(obj, copy_vectors, named_vectors))
+				if len(batch) >= batch_size:
+					put((sequence, batch))
+					sequence += 1
+					read += len(batch)
+					with lock:
+						state["read"] = read
+					batch = []
+					if max_objects_per_second:
+						delay = started + read / max_objects_per_second - time.time()
+						if delay > 0:
+							time.sleep(delay)
+			if batch and not stop.is_set():
+				put((sequence, batch))
+				read += len(batch)
+				with lock:
+					state["read"] = read
+		except Exception as e:
+			with lock:
+				state["stopped"] = f"Read failed: {e}"
+			stop.set()
+		finally:
+			for _ in range(writers):
+				put(None)
+
+	def write(batch):
+		for attempt in range(1, WRITE_ATTEMPTS + 1):
+			try:
+				return target.data.insert_many(batch)
+			except Exception as e:
+				if attempt == WRITE_ATTEMPTS:
+					raise
+				print(f"Batch insert failed (attempt {attempt}): {e}")
+				time.sleep(2 * attempt)
+
+	def writer():
+		while True:
+			item = batches.get()
+			if item is None:
+				return
+			if stop.is_set():
+				continue
+			sequence, batch = item
+			try:
+				result = write(batch)
+			except Exception as e:
+				# The batch stays after the checkpoint and is copied again on resume
+				with lock:
+					state["stopped"] = f"Write failed: {e}"
+				stop.set()
+				continue
+			with lock:
+				errors = result.errors or {}
+				state["copied"] += len(batch) - len(errors)
+				state["failed"] += len(errors)
+				for index, error in errors.items():
+					if len(state["errors"]) < MAX_ERRORS:
+						state["errors"].append({"uuid": str(batch[index].uuid), "Error": error.message})
+				# Advance the checkpoint over the batches that are written without a gap before them,
+				# a batch with failed objects stays a gap so that a resume retries it
+				if errors:
+					continue
+				finished[sequence] = str(batch[-1].uuid)
+				advanced = False
+				while next_sequence[0] in finished:
+					state["last_uuid"] = finished.pop(next_sequence[0])
+					next_sequence[0] += 1
+					advanced = True
+				if advanced:
+					save_checkpoint(checkpoint_file, {"last_uuid": state["last_uuid"], "copied": state["copied"], "failed": state["failed"], "completed": False})
+
+	threads = [threading.Thread(target=reader, daemon=True)] + [threading.Thread(target=writer, daemon=True) for _ in range(writers)]
+	for thread in threads:
+		thread.start()
+	# Progress is reported from the calling thread, where Streamlit elements can be updated
+	while any(thread.is_alive() for thread in threads):
+		time.sleep(progress_interval)
+		if progress_callback:
+			with lock:
+				elapsed = time.time() - started
+				progress_callback({
+					"copied": state["copied"],
+					"failed": state["failed"],
+					"queued_batches": batches.qsize(),
+					"last_uuid": state["last_uuid"],
+					"objects_per_second": round(state["copied"] / elapsed, 1) if elapsed else 0.0,
+				})
+
+	seconds = time.time() - started
+	save_checkpoint(checkpoint_file, {"last_uuid": state["last_uuid"], "copied": state["copied"], "failed": state["failed"], "completed": not state["stopped"] and not state["failed"]})
+	return {
+		"copied": state["copied"],
+		"failed": state["failed"],
+		"errors": state["errors"],
+		"last_uuid": state["last_uuid"],
+		"seconds": round(seconds, 2),
+		"objects_per_second": round(state["copied"] / seconds, 1) if seconds else 0.0,
+		"stopped": state["stopped"],
+	}
+
+def ensure_target_tenants(target_collection, tenant_names):
+	existing = target_collection.tenants.get() or {}
+	missing = [name for name in tenant_names if name not in existing]
+	if missing:
+		target_collection.tenants.create([Tenant(name=name) for name in missing])
+	return missing
+
+def reindex_collection(source_client, target_client, source_name, target_name, tenant_names=None, resume=True, batch_size=200, writers=4, queue_size=8, max_objects_per_second=0, copy_vectors=True, named_vectors=False, progress_callback=None):
+	"""
+	Copy a collection, or the given tenants of it, into target_name on target_client (the same client or one
+	connected to another cluster). Tenants are created on the target when missing and copied one after the other,
+	each with its own checkpoint. With resume, a copy restarts after its checkpoint. Counts of source and target are
+	compared at the end, references are copied as UUIDs (the objects they point to must exist on the target). Returns one row per tenant (or one row for the collection).
+	"""
+	source_collection = source_client.collections.get(source_name)
+	target_collection = target_client.collections.get(target_name)
+	if tenant_names:
+		ensure_target_tenants(target_collection, tenant_names)
+	reference_names = [reference.name for reference in source_collection.config.get().references]
+
+	rows = []
+	for tenant_name in tenant_names or [None]:
+		source = source_collection.with_tenant(tenant_name) if tenant_name else source_collection
+		target = target_collection.with_tenant(tenant_name) if tenant_name else target_collection
+		checkpoint_file = checkpoint_path(source_name, target_name, tenant_name)
+		checkpoint = load_checkpoint(checkpoint_file) if resume else None
+		after = checkpoint.get("last_uuid") if checkpoint else None
+		row = {"Tenant": tenant_name or "", "Resumed After": after or "", "Copied": 0, "Failed": 0, "Seconds": 0.0, "Objects/s": 0.0, "Source Count": None, "Target Count": None, "Counts Match": False, "Error": ""}
+
+		def tenant_progress(progress):
+			if progress_callback:
+				progress_callback(tenant_name, progress)
+
+		try:
+			result = copy_objects(
+				source,
+				target,
+				checkpoint_file,
+				after=after,
+				batch_size=batch_size,
+				writers=writers,
+				queue_size=queue_size,
+				max_objects_per_second=max_objects_per_second,
+				copy_vectors=copy_vectors,
+				named_vectors=named_vectors,
+				reference_names=reference_names,
+				progress_callback=tenant_progress
+			)
+			row.update({"Copied": result["copied"], "Failed": result["failed"], "Seconds": result["seconds"], "Objects/s": result["objects_per_second"], "Error": result["stopped"]})
+			if result["errors"]:
+				row["Error"] = "; ".join(filter(None, [row["Error"]] + [f"{error['uuid']}: {error['Error']}" for error in result["errors"][:3]]))
+			row["Source Count"] = source.aggregate.over_all(total_count=True).total_count
+			row["Target Count"] = target.aggregate.over_all(total_count=True).total_count
+			row["Counts Match"] = row["Source Count"] == row["Target Count"]
+		except Exception as e:
+			print(f"Error reindexing {source_name} {tenant_name or ''}: {e}")
+			row["Error"] = str(e)
+		rows.append(row)
+	return rows
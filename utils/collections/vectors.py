@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+
+# Norm below which a vector counts as zero
+ZERO_NORM = 1e-6
+# Vectors (and norms) kept in the reservoir samples used for duplicates and norm percentiles
+DUPLICATE_SAMPLE = 100000
+# Invalid vectors listed by uuid (all of them are counted)
+MAX_ISSUES = 1000
+# Largest LSH bucket compared pairwise, and how many times an oversized bucket is re-hashed
+MAX_BUCKET = 2000
+MAX_SPLIT_DEPTH = 3
+
+def stream_vector_batches(collection, vector_name=None, batch_size=1000, max_objects=100000):
+	"""
+	Read vectors with the cursor API and yield (uuids, vectors) batches, vectors being lists as returned
+	(they can differ in length). Objects without the vector are skipped.
+	"""
+	uuids, vectors = [], []
+	read = 0
+	for obj in collection.iterator(include_vector=True, return_properties=[]):
+		vector = obj.vector.get(vector_name) if vector_name else next(iter(obj.vector.values()), None)
+		read += 1
+		if vector is not None:
+			uuids.append(str(obj.uuid))
+			vectors.append(vector)
+		if len(uuids) >= batch_size:
+			yield uuids, vectors
+			uuids, vectors = [], []
+		if read >= max_objects:
+			break
+	if uuids:
+		yield uuids, vectors
+
+def _lsh_keys(vectors, bits, rng):
+	planes = rng.standard_normal((vectors.shape[1], bits)).astype(np.float32)
+	return ((vectors @ planes) > 0).astype(np.int64) @ (1 << np.arange(bits, dtype=np.int64))
+
+def _split_buckets(vectors, rows, max_bucket, bits, rng, depth=0):
+	# Split buckets above max_bucket rows with more hash bits; what stays too large (e.g. many exact copies)
+	# is cut into max_bucket slices so the leader clustering stays bounded
+	if len(rows) <= max_bucket:
+		return [rows]
+	if depth >= MAX_SPLIT_DEPTH:
+		return [rows[i:i + max_bucket] for i in range(0, len(rows), max_bucket)]
+	keys = _lsh_keys(vectors[rows], bits, rng)
+	order = np.argsort(keys, kind="stable")
+	boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+	if len(boundaries) == 0:
+		return [rows[i:i + max_bucket] for i in range(0, len(rows), max_bucket)]
+	return [bucket for part in np.split(rows[order], boundaries) for bucket in _split_buckets(vectors, part, max_bucket, bits, rng, depth + 1)]
+
+def find_near_duplicates(vectors, threshold=0.99, bits=16, tables=4, max_bucket=MAX_BUCKET, seed=0):
+	"""
+	Near-duplicate clusters of L2-normalized float32 vectors. Random-hyperplane LSH (tables x bits) buckets
+	similar vectors together; buckets above max_bucket rows are split with more hash bits. Inside each bucket,
+	leader clustering assigns every unclustered vector whose cosine similarity to the leader is at least threshold.
+	Returns the cluster label (leader row) of each row, -1 when the row has no near-duplicate.
+	"""
+	n, d = vectors.shape
+	labels = np.full(n, -1, dtype=np.int64)
+	if n < 2:
+		return labels
+	rng = np.random.default_rng(seed)
+	for _ in range(tables):
+		keys = _lsh_keys(vectors, bits, rng)
+		order = np.argsort(keys, kind="stable")
+		boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+		for table_bucket in np.split(order, boundaries):
+			for bucket in _split_buckets(vectors, table_bucket, max_bucket, bits, rng):
+				candidates = bucket[labels[bucket] < 0]
+				while len(candidates) > 1:
+					leader, rest = candidates[0], candidates[1:]
+					similar = vectors[rest] @ vectors[leader] >= threshold
+					if similar.any():
+						labels[leader] = leader
+						labels[rest[similar]] = leader
+					candidates = rest[~similar]
+	return labels
+
+def _reservoir_slots(seen, count, size, rng):
+	"""
+	Reservoir sampling (algorithm R) for a batch of count items after seen items: the reservoir slot of each item,
+	-1 for items not kept. Later items of the batch overwrite earlier ones that draw the same slot.
+	"""
+	positions = seen + np.arange(count)
+	slots = np.where(positions < size, positions, rng.integers(0, positions + 1))
+	return np.where(slots < size, slots, -1)
+
+def analyze_vectors(batches, expected_dimensions=None, duplicate_threshold=0.99, lsh_bits=16, lsh_tables=4, sample_size=DUPLICATE_SAMPLE, max_issues=MAX_ISSUES, seed=0):
+	"""
+	Vector health from (uuids, vectors) batches: wrong dimensionality (against expected_dimensions or the most
+	common length of the first batch), NaN/Inf and zero vectors, the norm distribution and near-duplicate clusters.
+	Counts and norm mean/std/min/max cover every vector. Memory stays bounded: norm percentiles come from a
+	reservoir sample of sample_size norms, near-duplicates are searched in a reservoir sample of sample_size
+	normalized vectors and at most max_issues invalid vectors are listed.
+	Returns {summary, norms (sample), issues, duplicates}.
+	"""
+	rng = np.random.default_rng(seed)
+	issues = []
+	counts = {"wrong dimensionality": 0, "NaN/Inf values": 0, "zero vector": 0}
+	total = 0
+	dimensions = expected_dimensions
+	norm_count, norm_sum, norm_squares, norm_min, norm_max = 0, 0.0, 0.0, np.inf, -np.inf
+	norm_sample = None
+	vector_sample, sample_uuids = None, None
+	healthy_seen = 0
+
+	def add_issues(issue, rows, details=None):
+		counts[issue] += len(rows)
+		for uuid, detail in zip(rows, details or [""] * len(rows)):
+			if len(issues) >= max_issues:
+				break
+			issues.append({"uuid": uuid, "Issue": issue, "Detail": detail})
+
+	for uuids, vectors in batches:
+		total += len(uuids)
+		lengths = np.fromiter((len(vector) for vector in vectors), dtype=np.int64, count=len(vectors))
+		if dimensions is None:
+			dimensions = int(np.bincount(lengths).argmax())
+		wrong = np.flatnonzero(lengths != dimensions)
+		add_issues("wrong dimensionality", [uuids[index] for index in wrong], [f"{lengths[index]} dimensions instead of {dimensions}" for index in wrong])
+
+		valid = np.flatnonzero(lengths == dimensions)
+		if len(valid) == 0:
+			continue
+		block = np.asarray([vectors[index] for index in valid], dtype=np.float32)
+		block_uuids = [uuids[index] for index in valid]
+		finite = np.isfinite(block).all(axis=1)
+		block_norms = np.linalg.norm(np.where(np.isfinite(block), block, 0), axis=1)
+		zero = finite & (block_norms < ZERO_NORM)
+		add_issues("NaN/Inf values", [block_uuids[index] for index in np.flatnonzero(~finite)])
+		add_issues("zero vector", [block_uuids[index] for index in np.flatnonzero(zero)])
+
+		finite_norms = block_norms[finite].astype(np.float64)
+		if len(finite_norms):
+			if norm_sample is None:
+				norm_sample = np.empty(sample_size, dtype=np.float32)
+			slots = _reservoir_slots(norm_count, len(finite_norms), sample_size, rng)
+			norm_sample[slots[slots >= 0]] = finite_norms[slots >= 0]
+			norm_count += len(finite_norms)
+			norm_sum += finite_norms.sum()
+			norm_squares += (finite_norms ** 2).sum()
+			norm_min = min(norm_min, finite_norms.min())
+			norm_max = max(norm_max, finite_norms.max())
+
+		healthy = np.flatnonzero(finite & ~zero)
+		if len(healthy):
+			if vector_sample is None:
+				vector_sample = np.empty((sample_size, dimensions), dtype=np.float32)
+				sample_uuids = [None] * sample_size
+			slots = _reservoir_slots(healthy_seen, len(healthy), sample_size, rng)
+			kept = slots >= 0
+			vector_sample[slots[kept]] = block[healthy[kept]] / block_norms[healthy[kept]][:, None]
+			for slot, index in zip(slots[kept], healthy[kept]):
+				sample_uuids[slot] = block_uuids[index]
+			healthy_seen += len(healthy)
+
+	norms = norm_sample[:min(norm_count, sample_size)] if norm_sample is not None else np.empty(0, dtype=np.float32)
+	sampled = min(healthy_seen, sample_size)
+	vectors = vector_sample[:sampled] if vector_sample is not None else np.empty((0, dimensions or 0), dtype=np.float32)
+	kept_uuids = sample_uuids[:sampled] if sample_uuids is not None else []
+	labels = find_near_duplicates(vectors, threshold=duplicate_threshold, bits=lsh_bits, tables=lsh_tables, seed=seed)
+
+	duplicate_rows = []
+	clustered = np.flatnonzero(labels >= 0)
+	if len(clustered):
+		for leader, members in pd.Series(clustered).groupby(labels[clustered]):
+			members = members.to_numpy()
+			similarities = vectors[members] @ vectors[leader]
+			duplicate_rows.append({
+				"Leader uuid": kept_uuids[leader],
+				"Size": len(members),
+				"Min Similarity": round(float(similarities.min()), 4),
+				"Members": ", ".join(kept_uuids[index] for index in members[:20]) + (" ..." if len(members) > 20 else ""),
+			})
+	duplicates = pd.DataFrame(duplicate_rows, columns=["Leader uuid", "Size", "Min Similarity", "Members"])
+	duplicates = duplicates.sort_values("Size", ascending=False).reset_index(drop=True)
+
+	summary = {
+		"Vectors Read": total,
+		"Dimensions": dimensions,
+		"Wrong Dimensionality": counts["wrong dimensionality"],
+		"NaN/Inf Vectors": counts["NaN/Inf values"],
+		"Zero Vectors": counts["zero vector"],
+		"Duplicate Search Sample": sampled,
+		"Duplicate Clusters": len(duplicates),
+		"Vectors in Duplicate Clusters": int(duplicates["Size"].sum()) if not duplicates.empty else 0,
+	}
+	if norm_count:
+		mean = norm_sum / norm_count
+		p1, p50, p99 = np.percentile(norms, [1, 50, 99])
+		summary.update({
+			"Norm Mean": round(float(mean), 4),
+			"Norm Std": round(float(np.sqrt(max(norm_squares / norm_count - mean ** 2, 0.0))), 4),
+			"Norm Min": round(float(norm_min), 4),
+			"Norm p1": round(float(p1), 4),
+			"Norm p50": round(float(p50), 4),
+			"Norm p99": round(float(p99), 4),
+			"Norm Max": round(float(norm_max), 4),
+		})
+	return {"summary": summary, "norms": norms, "issues": pd.DataFrame(issues, columns=["uuid", "Issue", "Detail"]), "duplicates": duplicates}
+
+def norm_histogram(norms, bins=50):
+	if len(norms) == 0:
+		return pd.DataFrame()
+	counts, edges = np.histogram(norms, bins=bins)
+	return pd.DataFrame({"Norm": np.round((edges[:-1] + edges[1:]) / 2, 4), "Vectors": counts}).set_index("Norm")
@@ -37,63 +37,66 @@ def check_weaviate_server(url):
 		print(f"Server check failed: {e}")
 		return False
 
-def get_weaviate_client(cluster_endpoint=None, cluster_api_key=None, use_local=False):
-	print(f"Connecting to Weaviate at {cluster_endpoint}...")
-	global _client
-	if _client is None:
-		# Check if the server is reachable first
-		if not check_weaviate_server(cluster_endpoint):
-			raise Exception(f"Weaviate server at {cluster_endpoint} is not reachable. Please make sure it's running.")
-			
-		# Add retry logic
-		retry_count = 0
-		max_retries = 3
-		last_error = None
+def connect_weaviate_client(cluster_endpoint=None, cluster_api_key=None, use_local=False):
+	"""Open a new client connection (not the app-wide singleton), e.g. to a second cluster. The caller closes it."""
+	# Check if the server is reachable first
+	if not check_weaviate_server(cluster_endpoint):
+		raise Exception(f"Weaviate server at {cluster_endpoint} is not reachable. Please make sure it's running.")
 		
-		while retry_count < max_retries:
-			try:
-				# Use the appropriate connection function based on use_local flag
-				auth = weaviate.auth.AuthApiKey(cluster_api_key) if cluster_api_key else None
+	# Add retry logic
+	retry_count = 0
+	max_retries = 3
+	last_error = None
+	
+	while retry_count < max_retries:
+		try:
+			# Use the appropriate connection function based on use_local flag
+			auth = weaviate.auth.AuthApiKey(cluster_api_key) if cluster_api_key else None
+			
+			if use_local:
+				# Parse the URL for local connection
+				url_parts = urlparse(cluster_endpoint)
+				host = url_parts.netloc.split(":")[0] or "localhost"
+				port = url_parts.port or 8080
 				
-				if use_local:
-					# Parse the URL for local connection
-					url_parts = urlparse(cluster_endpoint)
-					host = url_parts.netloc.split(":")[0] or "localhost"
-					port = url_parts.port or 8080
-					
-					print(f"Connecting to local Weaviate at {host}:{port}")
-					_client = weaviate.connect_to_local(
-						host=host,
-						port=port,
-						auth_credentials=auth,
-						skip_init_checks=True,
-						additional_config=AdditionalConfig(
-							timeout=Timeout(init=90, query=900, insert=900)
-						)
+				print(f"Connecting to local Weaviate at {host}:{port}")
+				client = weaviate.connect_to_local(
+					host=host,
+					port=port,
+					auth_credentials=auth,
+					skip_init_checks=True,
+					additional_config=AdditionalConfig(
+						timeout=Timeout(init=90, query=900, insert=900)
 					)
-				else:
-					print(f"Connecting to WCS at {cluster_endpoint}")
-					_client = weaviate.connect_to_wcs(
-						cluster_url=cluster_endpoint,
-						auth_credentials=auth,
-						skip_init_checks=True, 
-						additional_config=AdditionalConfig(
-							timeout=Timeout(init=90, query=900, insert=900)
-						)
+				)
+			else:
+				print(f"Connecting to WCS at {cluster_endpoint}")
+				client = weaviate.connect_to_wcs(
+					cluster_url=cluster_endpoint,
+					auth_credentials=auth,
+					skip_init_checks=True, 
+					additional_config=AdditionalConfig(
+						timeout=Timeout(init=90, query=900, insert=900)
 					)
-				
-				print(f"Connected to {cluster_endpoint} successfully")
-				break
-			except Exception as e:
-				last_error = e
-				retry_count += 1
-				print(f"Connection attempt {retry_count} failed: {e}")
-				if retry_count < max_retries:
-					time.sleep(2)  # Wait before retrying
-		
-		if retry_count == max_retries:
-			print(f"Failed to connect after {max_retries} attempts")
-			raise last_error
+				)
+			
+			print(f"Connected to {cluster_endpoint} successfully")
+			return client
+		except Exception as e:
+			last_error = e
+			retry_count += 1
+			print(f"Connection attempt {retry_count} failed: {e}")
+			if retry_count < max_retries:
+				time.sleep(2)  # Wait before retrying
+	
+	print(f"Failed to connect after {max_retries} attempts")
+	raise last_error
+
+def get_weaviate_client(cluster_endpoint=None, cluster_api_key=None, use_local=False):
+	print(f"Connecting to Weaviate at {cluster_endpoint}...")
+	global _client
+	if _client is None:
+		_client = connect_weaviate_client(cluster_endpoint, cluster_api_key, use_local)
 			
 		# Register a cleanup function to close the client when the process exits
 		atexit.register(close_weaviate_client)
@@ -0,0 +1,123 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import pandas as pd
+from weaviate.classes.query import Sort
+
+def get_tenants_last_update(client, collection_name, tenant_names, sample_size=100, max_workers=8):
+    """
+    Latest last_update_time per tenant. Uses a sort on the update time and falls back to the max over a sample
+    of sample_size objects. Tenants that cannot be queried (e.g. not HOT) or have no objects map to None.
+    Returns (last_updates, errors) where errors maps the tenants whose queries failed to the error message.
+    """
+    collection = client.collections.get(collection_name)
+
+    def last_update(tenant_name):
+        tenant_collection = collection.with_tenant(tenant_name)
+        try:
+            result = tenant_collection.query.fetch_objects(
+                limit=1,
+                return_properties=[],
+                return_metadata=["last_update_time"],
+                sort=Sort.by_update_time(ascending=False)
+            )
+        except Exception:
+            try:
+                result = tenant_collection.query.fetch_objects(
+                    limit=sample_size,
+                    return_properties=[],
+                    return_metadata=["last_update_time"]
+                )
+            except Exception as e:
+                print(f"Error sampling last update time of tenant '{tenant_name}': {e}")
+                return tenant_name, None, str(e)
+        times = [obj.metadata.last_update_time for obj in result.objects if obj.metadata.last_update_time]
+        return tenant_name, max(times) if times else None, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(last_update, tenant_names))
+    last_updates = {tenant_name: updated for tenant_name, updated, _ in results}
+    errors = {tenant_name: error for tenant_name, _, error in results if error}
+    return last_updates, errors
+
+def plan_tenant_offload(shard_df, tenant_states, last_updates, tenant_bytes, target_bytes_per_node, min_idle_hours=24, now=None):
+    """
+    Propose the tenants to deactivate so that each node frees at least target_bytes_per_node.
+    shard_df is the shard_data frame of process_shards_data restricted to one MT collection (shard name = tenant name).
+    tenant_bytes maps each tenant to its estimated memory per replica (see utils.cluster.memory).
+    Only HOT (ACTIVE) tenants idle for at least min_idle_hours are candidates; tenants whose idle time is unknown
+    (failed query or no objects) are left out and counted per node. Picking the largest tenants first keeps
+    the number of deactivations small; a tenant picked for one node also frees memory on its other replicas.
+    Returns (plan_df, node_summary_df).
+    """
+    now = now or datetime.now(timezone.utc)
+    if shard_df.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    tenants = shard_df.groupby("Shard Name").agg(
+        objects=("Object Count", "max"),
+        nodes=("Node Name", lambda names: sorted(set(names)))
+    )
+
+    candidates = {}
+    unknown_by_node = {}
+    for tenant_name, row in tenants.iterrows():
+        if tenant_states.get(tenant_name) != "ACTIVE":
+            continue
+        last_update = last_updates.get(tenant_name)
+        if last_update is None:
+            for node in row["nodes"]:
+                unknown_by_node[node] = unknown_by_node.get(node, 0) + 1
+            continue
+        idle_hours = (now - last_update).total_seconds() / 3600
+        if idle_hours < min_idle_hours:
+            continue
+        candidates[tenant_name] = {
+            "objects": int(row["objects"] or 0),
+            "bytes": int(tenant_bytes.get(tenant_name, 0)),
+            "nodes": row["nodes"],
+            "idle_hours": idle_hours,
+        }
+
+    candidates_by_node = {}
+    for tenant_name, candidate in candidates.items():
+        for node in candidate["nodes"]:
+            candidates_by_node.setdefault(node, []).append(tenant_name)
+
+    selected = {}
+    node_summary = []
+    for node in sorted(shard_df["Node Name"].unique()):
+        node_candidates = candidates_by_node.get(node, [])
+        freed = sum(candidates[name]["bytes"] for name in node_candidates if name in selected)
+        # Largest first, the longest idle first on ties
+        ordered = sorted(
+            (name for name in node_candidates if name not in selected),
+            key=lambda name: (candidates[name]["bytes"], candidates[name]["idle_hours"]),
+            reverse=True
+        )
+        for tenant_name in ordered:
+            if freed >= target_bytes_per_node:
+                break
+            selected[tenant_name] = node
+            freed += candidates[tenant_name]["bytes"]
+        node_summary.append({
+            "Node Name": node,
+            "Candidate Tenants": len(node_candidates),
+            "Unknown Idle Tenants": unknown_by_node.get(node, 0),
+            "Candidate Memory (MB)": round(sum(candidates[name]["bytes"] for name in node_candidates) / 1024**2, 2),
+            "Target (MB)": round(target_bytes_per_node / 1024**2, 2),
+            "Planned Freed (MB)": round(freed / 1024**2, 2),
+            "Target Met": freed >= target_bytes_per_node,
+        })
+
+    plan = []
+    for tenant_name, node in selected.items():
+        candidate = candidates[tenant_name]
+        plan.append({
+            "Tenant": tenant_name,
+            "Picked For Node": node,
+            "Nodes": ", ".join(candidate["nodes"]),
+            "Object Count": candidate["objects"],
+            "Estimated Memory (MB)": round(candidate["bytes"] / 1024**2, 2),
+            "Idle (hours)": round(candidate["idle_hours"], 1),
+        })
+    return pd.DataFrame(plan), pd.DataFrame(node_summary)
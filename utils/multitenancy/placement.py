@@ -0,0 +1,49 @@
+import pandas as pd
+
+def build_tenant_placement(shard_df, tenant_states, node_names=None):
+    """
+    Join the shard data of one MT collection (process_shards_data, shard name = tenant name) with the
+    tenant states to get per-node tenant counts, object totals and HOT tenant counts.
+    node_names adds the nodes holding no tenant of the collection with zero totals, so that they count in the skew.
+    Skew is the max/mean ratio of the node totals (1.0 means perfectly even).
+    """
+    if shard_df.empty:
+        return {"node_df": pd.DataFrame(), "tenant_df": pd.DataFrame(), "skew": {}}
+
+    shards = shard_df[["Node Name", "Shard Name", "Object Count"]].copy()
+    shards["Object Count"] = pd.to_numeric(shards["Object Count"], errors="coerce").fillna(0).astype("int64")
+    shards["Activity Status"] = shards["Shard Name"].map(tenant_states).fillna("UNKNOWN")
+    shards["HOT"] = shards["Activity Status"] == "ACTIVE"
+
+    node_df = shards.groupby("Node Name").agg(
+        **{
+            "Tenants": ("Shard Name", "nunique"),
+            "HOT Tenants": ("HOT", "sum"),
+            "Objects": ("Object Count", "sum"),
+            "Largest Tenant (Objects)": ("Object Count", "max"),
+        }
+    )
+    if node_names:
+        node_df = node_df.reindex(sorted(set(node_df.index) | set(node_names)), fill_value=0)
+    node_df = node_df.rename_axis("Node Name").reset_index()
+
+    skew = {}
+    for column in ["Tenants", "HOT Tenants", "Objects"]:
+        mean = node_df[column].mean()
+        skew[column] = round(node_df[column].max() / mean, 2) if mean else 0.0
+        node_df[f"{column} vs Mean"] = (node_df[column] / mean).round(2) if mean else 0.0
+
+    tenant_df = shards.groupby("Shard Name").agg(
+        **{
+            "Activity Status": ("Activity Status", "first"),
+            "Objects": ("Object Count", "max"),
+            "Replicas": ("Node Name", "count"),
+            "Nodes": ("Node Name", lambda names: ", ".join(sorted(names))),
+        }
+    ).reset_index().rename(columns={"Shard Name": "Tenant"}).sort_values("Objects", ascending=False)
+
+    return {
+        "node_df": node_df.sort_values("Objects", ascending=False),
+        "tenant_df": tenant_df,
+        "skew": skew
+    }
@@ -1,18 +1,133 @@
-# Get tenant States
-def get_tenant_details(client, collection):
-    col = client.collections.get(collection)
-    tenants = col.tenants.get()
-    return tenants
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
+
+# Tenant temperatures mapped to the activity statuses used by the client
+TENANT_STATES = {
+    "HOT": TenantActivityStatus.ACTIVE,
+    "COLD": TenantActivityStatus.INACTIVE,
+    "FROZEN": TenantActivityStatus.OFFLOADED,
+}
+
+# Older servers report the HOT/COLD/FROZEN names over REST, normalize them to the client statuses
+TENANT_STATUS_ALIASES = {
+    "HOT": "ACTIVE",
+    "COLD": "INACTIVE",
+    "FROZEN": "OFFLOADED",
+    "FREEZING": "OFFLOADING",
+    "UNFREEZING": "ONLOADING",
+}
+
+def iter_tenants(cluster_url, api_key, collection, page_size=10000):
+    """
+    Stream the tenants of a collection as pages of (name, activity status) tuples.
+    Uses the cursor pagination (limit/after) of /v1/schema/{collection}/tenants. Servers without tenant
+    pagination return the full list in one response, which is then still handed out in page_size chunks
+    without building tenant objects. A server that ignores after and returns the same page again (e.g. exactly
+    page_size tenants) ends the stream instead of looping.
+    """
+    url = f"{cluster_url}/v1/schema/{collection}/tenants"
+    headers = {"Authorization": f"Bearer {api_key}"}
+    after = None
+    previous_first = None
+    while True:
+        params = {"limit": page_size}
+        if after:
+            params["after"] = after
+        response = requests.get(url, params=params, headers=headers)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching tenants: {response.status_code} - {response.text}")
+        page = [
+            (tenant["name"], TENANT_STATUS_ALIASES.get(tenant.get("activityStatus"), tenant.get("activityStatus")))
+            for tenant in response.json() or []
+        ]
+        if len(page) > page_size:
+            for i in range(0, len(page), page_size):
+                yield page[i:i + page_size]
+            return
+        if after is not None and page and (page[-1][0] == after or page[0][0] == previous_first):
+            return
+        if page:
+            previous_first = page[0][0]
+            yield page
+        if len(page) < page_size:
+            return
+        after = page[-1][0]
+
+# Yield (name, activity status) from a tenants dict (tenants.get()) or from an iterable of such tuples
+def tenant_rows(tenants):
+    if isinstance(tenants, dict):
+        for tenant_name, tenant in tenants.items():
+            yield tenant_name, tenant.activityStatusInternal.name
+    else:
+        yield from tenants
 
-def aggregate_tenant_states(tenants):
-    tenant_states = {}
-    for tenant_id, tenant in tenants.items():
-        state = tenant.activityStatusInternal.name
+# Count tenants per state, adding to tenant_states so that streamed pages can be accumulated one at a time
+def aggregate_tenant_states(tenants, tenant_states=None):
+    if tenant_states is None:
+        tenant_states = {}
+    for tenant_name, state in tenant_rows(tenants):
         if state not in tenant_states:
             tenant_states[state] = 0
         tenant_states[state] += 1
     return tenant_states
 
+# Pick tenant names whose internal activity status is one of the given states
+def select_tenant_names_by_state(tenants, states, limit=None):
+    states = set(states)
+    selected = []
+    for tenant_name, state in tenant_rows(tenants):
+        if state in states:
+            selected.append(tenant_name)
+            if limit and len(selected) >= limit:
+                break
+    return selected
+
+def update_tenants_activity_status(client, collection, tenant_names, target_state, chunk_size=100, max_workers=2, pause_seconds=0.5, progress_callback=None):
+    """
+    Move tenants to HOT, COLD or FROZEN in chunks, with at most max_workers update requests in flight.
+    Each worker sleeps pause_seconds after its chunk to throttle the schema changes going through Raft.
+    Returns one history row per chunk.
+    """
+    target_status = TENANT_STATES[target_state]
+    col = client.collections.get(collection)
+    chunks = [tenant_names[i:i + chunk_size] for i in range(0, len(tenant_names), chunk_size)]
+
+    def update_chunk(chunk):
+        start = time.time()
+        try:
+            col.tenants.update([Tenant(name=name, activity_status=target_status) for name in chunk])
+            success, message = True, f"Updated {len(chunk)} tenant(s) to {target_state}"
+        except Exception as e:
+            success, message = False, f"Error updating tenants: {e}"
+        duration = time.time() - start
+        if pause_seconds:
+            time.sleep(pause_seconds)
+        return {
+            "Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Collection": collection,
+            "Target State": target_state,
+            "Tenants": len(chunk),
+            "First Tenant": chunk[0],
+            "Last Tenant": chunk[-1],
+            "Success": success,
+            "Message": message,
+            "Duration (s)": round(duration, 2),
+        }
+
+    history = []
+    done = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(update_chunk, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            history.append(future.result())
+            done += len(futures[future])
+            if progress_callback:
+                progress_callback(done, len(tenant_names))
+    return history
+
 # Get multi-tenancy collections only
 def get_multitenancy_collections(schema):
     enabled_collections = []
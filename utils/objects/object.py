@@ -1,108 +1,162 @@
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import pandas as pd
 import requests
+from weaviate.classes.query import Filter, MetadataQuery
+from utils.cluster.collection import fetch_all_collection_configs
+from utils.multitenancy.tenantdetails import iter_tenants
 
-# Get object in Non Multitenant collection
-def get_object_in_collection(client, collection_name, uuid):
-	collection = client.collections.get(collection_name)
-	data_object = collection.query.fetch_object_by_id(uuid, include_vector=True)
-
-	if data_object is None:
-		print(f"Object with UUID '{uuid}' not found.")
-		return None
-
-	return data_object
-
-# Get object in Multitenant collection
-def get_object_in_tenant(client, collection_name, uuid, tenant):
-	collection = client.collections.get(collection_name).with_tenant(tenant)
-	data_object = collection.query.fetch_object_by_id(uuid, include_vector=True)
-
-	if data_object is None:
-		print(f"Object with UUID '{uuid}' not found.")
-		return None
-
-	return data_object
-
-def display_object_as_table(data_object):
-	if data_object is None:
-		print("No data to display.")
-		return
+# Default QUERY_MAXIMUM_RESULTS of the server
+MAX_IDS_PER_QUERY = 10000
+# UUIDs checked on every node at once (one request per UUID and node)
+MAX_NODE_CHECK_UUIDS = 100
 
-	metadata_fields = {
-		"Creation Time": data_object.metadata.creation_time,
-		"Last Update Time": data_object.metadata.last_update_time,
-	}
-
-	additional_data = {
+def object_row(data_object):
+	row = {
 		"UUID": str(data_object.uuid),
 		"Collection": data_object.collection,
-		"Vectors": data_object.vector
+		"Vectors": data_object.vector,
+		"Creation Time": data_object.metadata.creation_time,
+		"Last Update Time": data_object.metadata.last_update_time,
 	}
 
-	additional_data.update(metadata_fields)
-
 	if data_object.properties:
 		for key, value in data_object.properties.items():
-			additional_data[key] = value
+			row[key] = value
 
-	df = pd.DataFrame([additional_data])
+	return row
 
-	return df
-
-def find_object_in_collection_on_nodes(client_endpoint, api_key, collection_name, object_uuid):
-
-	node_names = [
-		"weaviate-0", "weaviate-1", "weaviate-2", "weaviate-3",
-		"weaviate-4", "weaviate-5", "weaviate-6", "weaviate-7",
-		"weaviate-8", "weaviate-9", "weaviate-10", "weaviate-11"
-	]
+# Split pasted UUIDs on commas, whitespace and new lines, keeping the order and dropping repeats
+def parse_uuid_list(text):
+	return list(dict.fromkeys(str(uuid.UUID(value)) for value in re.split(r"[\s,;]+", text) if value))
 
+def get_objects_by_ids(client, collection_name, uuids, tenant=None, include_vector=False):
+	"""
+	Fetch many objects in one filtered query (id contains any of the UUIDs), vectors optional.
+	Lists above the server query limit are fetched in chunks of MAX_IDS_PER_QUERY.
+	Returns (DataFrame with one row per object found, UUIDs not found).
+	"""
+	collection = client.collections.get(collection_name)
+	if tenant:
+		collection = collection.with_tenant(tenant)
+
+	rows = []
+	for i in range(0, len(uuids), MAX_IDS_PER_QUERY):
+		chunk = uuids[i:i + MAX_IDS_PER_QUERY]
+		response = collection.query.fetch_objects(
+			filters=Filter.by_id().contains_any(chunk),
+			limit=len(chunk),
+			include_vector=include_vector,
+			return_metadata=MetadataQuery(creation_time=True, last_update_time=True)
+		)
+		rows.extend(object_row(data_object) for data_object in response.objects)
+
+	df = pd.DataFrame(rows)
+	if not include_vector and not df.empty:
+		df = df.drop(columns=["Vectors"])
+	found = set(df["UUID"]) if not df.empty else set()
+	return df, [object_uuid for object_uuid in uuids if object_uuid not in found]
+
+# Names of the nodes of the cluster
+def get_node_names(client):
+	return [node.name for node in client.cluster.nodes()]
+
+def check_object_on_node(client_endpoint, headers, collection_name, object_uuid, node, tenant=None):
+	url = f"{client_endpoint}/v1/objects/{collection_name}/{object_uuid}"
+	params = {"node_name": node}
+	if tenant:
+		params["tenant"] = tenant
+
+	response = requests.get(url, params=params, headers=headers)
+
+	if response.status_code == 200:
+		return "✔" # Found
+	elif response.status_code == 404:
+		return "✖" # Not Found
+	return f"Error {response.status_code}" # Error
+
+def check_objects_on_nodes(client_endpoint, api_key, collection_name, object_uuids, node_names, tenant=None, max_workers=16):
+	# One request per UUID and node, all sent through one pool; one row per UUID
 	headers = {"Authorization": f"Bearer {api_key}"}
-	results = {}
+	pairs = [(object_uuid, node) for object_uuid in object_uuids for node in node_names]
+	with ThreadPoolExecutor(max_workers=max(min(len(pairs), max_workers), 1)) as executor:
+		statuses = list(executor.map(lambda pair: check_object_on_node(client_endpoint, headers, collection_name, pair[0], pair[1], tenant), pairs))
 
-	for node in node_names:
-		url = f"{client_endpoint}/v1/objects/{collection_name}/{object_uuid}"
-		params_single = {"node_name": node}
-
-		resp_single = requests.get(url, params=params_single, headers=headers)
-
-		if resp_single.status_code == 200:
-			results[node] = "✔" # Found
-		elif resp_single.status_code == 404:
-			results[node] = "✖" # Not Found
-		elif resp_single.status_code == 500:
-			results[node] = "N/A" # Not applicable as the node does not exist
-		else:
-			results[node] = f"Error {resp_single.status_code}" # Error
+	results = {object_uuid: {} for object_uuid in object_uuids}
+	for (object_uuid, node), status in zip(pairs, statuses):
+		results[object_uuid][node] = status
 
-	df = pd.DataFrame([results], index=[object_uuid])
+	df = pd.DataFrame.from_dict(results, orient="index", columns=node_names)
 	return df
 
-def find_object_in_tenant_on_nodes(client_endpoint, api_key, collection_name, object_uuid, tenant):
+def find_object_in_collection_on_nodes(client_endpoint, api_key, collection_name, object_uuid, node_names):
+	return check_objects_on_nodes(client_endpoint, api_key, collection_name, [object_uuid], node_names)
 
-	node_names = [
-		"weaviate-0", "weaviate-1", "weaviate-2", "weaviate-3",
-		"weaviate-4", "weaviate-5", "weaviate-6", "weaviate-7",
-		"weaviate-8", "weaviate-9", "weaviate-10", "weaviate-11"
-	]
+def find_object_in_tenant_on_nodes(client_endpoint, api_key, collection_name, object_uuid, tenant, node_names):
+	return check_objects_on_nodes(client_endpoint, api_key, collection_name, [object_uuid], node_names, tenant)
 
-	headers = {"Authorization": f"Bearer {api_key}"}
-	results = {}
-
-	for node in node_names:
-		url = f"{client_endpoint}/v1/objects/{collection_name}/{object_uuid}"
-		params_single = {"node_name": node, "tenant": tenant}
-
-		resp_single = requests.get(url, params=params_single, headers=headers)
-
-		if resp_single.status_code == 200:
-			results[node] = "✔" # Found
-		elif resp_single.status_code == 404:
-			results[node] = "✖" # Not Found
-		elif resp_single.status_code == 500:
-			results[node] = "N/A" # Not applicable as the node does not exist
+# (collection, tenant, activity status) of every collection and of every tenant of multi-tenant collections, streamed
+def iter_object_locations(cluster_url, api_key, configs):
+	for collection_name, config in sorted(configs.items()):
+		if config.get("multiTenancyConfig", {}).get("enabled"):
+			for page in iter_tenants(cluster_url, api_key, collection_name):
+				for tenant_name, status in page:
+					yield collection_name, tenant_name, status
 		else:
-			results[node] = f"Error {resp_single.status_code}" # Error
-
-	df = pd.DataFrame([results], index=[object_uuid])
-	return df
+			yield collection_name, None, "ACTIVE"
+
+def locate_object(client, cluster_url, api_key, object_uuid, max_workers=16):
+	"""
+	Find the collection (and tenant) holding a UUID with existence checks across all collections and all active
+	tenants, at most max_workers in flight. Tenants are streamed page by page and checks are submitted in a bounded
+	window, so the search stops at the first hit without listing every tenant first. Inactive tenants are skipped.
+	Returns {Collection, Tenant, Checked, Skipped, Errors, Seconds} (Collection is None when not found).
+	"""
+	object_uuid = str(uuid.UUID(object_uuid.strip()))
+	started = time.time()
+	configs = fetch_all_collection_configs(cluster_url, api_key)
+	if "error" in configs:
+		return configs
+
+	def exists(collection_name, tenant_name):
+		collection = client.collections.get(collection_name)
+		if tenant_name:
+			collection = collection.with_tenant(tenant_name)
+		return collection.data.exists(object_uuid)
+
+	result = {"Collection": None, "Tenant": None, "Checked": 0, "Skipped": 0, "Errors": 0}
+	locations = iter_object_locations(cluster_url, api_key, configs)
+	pending = {}
+	exhausted = False
+	with ThreadPoolExecutor(max_workers=max_workers) as executor:
+		while result["Collection"] is None:
+			while not exhausted and len(pending) < max_workers * 2:
+				location = next(locations, None)
+				if location is None:
+					exhausted = True
+					break
+				collection_name, tenant_name, status = location
+				if status != "ACTIVE":
+					result["Skipped"] += 1
+					continue
+				pending[executor.submit(exists, collection_name, tenant_name)] = (collection_name, tenant_name)
+			if not pending:
+				break
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				collection_name, tenant_name = pending.pop(future)
+				result["Checked"] += 1
+				try:
+					if future.result() and result["Collection"] is None:
+						result["Collection"], result["Tenant"] = collection_name, tenant_name
+				except Exception as e:
+					result["Errors"] += 1
+					print(f"Error checking {object_uuid} in {collection_name} {tenant_name or ''}: {e}")
+		# Drop the queued checks once found, only the running ones finish
+		for future in pending:
+			future.cancel()
+
+	result["Seconds"] = round(time.time() - started, 2)
+	return result
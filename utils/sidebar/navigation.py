@@ -8,4 +8,8 @@ def navigate():
 	st.sidebar.page_link("pages/multitenancy.py", label="Multi Tenancy", icon="📒")
 	st.sidebar.page_link("pages/data.py", label="Data", icon="📁")
 	st.sidebar.page_link("pages/delete.py", label="Delete", icon="🗑️")
+	st.sidebar.page_link("pages/delete_filter.py", label="Delete by Filter", icon="🧹")
+	st.sidebar.page_link("pages/reindex.py", label="Reindex", icon="🔁")
+	st.sidebar.page_link("pages/trends.py", label="Trends", icon="📈")
+	st.sidebar.page_link("pages/benchmark.py", label="Benchmark", icon="⏱️")
 	st.sidebar.markdown("---")